@@ -16,7 +16,8 @@ if __name__ == "__main__":
 
 """
 # app.py
-from view.streamlit_ui import main as streamlit_main
+# The Streamlit UI (and with it pandas and matplotlib) is only imported when the
+# app is launched; for quick solving from a terminal use controller/sudoku_cli.py
 from model.sudoku_generator import generate_puzzle
 from view.ui import print_board
 
@@ -28,6 +29,7 @@ def run_console_version():
 
 if __name__ == "__main__":
     # Launch Streamlit UI
+    from view.streamlit_ui import main as streamlit_main
     streamlit_main()
 
 
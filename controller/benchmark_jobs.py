@@ -0,0 +1,81 @@
+# controller/benchmark_jobs.py
+# Benchmark runs that execute in the background for interactive front ends.
+# A job solves its puzzles through solve_many (one process per core) on a
+# runner thread and exposes results as they finish, so a page can show
+# progress and partial numbers while staying responsive.
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from model.parallel_solver import solve_many
+
+
+# Min/avg/max time and average nodes over a list of SolveResults.
+# Solves cut off by the per-puzzle timeout count their time up to the cutoff.
+def summarize(results):
+    times = [r.elapsed for r in results]
+    if not times:
+        return None
+    return {
+        "Runs": len(times),
+        "Solved": sum(1 for r in results if r.solution),
+        "Timeouts": sum(1 for r in results if r.exceeded),
+        "Average Time": round(sum(times) / len(times), 4),
+        "Min Time": round(min(times), 4),
+        "Max Time": round(max(times), 4),
+        "Average Nodes": round(sum(r.stats.nodes for r in results) / len(results)),
+    }
+
+
+class BenchmarkJob:
+    def __init__(self, method, puzzles, workers=None, timeout=None):
+        self.method = method
+        self.puzzles = puzzles
+        self.workers = workers
+        self.timeout = timeout
+        self.total = len(puzzles)
+        # SolveResults in completion order; only the runner thread appends
+        self.results = []
+        self.error = None
+        self.done = threading.Event()
+
+    def run(self):
+        try:
+            for result in solve_many(self.puzzles, self.method, workers=self.workers,
+                                     ordered=False, with_stats=True, timeout=self.timeout):
+                self.results.append(result)
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done.set()
+
+    # Fraction of puzzles solved so far
+    def progress(self):
+        return len(self.results) / self.total if self.total else 1.0
+
+    # Summary of whatever has finished so far
+    def summary(self):
+        return summarize(list(self.results))
+
+
+# Queue of benchmark jobs keyed by the caller (e.g. (corpus, method)).
+# Jobs run one at a time so each gets every core; submitting a key that is
+# already queued, running or finished returns the existing job.
+# timeout (seconds) bounds every single solve.
+class BenchmarkRunner:
+    def __init__(self, workers=None, timeout=None):
+        self.workers = workers
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="benchmark")
+        self.jobs = {}
+        self.lock = threading.Lock()
+
+    def submit(self, key, method, puzzles):
+        with self.lock:
+            job = self.jobs.get(key)
+            if job is None:
+                job = self.jobs[key] = BenchmarkJob(method, puzzles, self.workers, self.timeout)
+                self.executor.submit(job.run)
+            return job
+
+    def get(self, key):
+        return self.jobs.get(key)
+
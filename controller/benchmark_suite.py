@@ -0,0 +1,250 @@
+# controller/benchmark_suite.py
+# Reproducible benchmarks over the fixed, versioned corpora in data/corpora.
+# Each method is timed on every puzzle after warmup runs, best-of-N over
+# repetitions, and summarized as p50/p90/p99/max plus node counts.
+# Results can be saved as a baseline; later runs exit non-zero when they
+# regress past a threshold.
+import sys
+import os
+import json
+import math
+import argparse
+import subprocess
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from model.backtracking_solver import solve_with_heuristics
+from model.search_stats import SearchStats
+from model.search_budget import SearchBudget
+from model.strategies import strategy_names
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..')
+CORPORA_DIR = os.path.join(ROOT_DIR, 'data', 'corpora')
+OUTPUT_DIR = os.path.join(ROOT_DIR, 'output')
+DEFAULT_BASELINE = os.path.join(OUTPUT_DIR, 'benchmark_baseline.json')
+
+CORPORA = {
+    "easy": "easy-v1.txt",
+    "generated40": "generated40-v1.txt",
+    "hard17": "hard17-v1.txt",
+}
+
+# Wall-clock limit for one `sudoku_cli.py solve` call, interpreter start included,
+# and modules that must not be imported on that path
+STARTUP_BUDGET = 0.25
+HEAVY_MODULES = ("matplotlib", "pandas", "numpy", "streamlit")
+CLI = os.path.join(ROOT_DIR, 'controller', 'sudoku_cli.py')
+
+# Every registered strategy that solves in this process, so timings compare like with like
+DEFAULT_METHODS = strategy_names(pooled=False)
+
+
+# Read a corpus file: one 81-char puzzle per line, '#' lines are comments
+def load_corpus(name):
+    path = os.path.join(CORPORA_DIR, CORPORA[name])
+    puzzles = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            digits = [0 if ch == "." else int(ch) for ch in line]
+            puzzles.append([digits[r * 9:(r + 1) * 9] for r in range(9)])
+    return puzzles
+
+
+# Solve once, returning (elapsed, stats), or (None, None) past `timeout` seconds
+def timed_solve(puzzle, method, timeout=None):
+    stats = SearchStats()
+    budget = SearchBudget(timeout=timeout) if timeout else None
+    elapsed, _ = solve_with_heuristics(puzzle, method=method, stats=stats, budget=budget)
+    if budget is not None and budget.exceeded:
+        return None, None
+    return elapsed, stats
+
+
+# Median wall time of solving one puzzle through the fast-start CLI in a fresh
+# interpreter, and which heavy modules it imported (from python -X importtime)
+def measure_startup(puzzle, runs=5):
+    line = "".join(str(v) for row in puzzle for v in row)
+    command = [sys.executable, "-X", "importtime", CLI, "solve", line]
+    times = []
+    heavy = set()
+    for _ in range(runs):
+        started = time.perf_counter()
+        done = subprocess.run(command, capture_output=True, text=True, check=True)
+        times.append(time.perf_counter() - started)
+        for entry in done.stderr.splitlines():
+            name = entry.rsplit("|", 1)[-1].strip()
+            if name.split(".")[0] in HEAVY_MODULES:
+                heavy.add(name.split(".")[0])
+    return sorted(times)[len(times) // 2], sorted(heavy)
+
+
+# Fail when the CLI starts slower than `budget` seconds or pulls in heavy modules
+def check_startup(budget=STARTUP_BUDGET, runs=5):
+    median, heavy = measure_startup(load_corpus("easy")[0], runs)
+    print(f"🚀 CLI solve (fresh interpreter): median {format_time(median)} ms over {runs} runs, "
+          f"budget {format_time(budget)} ms")
+    if heavy:
+        print(f"❌ Heavy modules imported at startup: {', '.join(heavy)}")
+    if median > budget:
+        print("❌ Startup is over budget.")
+    if heavy or median > budget:
+        return 1
+    print("✅ Startup within budget.")
+    return 0
+
+
+# Nearest-rank percentile of an ascending list
+def percentile(values, p):
+    if not values:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(values)))
+    return values[rank - 1]
+
+
+# Time one method on one corpus and summarize the per-puzzle best times
+def run_corpus(method, puzzles, warmup=1, repeat=3, timeout=None):
+    for puzzle in puzzles[:warmup]:
+        timed_solve(puzzle, method, timeout)
+
+    times = []
+    nodes = []
+    timeouts = 0
+    for puzzle in puzzles:
+        # A puzzle that times out in any repetition counts as a timeout
+        best = None
+        for _ in range(repeat):
+            elapsed, stats = timed_solve(puzzle, method, timeout)
+            if elapsed is None:
+                best = None
+                break
+            best = elapsed if best is None else min(best, elapsed)
+        if best is None:
+            timeouts += 1
+            continue
+        times.append(best)
+        nodes.append(stats.nodes)
+
+    times.sort()
+    nodes.sort()
+    return {
+        "puzzles": len(puzzles),
+        "timeouts": timeouts,
+        "p50": percentile(times, 50),
+        "p90": percentile(times, 90),
+        "p99": percentile(times, 99),
+        "max": times[-1] if times else None,
+        "mean_nodes": sum(nodes) / len(nodes) if nodes else None,
+        "max_nodes": nodes[-1] if nodes else None,
+    }
+
+
+def run_suite(methods, corpora, warmup=1, repeat=3, timeout=None):
+    results = {}
+    for corpus in corpora:
+        puzzles = load_corpus(corpus)
+        for method in methods:
+            print(f"🔍 {corpus} / {method}")
+            results.setdefault(corpus, {})[method] = run_corpus(method, puzzles, warmup, repeat, timeout)
+    return results
+
+
+def format_time(seconds):
+    return "timeout" if seconds is None else f"{seconds * 1000:.2f}"
+
+
+def print_report(results):
+    print("\n📈 Benchmark Suite (times in ms)")
+    print("-" * 104)
+    print(f"{'Corpus':12} {'Technique':36} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9} {'Nodes':>10} {'T/O':>5}")
+    print("-" * 104)
+    for corpus, by_method in results.items():
+        for method, row in by_method.items():
+            nodes = "-" if row["mean_nodes"] is None else f"{row['mean_nodes']:.0f}"
+            print(f"{corpus:12} {method:36} {format_time(row['p50']):>9} {format_time(row['p90']):>9} "
+                  f"{format_time(row['p99']):>9} {format_time(row['max']):>9} {nodes:>10} {row['timeouts']:>5}")
+    print("-" * 104)
+
+
+# List (corpus, method, metric, old, new) for every metric that got worse.
+# Times compare p50 and p90 against the threshold; node counts are deterministic,
+# so any increase in mean_nodes is a regression.
+def find_regressions(results, baseline, threshold=0.10):
+    regressions = []
+    for corpus, by_method in results.items():
+        for method, row in by_method.items():
+            old = baseline.get(corpus, {}).get(method)
+            if old is None:
+                continue
+            if row["timeouts"] > old["timeouts"]:
+                regressions.append((corpus, method, "timeouts", old["timeouts"], row["timeouts"]))
+            for metric in ("p50", "p90"):
+                if old[metric] and row[metric] and row[metric] > old[metric] * (1 + threshold):
+                    regressions.append((corpus, method, metric, old[metric], row[metric]))
+            old_nodes, new_nodes = old["mean_nodes"], row["mean_nodes"]
+            if old_nodes is not None and new_nodes is not None and new_nodes > old_nodes:
+                regressions.append((corpus, method, "mean_nodes", old_nodes, new_nodes))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reproducible Sudoku solver benchmark suite")
+    parser.add_argument("--corpus", action="append", choices=sorted(CORPORA),
+                        help="corpus to run (repeatable, default: all)")
+    parser.add_argument("--method", action="append", help="technique to run (repeatable, default: all)")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed puzzles solved first")
+    parser.add_argument("--repeat", type=int, default=3, help="timed solves per puzzle (best is kept)")
+    parser.add_argument("--timeout", type=float, default=None, help="per-solve timeout in seconds")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed relative slowdown before failing (default 0.10)")
+    parser.add_argument("--startup", action="store_true",
+                        help="only check the fast-start CLI against the startup budget")
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET,
+                        help=f"startup budget in seconds (default {STARTUP_BUDGET})")
+    args = parser.parse_args(argv)
+
+    if args.startup:
+        return check_startup(args.startup_budget)
+
+    started = time.perf_counter()
+    results = run_suite(args.method or DEFAULT_METHODS, args.corpus or list(CORPORA),
+                        args.warmup, args.repeat, args.timeout)
+    print_report(results)
+    if "Portfolio" in (args.method or DEFAULT_METHODS):
+        # Imported here: the portfolio keeps a process pool alive
+        from model.portfolio_solver import shared_portfolio
+        wins = ", ".join(f"{method} {count}" for method, count in shared_portfolio().wins.most_common())
+        print(f"🏁 Portfolio winners: {wins}")
+    print(f"🕒 Finished in {time.perf_counter() - started:.1f} sec")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    with open(os.path.join(OUTPUT_DIR, "benchmark_suite.json"), "w") as f:
+        json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"📁 Baseline saved to: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("ℹ️  No baseline found; run with --save-baseline to create one.")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = find_regressions(results, baseline, args.threshold)
+    for corpus, method, metric, old, new in regressions:
+        print(f"❌ {corpus} / {method}: {metric} {old:.6g} -> {new:.6g}")
+    if regressions:
+        return 1
+    print("✅ No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
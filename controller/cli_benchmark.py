@@ -1,39 +1,45 @@
 import sys
 import os
 import csv
-import matplotlib.pyplot as plt
+import argparse
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from model.sudoku_generator import generate_puzzle
-from model.backtracking_solver import solve_with_heuristics
+from model.sudoku_generator import generate_puzzle, default_holes
+from model.backtracking_solver import solve_with_heuristics, solve_and_time
+from model.parallel_solver import solve_many
+from model.strategies import strategy_names
 
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'output')
-os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-def benchmark_cli(methods, n=10):
-    print(f"\n📊 Running Benchmark for {n} runs on each method:\n")
+def benchmark_cli(methods, n=10, workers=None, box=3):
+    size = box * box
+    print(f"\n📊 Running Benchmark for {n} runs on each method ({size}x{size}):\n")
     results = {}
+    nodes = {}
 
     for method in methods:
         total_time = 0
+        total_nodes = 0
         print(f"🔍 {method}")
-        for i in range(n):
-            puzzle = generate_puzzle()
-            elapsed, _ = solve_with_heuristics(puzzle, method=method)
-            print(f"  Run {i+1}: {elapsed:.4f} sec")
-            total_time += elapsed
+        puzzles = (generate_puzzle(default_holes(box), box=box) for _ in range(n))
+        for result in solve_many(puzzles, method, workers=workers, with_stats=True):
+            print(f"  Run {result.index+1}: {result.elapsed:.4f} sec, {result.stats.nodes} nodes")
+            total_time += result.elapsed
+            total_nodes += result.stats.nodes
         avg = total_time / n
         results[method] = avg
-        print(f"  👉 Average: {avg:.4f} sec\n")
+        nodes[method] = total_nodes / n
+        print(f"  👉 Average: {avg:.4f} sec, {nodes[method]:.0f} nodes\n")
 
     # Save to CSV
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
     csv_path = os.path.join(OUTPUT_DIR, "benchmark_results.csv")
     with open(csv_path, mode='w', newline='') as file:
         writer = csv.writer(file)
-        writer.writerow(["Technique", "Average Time (s)"])
+        writer.writerow(["Technique", "Average Time (s)", "Average Nodes"])
         for method, avg_time in results.items():
-            writer.writerow([method, round(avg_time, 4)])
+            writer.writerow([method, round(avg_time, 4), round(nodes[method])])
     print(f"📁 Results saved to: {csv_path}")
 
     # Plot results
@@ -48,12 +54,62 @@ def benchmark_cli(methods, n=10):
 
     # Display Table
     print("\n📈 Final Comparison Table:")
-    print("-" * 50)
-    print(f"{'Technique':40} {'Avg Time (s)':>10}")
-    print("-" * 50)
+    print("-" * 64)
+    print(f"{'Technique':40} {'Avg Time (s)':>10} {'Avg Nodes':>12}")
+    print("-" * 64)
     for method, avg_time in results.items():
-        print(f"{method:40} {avg_time:>10.4f}")
-    print("-" * 50)
+        print(f"{method:40} {avg_time:>10.4f} {nodes[method]:>12.0f}")
+    print("-" * 64)
+
+# Compare the list-scanning reference solver with the bitmask core on identical puzzles
+def benchmark_core(n=10, removed_cells=55):
+    print(f"\n⚙️  Comparing solving cores over {n} puzzles ({removed_cells} holes):\n")
+    scan_total = 0
+    mask_total = 0
+    for i in range(n):
+        puzzle = generate_puzzle(removed_cells)
+        scan_time = solve_and_time(puzzle)
+        mask_time, _ = solve_with_heuristics(puzzle, method="Backtracking")
+        print(f"  Run {i+1}: scan {scan_time:.4f} sec | bitmask {mask_time:.4f} sec")
+        scan_total += scan_time
+        mask_total += mask_time
+    print(f"\n  👉 Row/col/box scans: {scan_total / n:.4f} sec")
+    print(f"  👉 Bitmask core:      {mask_total / n:.4f} sec")
+    if mask_total > 0:
+        print(f"  🚀 Speedup: {scan_total / mask_total:.2f}x")
+
+# Average time of each method as the board grows from 4x4 to (box_max²)x(box_max²)
+def benchmark_scaling(methods, n=5, workers=None, box_max=4):
+    boxes = list(range(2, box_max + 1))
+    print(f"\n📐 Scaling benchmark, {n} puzzles per board size:\n")
+    times = {method: {} for method in methods}
+    for box in boxes:
+        size = box * box
+        puzzles = [generate_puzzle(default_holes(box), box=box) for _ in range(n)]
+        print(f"🔍 {size}x{size} ({default_holes(box)} holes)")
+        for method in methods:
+            total = sum(result.elapsed for result in solve_many(puzzles, method, workers=workers))
+            times[method][box] = total / n
+            print(f"  {method:40} {times[method][box]:.4f} sec")
+        print()
+
+    print("📈 Average Time (s) by Board Size:")
+    header = "".join(f"{f'{b * b}x{b * b}':>10}" for b in boxes)
+    print("-" * (40 + 10 * len(boxes)))
+    print(f"{'Technique':40}{header}")
+    print("-" * (40 + 10 * len(boxes)))
+    for method in methods:
+        print(f"{method:40}" + "".join(f"{times[method][b]:>10.4f}" for b in boxes))
+    print("-" * (40 + 10 * len(boxes)))
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    csv_path = os.path.join(OUTPUT_DIR, "benchmark_scaling.csv")
+    with open(csv_path, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["Technique"] + [f"{b * b}x{b * b}" for b in boxes])
+        for method in methods:
+            writer.writerow([method] + [round(times[method][b], 4) for b in boxes])
+    print(f"📁 Results saved to: {csv_path}")
 
 def write_markdown_summary(results, md_path):
     with open(md_path, 'w') as f:
@@ -72,7 +128,10 @@ def write_markdown_summary(results, md_path):
         f.write("🕒 Each average time is based on 10 randomly generated puzzles.\n")
 
 
+# matplotlib is imported here so runs that never plot start quickly
 def plot_results(results, plot_path):
+    import matplotlib.pyplot as plt
+
     methods = list(results.keys())
     times = list(results.values())
 
@@ -89,12 +148,23 @@ def plot_results(results, plot_path):
     plt.close()
 
 if __name__ == "__main__":
-    heuristic_methods = [
-        "Backtracking",
-        "Backtracking + Forward Checking",
-        "Backtracking + Arc Consistency",
-        "Backtracking + MRV",
-        "Backtracking + MRV + LCV + Degree"
-    ]
+    parser = argparse.ArgumentParser(description="Benchmark Sudoku solving strategies")
+    parser.add_argument("--core", action="store_true",
+                        help="compare the list-scanning solver with the bitmask core")
+    parser.add_argument("-n", type=int, default=10, help="runs per method")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="solver processes (default: one per core)")
+    parser.add_argument("--box", type=int, default=3,
+                        help="box size: 2 for 4x4, 3 for 9x9, 4 for 16x16, 5 for 25x25")
+    parser.add_argument("--scaling", action="store_true",
+                        help="compare methods across board sizes 4x4 up to --box")
+    args = parser.parse_args()
+
+    heuristic_methods = strategy_names()
     
-    benchmark_cli(heuristic_methods)
+    if args.core:
+        benchmark_core(args.n)
+    elif args.scaling:
+        benchmark_scaling(heuristic_methods, args.n, args.workers, max(args.box, 2))
+    else:
+        benchmark_cli(heuristic_methods, args.n, args.workers, args.box)
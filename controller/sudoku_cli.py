@@ -0,0 +1,233 @@
+# controller/sudoku_cli.py
+# Fast-start command line for solving and generating single puzzles. Only the
+# solver core is imported (no matplotlib, pandas, numpy or streamlit) and
+# everything runs in-process, so a call costs little more than the interpreter
+# itself. benchmark_suite.py --startup keeps that within STARTUP_BUDGET.
+#
+#   python controller/sudoku_cli.py solve 53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79
+#   python controller/sudoku_cli.py solve puzzles.txt --method "Backtracking + MRV" --pretty
+#   python controller/sudoku_cli.py solve hard.txt --method Backtracking --checkpoint hard.ckpt
+#   python controller/sudoku_cli.py solve puzzles.txt --cache-db output/solutions.db
+#   python controller/sudoku_cli.py solve puzzles.txt --no-cache -v    (time the solver itself)
+#   python controller/sudoku_cli.py generate --count 10 --unique --seed 1 > puzzles.txt
+#   python controller/sudoku_cli.py generate --count 500 --difficulty expert --workers 8 > expert.txt
+#   python controller/sudoku_cli.py fill --count 100000 --difficulty hard --workers 8
+#   python controller/sudoku_cli.py generate --bank --difficulty hard
+import sys
+import os
+import argparse
+import random
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from model.board import Board
+from model.backtracking_solver import solve_with_heuristics
+from model.sudoku_generator import generate_puzzle, default_holes, generate_graded_many, DIFFICULTIES
+from model.puzzle_bank import PuzzleBank, fill_bank, bank_path
+from model.search_budget import SearchBudget, BudgetExceeded
+from model.solution_cache import SolutionCache
+from model.iterative_solver import IterativeSearch
+from utils.puzzle_io import read_puzzles, format_line
+from view.ui import print_board
+
+DEFAULT_METHOD = "Dancing Links (Algorithm X)"
+
+
+# A puzzle given on the command line is either a one-line puzzle, a file or '-'
+def puzzles_from(arg):
+    if arg != "-" and not os.path.exists(arg):
+        return [Board.from_string(arg)]
+    return read_puzzles(arg)
+
+
+def show(board, pretty):
+    if pretty:
+        print_board(board)
+        print()
+    else:
+        print(format_line(board))
+
+
+def solve_command(args):
+    if args.checkpoint:
+        return checkpointed_solve(args)
+    solved = total = 0
+    started = time.perf_counter()
+    # Repeats, relabeled or permuted ones included, are answered from the cache
+    cache = None if args.no_cache else SolutionCache(path=args.cache_db)
+    solve = solve_with_heuristics if cache is None else cache.solve
+    for puzzle in puzzles_from(args.puzzle):
+        total += 1
+        budget = None
+        if args.timeout is not None or args.max_nodes is not None:
+            budget = SearchBudget(timeout=args.timeout, max_nodes=args.max_nodes)
+        _, solution = solve(puzzle, method=args.method, budget=budget)
+        if solution:
+            solved += 1
+            show(solution, args.pretty)
+        else:
+            # Echo the puzzle so the output stays line-aligned with the input
+            show(puzzle, args.pretty)
+            reason = budget.exceeded if budget is not None and budget.exceeded else "no solution"
+            print(f"❌ Puzzle {total}: {reason}", file=sys.stderr)
+    if args.verbose:
+        print(f"✅ Solved {solved}/{total} in {time.perf_counter() - started:.4f} sec", file=sys.stderr)
+        if cache is not None:
+            print(f"🗄️  Cache: {cache.hits} hits ({cache.canonical_hits} canonical, {cache.disk_hits} from disk), "
+                  f"{cache.misses} misses", file=sys.stderr)
+    if cache is not None:
+        cache.close()
+    return 0 if solved == total else 2
+
+
+# One puzzle on the iterative engine, saving the search to args.checkpoint every
+# args.every nodes and when stopped (time limit, node limit or Ctrl-C); run the
+# same command again to resume from the file
+def checkpointed_solve(args):
+    if os.path.exists(args.checkpoint):
+        search = IterativeSearch.load(args.checkpoint)
+        print(f"↩️  Resuming after {search.steps} nodes", file=sys.stderr)
+    else:
+        puzzles = list(puzzles_from(args.puzzle))
+        if len(puzzles) != 1:
+            raise ValueError("--checkpoint solves exactly one puzzle")
+        search = IterativeSearch(puzzles[0], args.method)
+    if args.timeout is not None or args.max_nodes is not None:
+        search.budget = SearchBudget(timeout=args.timeout, max_nodes=args.max_nodes)
+
+    try:
+        for paused in search.run(args.every):
+            paused.save(args.checkpoint)
+    except (BudgetExceeded, KeyboardInterrupt) as e:
+        search.save(args.checkpoint)
+        reason = search.budget.exceeded if isinstance(e, BudgetExceeded) else "interrupted"
+        print(f"⏸️  Stopped ({reason}) after {search.steps} nodes; saved to {args.checkpoint}", file=sys.stderr)
+        return 2
+
+    if os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+    if search.solution is None:
+        print(f"❌ No solution after {search.steps} nodes", file=sys.stderr)
+        return 2
+    show(search.solution, args.pretty)
+    if args.verbose:
+        print(f"✅ Solved in {search.steps} nodes", file=sys.stderr)
+    return 0
+
+
+def generate_command(args):
+    if args.bank:
+        return bank_command(args)
+    if args.difficulty or args.min_effort is not None or args.max_effort is not None:
+        return graded_command(args)
+    rng = random.Random(args.seed)
+    holes = args.holes if args.holes is not None else default_holes(args.box)
+    for _ in range(args.count):
+        show(generate_puzzle(holes, unique=args.unique, symmetric=args.symmetric, box=args.box, rng=rng),
+             args.pretty)
+    return 0
+
+
+# Unique puzzles on a difficulty target, generated on a process pool
+def graded_command(args):
+    started = time.perf_counter()
+    made = 0
+    for puzzle, rating in generate_graded_many(args.count, args.difficulty, args.min_effort, args.max_effort,
+                                               box=args.box, symmetric=args.symmetric,
+                                               workers=args.workers, seed=args.seed):
+        made += 1
+        show(puzzle, args.pretty)
+        if args.verbose:
+            print(f"🧩 {rating.difficulty}: {rating.clues} clues, {rating.effort} backtracks", file=sys.stderr)
+    if args.verbose:
+        print(f"✅ Generated {made} in {time.perf_counter() - started:.2f} sec", file=sys.stderr)
+    return 0
+
+
+# Draw from a pregenerated bank (see fill); falls back to generating when the
+# bank has nothing matching
+def bank_command(args):
+    bank = PuzzleBank(bank_path(args.box) if args.bank is True else args.bank, args.box)
+    rng = random.Random(args.seed)
+    for _ in range(args.count):
+        # Bank puzzles are unique, and so are the ones generated when nothing matches
+        show(generate_puzzle(args.holes, unique=True, symmetric=args.symmetric, box=bank.box, rng=rng,
+                             bank=bank, difficulty=args.difficulty), args.pretty)
+    return 0
+
+
+def fill_command(args):
+    bank = PuzzleBank(args.bank or bank_path(args.box), args.box)
+    started = time.perf_counter()
+    added = fill_bank(bank, args.count, args.difficulty, workers=args.workers, seed=args.seed)
+    print(f"🏦 Added {added} puzzles in {time.perf_counter() - started:.2f} sec; "
+          f"{bank.path} holds {len(bank)}", file=sys.stderr)
+    if args.verbose:
+        for (clues, difficulty), count in bank.counts().items():
+            print(f"   {clues} clues, {difficulty or 'unrated'}: {count}", file=sys.stderr)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve or generate Sudoku puzzles")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    solve = commands.add_parser("solve", help="solve puzzles, one solution per line")
+    solve.add_argument("puzzle", nargs="?", default="-",
+                       help="one-line puzzle, puzzle file, .gz file or - for stdin")
+    solve.add_argument("--method", default=DEFAULT_METHOD, help="solving technique")
+    solve.add_argument("--timeout", type=float, default=None, help="per-puzzle time limit in seconds")
+    solve.add_argument("--max-nodes", type=int, default=None, help="per-puzzle search node limit")
+    solve.add_argument("--pretty", action="store_true", help="print boxed grids instead of lines")
+    solve.add_argument("--checkpoint", default=None,
+                       help="save the search to this file as it runs and resume from it if present")
+    solve.add_argument("--every", type=int, default=100000, help="nodes between checkpoints")
+    solve.add_argument("--no-cache", action="store_true",
+                       help="solve every puzzle, even repeats (use when timing the solver)")
+    solve.add_argument("--cache-db", default=None,
+                       help="SQLite file keeping solutions between runs (default: this run only)")
+    solve.add_argument("-v", "--verbose", action="store_true", help="report the total time on stderr")
+    solve.set_defaults(run=solve_command)
+
+    generate = commands.add_parser("generate", help="generate puzzles, one per line")
+    generate.add_argument("--count", type=int, default=1, help="puzzles to generate")
+    generate.add_argument("--box", type=int, default=3, help="box size (3 = 9x9, 4 = 16x16, ...)")
+    generate.add_argument("--holes", type=int, default=None, help="cells to empty (default: about 40%%)")
+    generate.add_argument("--unique", action="store_true", help="only puzzles with a single solution")
+    generate.add_argument("--symmetric", action="store_true", help="remove cells in symmetric pairs")
+    generate.add_argument("--seed", type=int, default=None, help="random seed for reproducible output")
+    generate.add_argument("--difficulty", choices=DIFFICULTIES, default=None,
+                          help="only unique puzzles of this difficulty (implies --unique)")
+    generate.add_argument("--min-effort", type=int, default=None,
+                          help="least search effort, in reference solver backtracks")
+    generate.add_argument("--max-effort", type=int, default=None,
+                          help="most search effort, in reference solver backtracks")
+    generate.add_argument("--workers", type=int, default=None,
+                          help="processes for graded generation (default: one per core)")
+    generate.add_argument("--bank", nargs="?", const=True, default=None,
+                          help="draw from this puzzle bank (default path per box size) instead of generating")
+    generate.add_argument("--pretty", action="store_true", help="print boxed grids instead of lines")
+    generate.add_argument("-v", "--verbose", action="store_true", help="report ratings and time on stderr")
+    generate.set_defaults(run=generate_command)
+
+    fill = commands.add_parser("fill", help="add graded puzzles and solutions to a puzzle bank")
+    fill.add_argument("--bank", default=None, help="bank file (default: output/banks/bank_<box>.sdk)")
+    fill.add_argument("--count", type=int, default=1000, help="puzzles to add")
+    fill.add_argument("--box", type=int, default=3, help="box size of a new bank")
+    fill.add_argument("--difficulty", choices=DIFFICULTIES, default=None, help="difficulty of the new puzzles")
+    fill.add_argument("--workers", type=int, default=None, help="processes (default: one per core)")
+    fill.add_argument("--seed", type=int, default=None, help="random seed for reproducible puzzles")
+    fill.add_argument("-v", "--verbose", action="store_true", help="list the bank by clues and difficulty")
+    fill.set_defaults(run=fill_command)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.run(args)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
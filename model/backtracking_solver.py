@@ -1,38 +1,46 @@
 # model/backtracking_solver.py
 import time
-import copy
-from collections import deque
+from model.propagation import propagate
+from model.board import clone
+from model.bitboard import BitBoard, geometry, box_size, digit_bit
+from model.search_budget import BudgetExceeded
 
 # Check if placing 'num' at (row, col) is valid under Sudoku constraints
 def is_valid(board, row, col, num):
-    for i in range(9):
+    size = len(board)
+    box = box_size(board)
+    for i in range(size):
         if board[row][i] == num or board[i][col] == num:
             return False
-    box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-    for i in range(3):
-        for j in range(3):
+    box_row, box_col = box * (row // box), box * (col // box)
+    for i in range(box):
+        for j in range(box):
             if board[box_row + i][box_col + j] == num:
                 return False
     return True
 
 # Find the next empty cell (represented by 0)
 def find_empty(board):
-    for i in range(9):
-        for j in range(9):
+    size = len(board)
+    for i in range(size):
+        for j in range(size):
             if board[i][j] == 0:
                 return i, j
     return None
 
-# Basic backtracking algorithm to solve Sudoku without any heuristics or inference
-def basic_backtracking_solver(board):
+# Basic backtracking algorithm to solve Sudoku without any heuristics or inference.
+# A SearchBudget raises BudgetExceeded out of the search once it runs out.
+def basic_backtracking_solver(board, budget=None):
+    if budget is not None:
+        budget.charge()
     empty = find_empty(board)
     if not empty:
         return True
     row, col = empty
-    for num in range(1, 10):
+    for num in range(1, len(board) + 1):
         if is_valid(board, row, col, num):
             board[row][col] = num
-            if basic_backtracking_solver(board):
+            if basic_backtracking_solver(board, budget):
                 return True
             board[row][col] = 0
     return False
@@ -40,133 +48,270 @@ def basic_backtracking_solver(board):
 # Time the basic backtracking solver for performance evaluation
 def solve_and_time(board):
     start = time.perf_counter()
-    board_copy = copy.deepcopy(board)
+    board_copy = clone(board)
     basic_backtracking_solver(board_copy)
     end = time.perf_counter()
     return end - start
 
-# Solve puzzle using selected strategy (Backtracking, FC, AC, MRV, etc.)
-def solve_with_heuristics(puzzle, method="Backtracking"):
-    start = time.time()
-    solution = backtracking_solver(copy.deepcopy(puzzle), strategy=method)
-    end = time.time()
+# Solve puzzle using a registered strategy (see model/strategies.py): Backtracking,
+# FC, AC, MRV, Dancing Links, Portfolio, "Parallel " + any strategy, etc.
+# Pass a SearchStats as stats to have the strategy record the work it did.
+# Pass a SearchBudget to bound the solve: when it runs out the solution is None,
+# budget.exceeded names the limit and stats hold the work done until then.
+# An unknown method raises ValueError.
+def solve_with_heuristics(puzzle, method="Backtracking", stats=None, budget=None):
+    # Imported here: the registry is built from this module's search components
+    from model.strategies import get_strategy
+    strategy = get_strategy(method)
+    start = time.perf_counter()
+    try:
+        if budget is not None:
+            budget.check()
+        solution = strategy.solve(clone(puzzle), stats=stats, budget=budget)
+    except BudgetExceeded:
+        solution = None
+    end = time.perf_counter()
     return end - start, solution
 
-# General backtracking solver with options for heuristics and inference
-def backtracking_solver(puzzle, strategy="Backtracking"):
-    variables = [(r, c) for r in range(9) for c in range(9) if puzzle[r][c] == 0]
-    domains = {(r, c): list(range(1, 10)) for r, c in variables}
-
-    if "Forward Checking" in strategy:
-        apply_forward_checking(puzzle, domains)
-    if "Arc Consistency" in strategy:
-        apply_arc_consistency(puzzle, domains)
-
-    return recursive_backtracking(puzzle, variables, domains, strategy)
-
-# Recursive backtracking with support for heuristics (MRV, Degree, LCV)
-def recursive_backtracking(puzzle, variables, domains, strategy):
-    if not variables:
-        return puzzle
-
-    var = select_variable(variables, domains, strategy)
-
-    for value in order_values(var, domains[var], puzzle, strategy):
-        if is_safe(puzzle, var[0], var[1], value):
-            puzzle[var[0]][var[1]] = value
-            new_vars = [v for v in variables if v != var]
-            result = recursive_backtracking(puzzle, new_vars, domains, strategy)
-            if result:
-                return result
-            puzzle[var[0]][var[1]] = 0
-    return None
+# General backtracking solver with options for heuristics and inference.
+# Runs on a BitBoard so every placement check is a mask lookup, not a unit scan.
+# Domains are digit masks; strategies that rely on them keep them live during search.
+def backtracking_solver(puzzle, strategy="Backtracking", stats=None, budget=None):
+    from model.strategies import get_strategy
+    return get_strategy(strategy).solve(puzzle, stats=stats, budget=budget)
+
+# Set up the search state for a strategy: the BitBoard, the open variables
+# (reverse row-major, so the next cell in order sits at the end of the list),
+# their domains after the strategy's up-front inference, and the trail (None
+# when the strategy does not maintain domains). Returns None if the puzzle is
+# contradictory.
+def prepare_search(puzzle, strategy, stats=None):
+    if stats is not None:
+        start = time.perf_counter()
+    bits = BitBoard(puzzle)
+    if not bits.consistent:
+        return None
+    variables = bits.empty_cells()[::-1]
+    open_cells = len(variables)
+    domains = {(r, c): bits.all_digits for r, c in variables}
+
+    for step in strategy.inference:
+        fixed = step(bits, domains, stats)
+        if fixed is None:
+            return None
+        if fixed:
+            variables = [v for v in variables if v in domains]
+            if stats is not None:
+                stats.cells_fixed += fixed
+
+    if stats is not None:
+        # Every empty cell started with every digit; a cell fixed by propagation keeps one
+        bit_count = bits.geo.bit_count
+        remaining = sum(bit_count[domains[v]] for v in variables) + (open_cells - len(variables))
+        stats.prunings += bits.geo.size * open_cells - remaining
+        stats.preprocess_time += time.perf_counter() - start
+    return bits, variables, domains, [] if strategy.maintain else None
+
+# Build the recursive search for one choice of components: select picks the
+# index of the next variable, order lists a variable's values, and with maintain
+# each assignment prunes its peers' domains. The components are bound once here,
+# so the search looks at no strategy names per node.
+# The chosen variable is swapped out of `variables` in place and put back on the
+# way out, so no list is rebuilt per node. A budget is charged once per node.
+def compile_search(select=None, order=None, maintain=False):
+    select = select or select_next
+    order = order or natural_order
+
+    # Without domain maintenance: place, recurse, undo
+    def search(bits, variables, domains, trail=None, stats=None, depth=0, budget=None):
+        if not variables:
+            return bits.grid
+        if stats is not None:
+            stats.enter(depth)
+        if budget is not None:
+            budget.charge()
+
+        index = select(variables, domains, bits)
+        var = variables[index]
+        last = variables.pop()
+        if index < len(variables):
+            variables[index] = last
+        row, col = var
+
+        for value in order(var, domains[var], bits, domains):
+            if stats is not None:
+                stats.values_tried += 1
+            if bits.can_place(row, col, value):
+                bits.place(row, col, value)
+                result = search(bits, variables, domains, None, stats, depth + 1, budget)
+                if result:
+                    return result
+                bits.remove(row, col)
+                if stats is not None:
+                    stats.backtracks += 1
+
+        if index < len(variables):
+            variables[index] = var
+            variables.append(last)
+        else:
+            variables.append(var)
+        return None
+
+    # With a trail: each assignment prunes its peers' domains and the trail records
+    # (cell, old mask) pairs so backtracking restores only what changed
+    def maintained_search(bits, variables, domains, trail, stats=None, depth=0, budget=None):
+        if not variables:
+            return bits.grid
+        if stats is not None:
+            stats.enter(depth)
+        if budget is not None:
+            budget.charge()
+
+        index = select(variables, domains, bits)
+        var = variables[index]
+        last = variables.pop()
+        if index < len(variables):
+            variables[index] = last
+        row, col = var
 
-# Select next variable to assign using MRV and Degree heuristic
-def select_variable(variables, domains, strategy):
-    if "MRV" in strategy:
-        min_len = min(len(domains[v]) for v in variables)
-        candidates = [v for v in variables if len(domains[v]) == min_len]
-        if "Degree" in strategy:
-            return max(candidates, key=lambda var: count_constraints(var))
+        for value in order(var, domains[var], bits, domains):
+            if stats is not None:
+                stats.values_tried += 1
+            if bits.can_place(row, col, value):
+                bits.place(row, col, value)
+                mark = len(trail)
+                result = None
+                if propagate_assignment(bits, var, value, domains, trail):
+                    result = maintained_search(bits, variables, domains, trail, stats, depth + 1, budget)
+                if stats is not None:
+                    stats.prunings += len(trail) - mark
+                undo_trail(domains, trail, mark)
+                if result:
+                    return result
+                bits.remove(row, col)
+                if stats is not None:
+                    stats.backtracks += 1
+
+        if index < len(variables):
+            variables[index] = var
+            variables.append(last)
+        else:
+            variables.append(var)
+        return None
+
+    return maintained_search if maintain else search
+
+# Remove value from every empty peer's domain; False on a domain wipeout
+def propagate_assignment(bits, var, value, domains, trail):
+    bit = digit_bit(value)
+    grid = bits.grid
+    for peer in bits.geo.peers[var[0]][var[1]]:
+        if grid[peer[0]][peer[1]] == 0:
+            domain = domains[peer]
+            if domain & bit:
+                trail.append((peer, domain))
+                domain &= ~bit
+                domains[peer] = domain
+                if not domain:
+                    return False
+    return True
+
+# Restore domains changed since the trail had `mark` entries
+def undo_trail(domains, trail, mark):
+    while len(trail) > mark:
+        var, domain = trail.pop()
+        domains[var] = domain
+
+# Variable ordering components: each returns the index in `variables` of the
+# variable to assign next.
+# Default: the last one, i.e. the next empty cell in row-major order
+def select_next(variables, domains, bits):
+    return len(variables) - 1
+
+# MRV: the variable with the fewest values left
+def select_mrv(variables, domains, bits):
+    bit_count = bits.geo.bit_count
+    sizes = [bit_count[domains[v]] for v in variables]
+    return sizes.index(min(sizes))
+
+# MRV with ties broken by the Degree heuristic
+def select_mrv_degree(variables, domains, bits):
+    bit_count = bits.geo.bit_count
+    sizes = [bit_count[domains[v]] for v in variables]
+    min_len = min(sizes)
+    candidates = [i for i, size in enumerate(sizes) if size == min_len]
+    if len(candidates) == 1:
         return candidates[0]
-    return variables[0]
-
-# Count how many constraints a variable imposes on others (used in Degree heuristic)
-def count_constraints(var):
-    r, c = var
-    neighbors = set()
-    for i in range(9):
-        neighbors.add((r, i))
-        neighbors.add((i, c))
-    sr, sc = 3 * (r // 3), 3 * (c // 3)
-    for i in range(sr, sr + 3):
-        for j in range(sc, sc + 3):
-            neighbors.add((i, j))
-    neighbors.discard(var)
-    return len(neighbors)
-
-# Order values using Least Constraining Value (LCV)
-def order_values(var, values, puzzle, strategy):
-    if "LCV" not in strategy:
-        return values
+    return max(candidates, key=lambda i: count_constraints(variables[i], bits))
+
+# Count the unassigned peers a variable still constrains (used in Degree heuristic).
+# Empty cells per unit come from the unit masks (one bit per placed digit); only
+# the 2 * box cells the box shares with the row and column are scanned, to
+# correct for cells that would otherwise be counted twice.
+def count_constraints(var, bits):
+    row, col = var
+    grid = bits.grid
+    geo = bits.geo
+    box, size, bit_count = geo.box, geo.size, geo.bit_count
+    top, left = row - row % box, col - col % box
+    line = grid[row]
+    # Empty cells the box shares with the row or column, the variable itself counted twice
+    shared = 0
+    for c in range(left, left + box):
+        if line[c] == 0:
+            shared += 1
+    for r in range(top, top + box):
+        if grid[r][col] == 0:
+            shared += 1
+    return (3 * size - 1 - shared - bit_count[bits.rows[row]] - bit_count[bits.cols[col]]
+            - bit_count[bits.boxes[bits.box_of[row][col]]])
 
+# Value ordering components: each returns the values to try for a variable.
+# Default: ascending digits
+def natural_order(var, domain, bits, domains):
+    return bits.geo.digits_of[domain]
+
+# Least Constraining Value (LCV)
+def order_lcv(var, domain, bits, domains):
+    values = bits.geo.digits_of[domain]
+    grid = bits.grid
+    open_peers = [domains[p] for p in bits.geo.peers[var[0]][var[1]] if grid[p[0]][p[1]] == 0]
+
+    # Number of open peers that would lose the value
     def count_conflicts(value):
-        r, c = var
-        count = 0
-        for i in range(9):
-            if puzzle[r][i] == value or puzzle[i][c] == value:
-                count += 1
-        sr, sc = 3 * (r // 3), 3 * (c // 3)
-        for i in range(sr, sr + 3):
-            for j in range(sc, sc + 3):
-                if puzzle[i][j] == value:
-                    count += 1
-        return count
+        bit = digit_bit(value)
+        return sum(1 for mask in open_peers if mask & bit)
 
     return sorted(values, key=count_conflicts)
 
+# Inference components run before the search; each returns how many cells it
+# decided, or None on a contradiction (see also model/techniques.py).
 # Apply Forward Checking: prune domain values that are not safe
-def apply_forward_checking(puzzle, domains):
+def apply_forward_checking(bits, domains, stats=None):
     for (r, c), domain in domains.items():
-        domain[:] = [val for val in domain if is_safe(puzzle, r, c, val)]
-
-# Apply Arc Consistency (AC-3) to prune domain values based on neighbors
-def apply_arc_consistency(puzzle, domains):
-    queue = deque(domains.keys())
-    while queue:
-        var = queue.popleft()
-        r, c = var
-        revised = False
-        for val in domains[var][:]:
-            if not any(is_safe(puzzle, r, c, v) for v in domains[var]):
-                domains[var].remove(val)
-                revised = True
-        if revised:
-            queue.extend(get_neighbors(var))
+        domains[(r, c)] = domain & bits.candidates(r, c)
+    return 0
+
+# Apply Arc Consistency (AC-3) plus naked/hidden singles before search.
+# Decided cells are placed on the board; returns how many, or None on contradiction.
+def apply_arc_consistency(bits, domains, stats=None):
+    return propagate(bits, domains)
 
 # Get all variables that share a constraint with the given variable
 # (used by Arc Consistency and Degree heuristic)
-def get_neighbors(var):
-    r, c = var
-    neighbors = set()
-    for i in range(9):
-        neighbors.add((r, i))
-        neighbors.add((i, c))
-    sr, sc = 3 * (r // 3), 3 * (c // 3)
-    for i in range(sr, sr + 3):
-        for j in range(sc, sc + 3):
-            neighbors.add((i, j))
-    neighbors.discard(var)
-    return list(neighbors)
+def get_neighbors(var, box=3):
+    return list(geometry(box).peers[var[0]][var[1]])
 
 # Safety check used across different strategies to validate placement
 def is_safe(puzzle, row, col, num):
-    for i in range(9):
+    size = len(puzzle)
+    box = box_size(puzzle)
+    for i in range(size):
         if puzzle[row][i] == num or puzzle[i][col] == num:
             return False
-    sr, sc = 3 * (row // 3), 3 * (col // 3)
-    for i in range(sr, sr + 3):
-        for j in range(sc, sc + 3):
+    sr, sc = box * (row // box), box * (col // box)
+    for i in range(sr, sr + box):
+        for j in range(sc, sc + box):
             if puzzle[i][j] == num:
                 return False
     return True
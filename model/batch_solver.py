@@ -0,0 +1,122 @@
+# model/batch_solver.py
+# Vectorized solving of many puzzles at once. Candidates, naked singles and
+# hidden singles are computed for the whole (N, 9, 9) stack with NumPy ops;
+# only boards that propagation cannot finish fall back to per-board search.
+# Larger boards work the same way as (N, 16, 16) or (N, 25, 25) stacks.
+from math import isqrt
+import numpy as np
+from model.backtracking_solver import solve_with_heuristics
+
+
+# One-hot digit planes: placed[n, r, c, d] is True when board n has d + 1 at (r, c)
+def one_hot(boards):
+    size = boards.shape[-1]
+    return boards[..., None] == np.arange(1, size + 1, dtype=boards.dtype)
+
+
+# View a per-cell plane by box: (N, 9, 9, 9) -> (N, 3, 3, 3, 3, 9)
+def by_box(planes):
+    size = planes.shape[-1]
+    box = isqrt(size)
+    return planes.reshape(planes.shape[0], box, box, box, box, size)
+
+
+# Collapse a per-cell boolean plane to its boxes: (N, 9, 9, 9) -> (N, 3, 3, 9)
+def box_any(planes):
+    return by_box(planes).any(axis=(2, 4))
+
+
+# Broadcast a (N, 3, 3, 9) box plane back to every cell: -> (N, 9, 9, 9)
+def box_expand(boxes):
+    box = boxes.shape[1]
+    return boxes.repeat(box, axis=1).repeat(box, axis=2)
+
+
+# Candidate tensor: cand[n, r, c, d] is True when digit d + 1 fits at empty (r, c)
+def candidates(boards):
+    placed = one_hot(boards)
+    used = (placed.any(axis=2)[:, :, None, :]
+            | placed.any(axis=1)[:, None, :, :]
+            | box_expand(box_any(placed)))
+    return ~used & (boards == 0)[..., None]
+
+
+# True for each board whose givens never repeat a digit in a row, column or box
+def valid_givens(boards):
+    boards = np.asarray(boards, dtype=np.int8)
+    placed = one_hot(boards)
+    rows_ok = (placed.sum(axis=2) <= 1).all(axis=(1, 2))
+    cols_ok = (placed.sum(axis=1) <= 1).all(axis=(1, 2))
+    boxes_ok = (by_box(placed).sum(axis=(2, 4)) <= 1).all(axis=(1, 2, 3))
+    in_range = ((boards >= 0) & (boards <= boards.shape[-1])).all(axis=(1, 2))
+    return rows_ok & cols_ok & boxes_ok & in_range
+
+
+# Digits of the hidden singles in `cand`. `counts` is broadcast to every cell and
+# holds, for the cell's unit and each digit, how many cells can take the digit.
+def hidden_single_digits(cand, counts):
+    only = (counts == 1) & cand
+    return np.where(only.any(axis=-1), only.argmax(axis=-1) + 1, 0)
+
+
+# Run naked and hidden singles on every board until none of them changes.
+# Returns the filled boards and a per-board flag for contradictions found.
+def propagate_singles(boards):
+    boards = boards.copy()
+    broken = np.zeros(boards.shape[0], dtype=bool)
+    active = np.flatnonzero((boards == 0).any(axis=(1, 2)))
+    while active.size:
+        sub = boards[active]
+        cand = candidates(sub)
+        empty = sub == 0
+        count = cand.sum(axis=-1)
+
+        dead = (empty & (count == 0)).any(axis=(1, 2))
+        fills = np.where(empty & (count == 1), cand.argmax(axis=-1) + 1, 0)
+
+        # Hidden singles: a digit with exactly one open cell in a row, column or box
+        per_box = by_box(cand).sum(axis=(2, 4))
+        per_row = cand.sum(axis=2)
+        per_col = cand.sum(axis=1)
+        for counts in (per_row[:, :, None, :], per_col[:, None, :, :], box_expand(per_box)):
+            fills = np.where(fills == 0, hidden_single_digits(cand, counts), fills)
+
+        # A digit with no open cell and no placement in some unit cannot be completed
+        placed = one_hot(sub)
+        dead |= ((per_row == 0) & ~placed.any(axis=2)).any(axis=(1, 2))
+        dead |= ((per_col == 0) & ~placed.any(axis=1)).any(axis=(1, 2))
+        dead |= ((per_box == 0) & ~box_any(placed)).any(axis=(1, 2, 3))
+
+        fills[dead] = 0
+        broken[active[dead]] = True
+        progressed = (fills > 0).any(axis=(1, 2))
+        sub = np.where(fills > 0, fills, sub).astype(boards.dtype)
+        boards[active] = sub
+
+        keep = progressed & ~dead & (sub == 0).any(axis=(1, 2))
+        active = active[keep]
+
+    # Two rules can fill conflicting digits in the same pass; re-check the result
+    broken |= ~valid_givens(boards)
+    return boards, broken
+
+
+# Solve an (N, 9, 9) stack of puzzles (or any (N, n², n²) stack). Boards left
+# undecided by vectorized propagation are finished one at a time with `fallback`.
+# Returns (solutions, solved) where solved[n] tells whether board n was solved.
+def solve_batch(puzzles, fallback="Dancing Links (Algorithm X)"):
+    puzzles = np.asarray(puzzles, dtype=np.int8)
+    size = puzzles.shape[-1]
+    puzzles = puzzles.reshape(-1, size, size)
+    valid = valid_givens(puzzles)
+    boards, broken = propagate_singles(np.where(valid[:, None, None], puzzles, 0))
+    broken |= ~valid
+
+    solved = ~broken & ~(boards == 0).any(axis=(1, 2))
+    for i in np.flatnonzero(~broken & ~solved):
+        _, solution = solve_with_heuristics(boards[i].tolist(), method=fallback)
+        if solution:
+            boards[i] = solution
+            solved[i] = True
+    boards[~solved] = puzzles[~solved]
+    return boards, solved
@@ -0,0 +1,162 @@
+# model/bitboard.py
+# Incremental occupancy masks for constant-time Sudoku candidate checks.
+# Bit (num - 1) of a row/column/box mask is set when `num` is used in that unit.
+# Boards of any box size n (an n² x n² grid) are supported; the index tables
+# for each size are built once and shared through geometry(n).
+from math import isqrt
+
+# Mask tables up to this many digits are precomputed as lists; larger ones fill in lazily
+EAGER_TABLE_SIZE = 9
+
+
+# Dict that computes missing entries on first use (mask tables for 16x16 and up)
+class LazyTable(dict):
+    __slots__ = ("compute",)
+
+    def __init__(self, compute):
+        super().__init__()
+        self.compute = compute
+
+    def __missing__(self, mask):
+        value = self[mask] = self.compute(mask)
+        return value
+
+
+def mask_digits(mask, size):
+    return [d + 1 for d in range(size) if mask >> d & 1]
+
+
+# Index tables for one board size: box index of every cell, peers, units
+# and mask lookups. Build through geometry(box), which caches them.
+class Geometry:
+    __slots__ = ("box", "size", "all_digits", "box_of", "peers", "units", "units_of",
+                 "bit_count", "digits_of")
+
+    def __init__(self, box):
+        size = box * box
+        self.box = box
+        self.size = size
+        self.all_digits = (1 << size) - 1
+
+        # Box index of every cell, so placement never recomputes box * (r // box) + c // box
+        self.box_of = [[box * (r // box) + c // box for c in range(size)] for r in range(size)]
+
+        # The cells sharing a row, column or box with each cell (20 on a 9x9 board)
+        self.peers = [[sorted(({(r, i) for i in range(size)}
+                               | {(i, c) for i in range(size)}
+                               | {(box * (r // box) + i, box * (c // box) + j)
+                                  for i in range(box) for j in range(box)})
+                              - {(r, c)})
+                       for c in range(size)] for r in range(size)]
+
+        # All units (rows, columns, boxes) and the three units containing each cell
+        self.units = ([[(r, c) for c in range(size)] for r in range(size)]
+                      + [[(r, c) for r in range(size)] for c in range(size)]
+                      + [[(box * (b // box) + i, box * (b % box) + j) for i in range(box) for j in range(box)]
+                         for b in range(size)])
+        self.units_of = [[[self.units[r], self.units[size + c], self.units[2 * size + self.box_of[r][c]]]
+                          for c in range(size)] for r in range(size)]
+
+        # Lookup tables indexed by mask: number of set bits and the digits they stand for
+        if size <= EAGER_TABLE_SIZE:
+            self.bit_count = [bin(mask).count("1") for mask in range(self.all_digits + 1)]
+            self.digits_of = [mask_digits(mask, size) for mask in range(self.all_digits + 1)]
+        else:
+            self.bit_count = LazyTable(lambda mask: bin(mask).count("1"))
+            self.digits_of = LazyTable(lambda mask: mask_digits(mask, size))
+
+
+GEOMETRIES = {}
+
+
+# Shared tables for boards with the given box size (3 for classic 9x9)
+def geometry(box=3):
+    geo = GEOMETRIES.get(box)
+    if geo is None:
+        geo = GEOMETRIES[box] = Geometry(box)
+    return geo
+
+
+# Box size of a board from its side length (9 -> 3, 16 -> 4, 25 -> 5)
+def box_size(board):
+    box = isqrt(len(board))
+    if box < 2 or box * box != len(board):
+        raise ValueError(f"board side {len(board)} is not a square number")
+    return box
+
+
+# The classic 9x9 tables, kept as module constants
+CLASSIC = geometry(3)
+BOX = CLASSIC.box
+SIZE = CLASSIC.size
+ALL_DIGITS = CLASSIC.all_digits
+BOX_OF = CLASSIC.box_of
+PEERS = CLASSIC.peers
+UNITS = CLASSIC.units
+UNITS_OF = CLASSIC.units_of
+BIT_COUNT = CLASSIC.bit_count
+DIGITS_OF = CLASSIC.digits_of
+
+
+# Bit of a single digit
+def digit_bit(num):
+    return 1 << (num - 1)
+
+
+# Board wrapper that keeps row, column and box masks in sync with the grid.
+# The wrapped board is updated in place, so callers keep their board.
+class BitBoard:
+    __slots__ = ("grid", "geo", "box_of", "all_digits", "rows", "cols", "boxes", "consistent")
+
+    def __init__(self, board):
+        geo = self.geo = geometry(box_size(board))
+        size = geo.size
+        self.grid = board
+        self.box_of = geo.box_of
+        self.all_digits = geo.all_digits
+        self.rows = [0] * size
+        self.cols = [0] * size
+        self.boxes = [0] * size
+        # False when the givens repeat a digit in some unit or fall outside 1..size
+        self.consistent = True
+        for r in range(size):
+            for c in range(size):
+                num = board[r][c]
+                if num:
+                    if not 0 < num <= size or not self.can_place(r, c, num):
+                        self.consistent = False
+                    self.set_bits(r, c, num)
+
+    # Mask of digits that can still go in (row, col)
+    def candidates(self, row, col):
+        return self.all_digits & ~(self.rows[row] | self.cols[col] | self.boxes[self.box_of[row][col]])
+
+    # Constant-time replacement for the unit scans in is_safe / is_valid
+    def can_place(self, row, col, num):
+        used = self.rows[row] | self.cols[col] | self.boxes[self.box_of[row][col]]
+        return not used & digit_bit(num)
+
+    def set_bits(self, row, col, num):
+        bit = digit_bit(num)
+        self.rows[row] |= bit
+        self.cols[col] |= bit
+        self.boxes[self.box_of[row][col]] |= bit
+
+    # Write num into the grid and mark it used in the three units
+    def place(self, row, col, num):
+        self.grid[row][col] = num
+        self.set_bits(row, col, num)
+
+    # Undo a placement, clearing the cell and its unit bits
+    def remove(self, row, col):
+        bit = ~digit_bit(self.grid[row][col])
+        self.grid[row][col] = 0
+        self.rows[row] &= bit
+        self.cols[col] &= bit
+        self.boxes[self.box_of[row][col]] &= bit
+
+    # Empty cells in row-major order
+    def empty_cells(self):
+        grid = self.grid
+        size = self.geo.size
+        return [(r, c) for r in range(size) for c in range(size) if grid[r][c] == 0]
@@ -0,0 +1,100 @@
+# model/board.py
+# Compact Sudoku board: all cells in one bytearray instead of a list per row
+# (81 bytes for 9x9, 256 for 16x16, 625 for 25x25).
+# board[r] is a zero-copy memoryview of row r, so board[r][c] reads and writes
+# work unchanged in the solvers, view/ui.print_board and the Streamlit renderers.
+from math import isqrt
+
+# Text symbols for cell values: '0' is blank, values above 9 use letters (A = 10)
+SYMBOLS = "0123456789ABCDEFGHIJKLMNOP"
+
+
+# Text symbol for one cell value
+def symbol(value):
+    return SYMBOLS[value]
+
+
+# Cell value for one text symbol; '.' is also accepted as blank
+def symbol_value(ch):
+    if ch == ".":
+        return 0
+    value = SYMBOLS.find(ch.upper())
+    if value < 0:
+        raise ValueError(f"invalid cell symbol {ch!r}")
+    return value
+
+
+# Side length for a cell count (81 -> 9, 256 -> 16, 625 -> 25)
+def side_for(cell_count):
+    side = isqrt(cell_count)
+    box = isqrt(side)
+    if side * side != cell_count or box * box != side or box < 2:
+        raise ValueError(f"{cell_count} cells do not form an n² x n² board")
+    return side
+
+
+class Board:
+    __slots__ = ("cells", "rows")
+
+    def __init__(self, cells=None):
+        self.cells = bytearray(81) if cells is None else bytearray(cells)
+        size = side_for(len(self.cells))
+        view = memoryview(self.cells)
+        self.rows = tuple(view[r * size:(r + 1) * size] for r in range(size))
+
+    # Build from a list of lists (or any board indexable as board[r][c])
+    @classmethod
+    def from_rows(cls, rows):
+        return cls(bytes(v for row in rows for v in row))
+
+    # Parse the canonical one-char-per-cell form; '0' or '.' mark blanks
+    @classmethod
+    def from_string(cls, text):
+        return cls(bytes(symbol_value(ch) for ch in text.strip()))
+
+    def to_rows(self):
+        return [list(row) for row in self.rows]
+
+    def copy(self):
+        return Board(self.cells)
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __reduce__(self):
+        return (Board, (bytes(self.cells),))
+
+    def __getitem__(self, row):
+        return self.rows[row]
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __eq__(self, other):
+        if isinstance(other, Board):
+            return self.cells == other.cells
+        return NotImplemented
+
+    # Hash of the current contents; do not mutate a board while it is a dict key
+    def __hash__(self):
+        return hash(bytes(self.cells))
+
+    # Canonical string, one symbol per cell and '0' for blanks (81 chars on 9x9)
+    def __str__(self):
+        return "".join(SYMBOLS[v] for v in self.cells)
+
+    def __repr__(self):
+        return f"Board('{self}')"
+
+
+# Cheap independent copy of a Board or a list-of-lists board
+def clone(board):
+    if isinstance(board, Board):
+        return board.copy()
+    return [row[:] for row in board]
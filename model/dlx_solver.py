@@ -0,0 +1,210 @@
+# model/dlx_solver.py
+# Exact-cover Sudoku solver using Knuth's Dancing Links (Algorithm X).
+# Each candidate (row, col, digit) covers four of the 4 * size² constraints
+# (324 on a 9x9 board): cell filled, digit in row, digit in column, digit in box.
+import time
+from model.bitboard import BitBoard
+from model.board import clone
+
+
+# Toroidal doubly linked sparse matrix stored as parallel integer lists.
+# Node 0 is the root, nodes 1..n_columns are column headers.
+class DancingLinks:
+    __slots__ = ("left", "right", "up", "down", "column", "size", "row_of")
+
+    def __init__(self, n_columns, active):
+        count = n_columns + 1
+        self.left = list(range(count))
+        self.right = list(range(count))
+        self.up = list(range(count))
+        self.down = list(range(count))
+        self.column = list(range(count))
+        self.size = [0] * count
+        self.row_of = [None] * count
+        # Only active columns are linked into the header list and must be covered
+        prev = 0
+        for col in active:
+            self.right[prev] = col
+            self.left[col] = prev
+            prev = col
+        self.right[prev] = 0
+        self.left[0] = prev
+
+    # Append a row covering the given column headers
+    def add_row(self, row_id, columns):
+        left, right, up, down = self.left, self.right, self.up, self.down
+        first = len(left)
+        for i, col in enumerate(columns):
+            node = first + i
+            left.append(node - 1 if i else first + len(columns) - 1)
+            right.append(node + 1 if i < len(columns) - 1 else first)
+            up.append(up[col])
+            down.append(col)
+            down[up[col]] = node
+            up[col] = node
+            self.column.append(col)
+            self.row_of.append(row_id)
+            self.size[col] += 1
+
+    def cover(self, col):
+        left, right, up, down, column, size = (self.left, self.right, self.up,
+                                               self.down, self.column, self.size)
+        right[left[col]] = right[col]
+        left[right[col]] = left[col]
+        i = down[col]
+        while i != col:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def uncover(self, col):
+        left, right, up, down, column, size = (self.left, self.right, self.up,
+                                               self.down, self.column, self.size)
+        i = up[col]
+        while i != col:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[col]] = col
+        left[right[col]] = col
+
+    # Yield every exact cover as a list of row ids (the list is reused; copy it to keep it).
+    # A SearchStats passed as stats records nodes, rows tried and backtracks;
+    # a SearchBudget is charged once per node and may raise BudgetExceeded.
+    def solutions(self, partial=None, stats=None, budget=None):
+        if partial is None:
+            partial = []
+        right, down, column, size = self.right, self.down, self.column, self.size
+        if right[0] == 0:
+            yield partial
+            return
+        if stats is not None:
+            stats.enter(len(partial))
+        if budget is not None:
+            budget.charge()
+
+        # Column with the fewest remaining rows (Knuth's S heuristic)
+        best = right[0]
+        col = right[best]
+        while col != 0:
+            if size[col] < size[best]:
+                best = col
+                if size[col] < 2:
+                    break
+            col = right[col]
+        if size[best] == 0:
+            return
+
+        self.cover(best)
+        node = down[best]
+        while node != best:
+            partial.append(self.row_of[node])
+            j = right[node]
+            while j != node:
+                self.cover(column[j])
+                j = right[j]
+            if stats is not None:
+                stats.values_tried += 1
+            yield from self.solutions(partial, stats, budget)
+            j = self.left[node]
+            while j != node:
+                self.uncover(column[j])
+                j = self.left[j]
+            partial.pop()
+            if stats is not None:
+                stats.backtracks += 1
+            node = down[node]
+        self.uncover(best)
+
+
+# Column headers (1-based) for placing digit num at (row, col)
+def constraint_columns(geo, row, col, num):
+    size = geo.size
+    cells = size * size
+    d = num - 1
+    return (1 + row * size + col,
+            1 + cells + row * size + d,
+            1 + 2 * cells + col * size + d,
+            1 + 3 * cells + geo.box_of[row][col] * size + d)
+
+
+# Build the exact-cover matrix for a puzzle. Constraints already met by the
+# givens are left out, and only digits still possible in a cell become rows.
+# Returns None when the givens conflict.
+def build_matrix(puzzle):
+    bits = BitBoard(puzzle)
+    if not bits.consistent:
+        return None
+    geo = bits.geo
+    size = geo.size
+    constraints = 4 * size * size
+    satisfied = set()
+    for r in range(size):
+        for c in range(size):
+            if puzzle[r][c]:
+                satisfied.update(constraint_columns(geo, r, c, puzzle[r][c]))
+    active = [col for col in range(1, constraints + 1) if col not in satisfied]
+    matrix = DancingLinks(constraints, active)
+    for r, c in bits.empty_cells():
+        for num in geo.digits_of[bits.candidates(r, c)]:
+            matrix.add_row((r, c, num), constraint_columns(geo, r, c, num))
+    return matrix
+
+
+# Yield solved boards one at a time, stopping after `limit` if given
+def dlx_solutions(puzzle, limit=None, stats=None, budget=None):
+    matrix = build_matrix(puzzle)
+    if matrix is None:
+        return
+    found = 0
+    for rows in matrix.solutions(stats=stats, budget=budget):
+        board = clone(puzzle)
+        for r, c, num in rows:
+            board[r][c] = num
+        yield board
+        found += 1
+        if limit is not None and found >= limit:
+            return
+
+
+# Solve in place like backtracking_solver; returns the board or None.
+# With stats, matrix construction counts as preprocessing.
+def dlx_solve(puzzle, stats=None, budget=None):
+    if stats is not None:
+        start = time.perf_counter()
+    matrix = build_matrix(puzzle)
+    if stats is not None:
+        search_start = time.perf_counter()
+        stats.preprocess_time += search_start - start
+
+    try:
+        rows = None if matrix is None else next(matrix.solutions(stats=stats, budget=budget), None)
+    finally:
+        if stats is not None:
+            stats.search_time += time.perf_counter() - search_start
+    if rows is None:
+        return None
+    for r, c, num in rows:
+        puzzle[r][c] = num
+    return puzzle
+
+
+# Count solutions without materializing boards, stopping early at `limit`
+def count_solutions(puzzle, limit=None, budget=None):
+    matrix = build_matrix(puzzle)
+    if matrix is None:
+        return 0
+    found = 0
+    for _ in matrix.solutions(budget=budget):
+        found += 1
+        if limit is not None and found >= limit:
+            break
+    return found
@@ -0,0 +1,65 @@
+# model/grid_factory.py
+# Fast full-grid production. A small pool of base grids is built once by search;
+# every new grid is a base grid put through random validity-preserving transforms:
+# digit relabeling, band/stack permutation, row/column swaps inside a band/stack
+# and transposition.
+import random
+from model.sudoku_generator import create_empty_board, solve_board
+
+# From this box size up (25x25) base grids come from pattern_grid, because
+# randomized search for a full grid has a heavy tail of very slow runs
+PATTERN_BOX = 5
+
+
+# Random order of the rows (or columns): shuffle the bands, then the rows in each band
+def line_order(rng, box=3):
+    bands = list(range(box))
+    rng.shuffle(bands)
+    order = []
+    for band in bands:
+        lines = [box * band + i for i in range(box)]
+        rng.shuffle(lines)
+        order.extend(lines)
+    return order
+
+
+# A valid full grid of any size built directly from the classic shifting pattern
+def pattern_grid(box=3):
+    size = box * box
+    return [[(box * (r % box) + r // box + c) % size + 1 for c in range(size)] for r in range(size)]
+
+
+# Produces valid solved grids. A seed makes the whole sequence reproducible.
+# box sets the board size (3 -> 9x9, 4 -> 16x16, 5 -> 25x25).
+class GridFactory:
+    def __init__(self, seed=None, pool_size=8, box=3):
+        self.rng = random.Random(seed)
+        self.box = box
+        self.pool = []
+        if box >= PATTERN_BOX:
+            self.pool.append(pattern_grid(box))
+            return
+        for _ in range(pool_size):
+            board = create_empty_board(box)
+            solve_board(board, self.rng)
+            self.pool.append(board)
+
+    # Transform a random base grid into a new valid grid
+    def make_grid(self):
+        rng = self.rng
+        base = rng.choice(self.pool)
+        labels = list(range(1, self.box * self.box + 1))
+        rng.shuffle(labels)
+        relabel = [0] + labels
+        rows = line_order(rng, self.box)
+        cols = line_order(rng, self.box)
+        if rng.random() < 0.5:
+            return [[relabel[base[r][c]] for r in rows] for c in cols]
+        return [[relabel[base[r][c]] for c in cols] for r in rows]
+
+    # Yield `count` grids (endless when count is None)
+    def grids(self, count=None):
+        produced = 0
+        while count is None or produced < count:
+            yield self.make_grid()
+            produced += 1
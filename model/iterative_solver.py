@@ -0,0 +1,219 @@
+# model/iterative_solver.py
+# The backtracking search of backtracking_solver.py with an explicit stack
+# instead of one Python frame per cell. All search state lives on the object,
+# so a solve can stop after any number of nodes and pick up where it left off:
+# run() is a generator that pauses every `every` nodes, and save()/load()
+# checkpoint a paused search to disk. Node for node it does the same work as
+# the strategy's compiled recursive search (same order, same SearchStats counts).
+import time
+import pickle
+from model.board import clone
+from model.bitboard import BitBoard
+from model.backtracking_solver import prepare_search, propagate_assignment, undo_trail
+from model.strategies import get_strategy
+
+# Positions in a stack frame: the variable being assigned, its index in
+# `variables` and the variable moved into that slot, an iterator over the values
+# still to try, and the trail mark of the value currently placed
+INDEX, VAR, LAST, VALUES, MARK = range(5)
+
+
+class IterativeSearch:
+    # The puzzle is copied; strategy names a registered backtracking strategy
+    def __init__(self, puzzle, strategy="Backtracking", stats=None, budget=None):
+        if not get_strategy(strategy).backtracking:
+            raise ValueError(f"{strategy} does not search by backtracking")
+        self.strategy = strategy
+        self.stats = stats
+        self.budget = budget
+        self.stack = []
+        # True when the next step expands a new node rather than revisiting the top frame
+        self.descend = True
+        # True when that node is already counted in stats but its budget charge
+        # failed, so a resumed search does not count it twice
+        self.entered = False
+        self.steps = 0
+        self.solution = None
+        prepared = prepare_search(clone(puzzle), get_strategy(strategy), stats)
+        self.done = prepared is None
+        if prepared is None:
+            self.bits = BitBoard(clone(puzzle))
+            self.variables, self.domains, self.trail = [], {}, None
+        else:
+            self.bits, self.variables, self.domains, self.trail = prepared
+
+    # The board as the search currently has it, partial assignments included
+    @property
+    def grid(self):
+        return self.bits.grid
+
+    @property
+    def depth(self):
+        return len(self.stack)
+
+    # Search for up to max_steps more nodes (None: until finished).
+    # Returns True once the search is over: self.solution is the solved grid,
+    # or None when there is none. A budget raises BudgetExceeded; the search
+    # stays consistent and can be resumed afterwards.
+    def advance(self, max_steps=None):
+        if self.done:
+            return True
+        stats = self.stats
+        if stats is not None:
+            search_start = time.perf_counter()
+        budget = self.budget
+        strategy = get_strategy(self.strategy)
+        select = strategy.select
+        order = strategy.order
+        bits = self.bits
+        variables = self.variables
+        domains = self.domains
+        trail = self.trail
+        stack = self.stack
+        grid = bits.grid
+        rows, cols, boxes, box_of = bits.rows, bits.cols, bits.boxes, bits.box_of
+        digits_of = bits.geo.digits_of
+        steps = self.steps
+        limit = None if max_steps is None else steps + max_steps
+        descend = self.descend
+        entered = self.entered
+        try:
+            while True:
+                if descend:
+                    if not variables:
+                        if stats is not None and trail is not None and stack:
+                            # Counted as recursive_backtracking counts them while unwinding
+                            stats.prunings += len(trail) - stack[0][MARK]
+                        self.solution = grid
+                        self.done = True
+                        return True
+                    if steps == limit:
+                        return False
+                    # Counted before the budget is charged, as compile_search does, so a
+                    # node limit stops both engines after the same number of nodes
+                    if stats is not None and not entered:
+                        stats.enter(len(stack))
+                    entered = True
+                    if budget is not None:
+                        budget.charge()
+                    entered = False
+                    steps += 1
+
+                    index = len(variables) - 1 if select is None else select(variables, domains, bits)
+                    var = variables[index]
+                    last = variables.pop()
+                    if index < len(variables):
+                        variables[index] = last
+                    values = digits_of[domains[var]] if order is None else order(var, domains[var], bits, domains)
+                    frame = [index, var, last, iter(values), None]
+                    stack.append(frame)
+                    row, col = var
+                    box = box_of[row][col]
+                else:
+                    # The child of the top frame failed: take its value back
+                    frame = stack[-1]
+                    row, col = var = frame[VAR]
+                    box = box_of[row][col]
+                    if trail is not None:
+                        mark = frame[MARK]
+                        if stats is not None:
+                            stats.prunings += len(trail) - mark
+                        undo_trail(domains, trail, mark)
+                    bit = ~(1 << (grid[row][col] - 1))
+                    grid[row][col] = 0
+                    rows[row] &= bit
+                    cols[col] &= bit
+                    boxes[box] &= bit
+                    if stats is not None:
+                        stats.backtracks += 1
+
+                # Same checks as BitBoard.can_place / place / remove, inlined
+                descend = False
+                for value in frame[VALUES]:
+                    if stats is not None:
+                        stats.values_tried += 1
+                    bit = 1 << (value - 1)
+                    if (rows[row] | cols[col] | boxes[box]) & bit:
+                        continue
+                    grid[row][col] = value
+                    rows[row] |= bit
+                    cols[col] |= bit
+                    boxes[box] |= bit
+                    if trail is None:
+                        descend = True
+                        break
+                    mark = len(trail)
+                    if propagate_assignment(bits, var, value, domains, trail):
+                        frame[MARK] = mark
+                        descend = True
+                        break
+                    if stats is not None:
+                        stats.prunings += len(trail) - mark
+                    undo_trail(domains, trail, mark)
+                    grid[row][col] = 0
+                    bit = ~bit
+                    rows[row] &= bit
+                    cols[col] &= bit
+                    boxes[box] &= bit
+                    if stats is not None:
+                        stats.backtracks += 1
+
+                if not descend:
+                    # Every value failed: put the variable back and return to the parent
+                    stack.pop()
+                    index, last = frame[INDEX], frame[LAST]
+                    if index < len(variables):
+                        variables[index] = var
+                        variables.append(last)
+                    else:
+                        variables.append(var)
+                    if not stack:
+                        self.done = True
+                        return True
+        finally:
+            self.steps = steps
+            self.descend = descend
+            self.entered = entered
+            if stats is not None:
+                stats.search_time += time.perf_counter() - search_start
+
+    # Generator form: yields the search itself every `every` nodes so the caller
+    # can inspect, draw or checkpoint it, and returns the solution (or None)
+    def run(self, every=1000):
+        while not self.advance(every):
+            yield self
+        return self.solution
+
+    # Search to the end
+    def solve(self):
+        self.advance()
+        return self.solution
+
+    # Write the paused search to `path`; the budget is not saved (its deadline
+    # and cancel flag belong to this process), so load() takes a new one
+    def save(self, path):
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path, budget=None):
+        with open(path, "rb") as f:
+            search = pickle.load(f)
+        search.budget = budget
+        return search
+
+    # The BitBoard is rebuilt from the grid instead of pickling its geometry tables
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["bits"] = self.bits.grid
+        state["budget"] = None
+        return state
+
+    def __setstate__(self, state):
+        state["bits"] = BitBoard(state["bits"])
+        self.__dict__.update(state)
+
+
+# Solve with the iterative engine; same contract as backtracking_solver
+def iterative_solver(puzzle, strategy="Backtracking", stats=None, budget=None):
+    return IterativeSearch(puzzle, strategy, stats, budget).solve()
@@ -0,0 +1,96 @@
+# model/parallel_solver.py
+# Spread independent solves across CPU cores with a process pool.
+# Input is consumed lazily, so generators and very large corpora stream
+# through with only a bounded number of chunks in flight.
+import os
+import heapq
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from model.backtracking_solver import solve_with_heuristics
+from model.strategies import get_strategy
+from model.search_stats import SearchStats
+from model.search_budget import SearchBudget
+
+# index is the puzzle's position in the input, elapsed the solve time in seconds,
+# stats a SearchStats when requested and None otherwise, exceeded the limit
+# ("deadline" or "nodes") a budgeted solve ran out of, else None
+SolveResult = namedtuple("SolveResult", ["index", "elapsed", "solution", "stats", "exceeded"],
+                         defaults=[None])
+
+
+# Worker entry point: solve one chunk of (index, puzzle) pairs, each under its
+# own budget when timeout (seconds) or max_nodes is given
+def solve_chunk(chunk, method, with_stats=False, timeout=None, max_nodes=None):
+    results = []
+    for index, puzzle in chunk:
+        stats = SearchStats() if with_stats else None
+        budget = None
+        if timeout is not None or max_nodes is not None:
+            budget = SearchBudget(timeout=timeout, max_nodes=max_nodes)
+        elapsed, solution = solve_with_heuristics(puzzle, method=method, stats=stats, budget=budget)
+        exceeded = budget.exceeded if budget is not None else None
+        results.append(SolveResult(index, elapsed, solution, stats, exceeded))
+    return results
+
+
+# Split an iterable of puzzles into lists of (index, puzzle) pairs
+def chunked(puzzles, chunksize):
+    numbered = enumerate(puzzles)
+    while True:
+        chunk = list(islice(numbered, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+# Solve every puzzle with `method`, yielding SolveResult tuples as they finish.
+# ordered=True yields in input order; ordered=False yields as completed.
+# workers=1 solves in this process; None uses every core.
+# with_stats=True attaches a SearchStats to every result.
+# timeout / max_nodes bound every single solve (see SearchBudget).
+def solve_many(puzzles, method="Backtracking", workers=None, chunksize=1, ordered=True, prefetch=2,
+               with_stats=False, timeout=None, max_nodes=None):
+    workers = workers or os.cpu_count() or 1
+    if get_strategy(method).pooled:
+        # These methods already spread one solve over several processes
+        workers = 1
+    chunksize = max(1, chunksize)
+    chunks = chunked(puzzles, chunksize)
+
+    if workers == 1:
+        for chunk in chunks:
+            yield from solve_chunk(chunk, method, with_stats, timeout, max_nodes)
+        return
+
+    max_in_flight = workers * max(1, prefetch)
+    next_index = 0
+    finished = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            # Keep the pool fed without reading the whole input up front. Results
+            # waiting behind a slow puzzle count against the window, so ordered
+            # output stays bounded too.
+            while not exhausted and len(pending) + len(finished) // chunksize < max_in_flight:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                else:
+                    pending.add(pool.submit(solve_chunk, chunk, method, with_stats, timeout, max_nodes))
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for result in future.result():
+                    if ordered:
+                        heapq.heappush(finished, result)
+                    else:
+                        yield result
+
+            # Release whatever is now contiguous with what was already yielded
+            while finished and finished[0].index == next_index:
+                yield heapq.heappop(finished)
+                next_index += 1
@@ -0,0 +1,143 @@
+# model/portfolio_solver.py
+# "Portfolio" method: race several strategies on the same puzzle, one process
+# each, and keep the first definitive answer. The losers are stopped through a
+# cancel flag shared with every racer's SearchBudget. Which strategy won is
+# recorded per solve and tallied in `wins`, so the portfolio can be tuned.
+import time
+import atexit
+import threading
+import multiprocessing
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from model.backtracking_solver import solve_with_heuristics
+from model.search_stats import SearchStats
+from model.search_budget import SearchBudget
+
+PORTFOLIO = "Portfolio"
+
+DEFAULT_PORTFOLIO = [
+    "Dancing Links (Algorithm X)",
+    "Backtracking + Arc Consistency",
+    "Backtracking + MRV",
+    "Backtracking + MRV + LCV + Degree",
+    "Backtracking",
+]
+
+# One racer's outcome; exceeded is set when the racer was cancelled or ran out of budget
+RaceResult = namedtuple("RaceResult", ["method", "elapsed", "solution", "stats", "exceeded"])
+
+# winner is the method whose answer was kept (None when every racer ran out of budget),
+# results the RaceResults that came back before the race was decided
+PortfolioResult = namedtuple("PortfolioResult", ["elapsed", "solution", "winner", "results"])
+
+# Cancel flag inherited by every racer process
+CANCEL = None
+
+
+def init_racer(cancel):
+    global CANCEL
+    CANCEL = cancel
+
+
+# Racer entry point: one strategy under a budget tied to the shared cancel flag
+def race(puzzle, method, timeout=None, max_nodes=None):
+    stats = SearchStats()
+    budget = SearchBudget(timeout=timeout, max_nodes=max_nodes, cancelled=CANCEL)
+    elapsed, solution = solve_with_heuristics(puzzle, method=method, stats=stats, budget=budget)
+    return RaceResult(method, elapsed, solution, stats, budget.exceeded)
+
+
+# A pool with one process per strategy, kept alive between solves.
+# Races from several threads take turns, since they share the cancel flag.
+class PortfolioSolver:
+    def __init__(self, methods=None):
+        self.methods = list(methods or DEFAULT_PORTFOLIO)
+        if PORTFOLIO in self.methods:
+            raise ValueError("a portfolio cannot race itself")
+        self.cancel = multiprocessing.Event()
+        self.pool = ProcessPoolExecutor(max_workers=len(self.methods), initializer=init_racer,
+                                        initargs=(self.cancel,))
+        # Losers of the previous race, still winding down after cancellation
+        self.stragglers = set()
+        self.wins = Counter()
+        self.lock = threading.Lock()
+
+    # Race every strategy on puzzle. A solution, or a racer proving there is
+    # none, decides the race. timeout / max_nodes apply to each racer; a budget
+    # passed in can also stop the race from another thread.
+    def solve(self, puzzle, timeout=None, max_nodes=None, budget=None):
+        with self.lock:
+            return self.race(puzzle, timeout, max_nodes, budget)
+
+    def race(self, puzzle, timeout, max_nodes, budget):
+        start = time.perf_counter()
+        if self.stragglers:
+            wait(self.stragglers)
+            self.stragglers = set()
+        self.cancel.clear()
+        if budget is not None and budget.deadline is not None:
+            remaining = max(0.0, budget.deadline - start)
+            timeout = remaining if timeout is None else min(timeout, remaining)
+
+        pending = {self.pool.submit(race, puzzle, method, timeout, max_nodes) for method in self.methods}
+        results = []
+        decided = None
+        while pending and decided is None:
+            done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                results.append(result)
+                if decided is None and (result.solution or not result.exceeded):
+                    decided = result
+            if decided is None and budget is not None and budget.cancelled.is_set():
+                break
+
+        self.cancel.set()
+        self.stragglers = pending
+        solution = winner = None
+        if decided is not None:
+            solution, winner = decided.solution, decided.method
+            self.wins[winner] += 1
+        return PortfolioResult(time.perf_counter() - start, solution, winner, results)
+
+    def close(self):
+        self.cancel.set()
+        self.pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+SHARED = None
+
+
+# Process-wide portfolio used by solve_with_heuristics(method="Portfolio")
+def shared_portfolio():
+    global SHARED
+    if SHARED is None:
+        SHARED = PortfolioSolver()
+        atexit.register(SHARED.close)
+    return SHARED
+
+
+# solve_with_heuristics backend: returns the winning solution, copying the
+# winner's counters into stats and its name into stats.winner (per call, so
+# sessions sharing the portfolio never see each other's races).
+# max_nodes of a budget applies to each racer.
+def portfolio_solve(puzzle, stats=None, budget=None):
+    max_nodes = budget.max_nodes if budget is not None else None
+    result = shared_portfolio().solve(puzzle, max_nodes=max_nodes, budget=budget)
+    if result.winner is None:
+        # Only under a budget: every racer was cancelled or ran out
+        if budget.cancelled.is_set():
+            budget.stop("cancelled")
+        budget.stop("nodes" if all(r.exceeded == "nodes" for r in result.results) else "deadline")
+    if stats is not None:
+        winner = next(r.stats for r in result.results if r.method == result.winner)
+        for name in SearchStats.__slots__:
+            setattr(stats, name, getattr(winner, name))
+        stats.winner = result.winner
+    return result.solution
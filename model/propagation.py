@@ -0,0 +1,87 @@
+# model/propagation.py
+# Constraint propagation run before search: AC-3 over the all-different arcs,
+# naked singles and hidden singles, all driven by the board geometry's peer/unit index.
+from collections import deque
+
+
+# Propagate domains to a fixed point and place every cell that becomes decided.
+# Returns the number of cells fixed, or None if the puzzle is contradictory.
+# Fixed cells are written to the board and removed from `domains`.
+def propagate(bits, domains):
+    grid = bits.grid
+    geo = bits.geo
+    peers = geo.peers
+    for r, c in domains:
+        domains[(r, c)] &= bits.candidates(r, c)
+        if not domains[(r, c)]:
+            return None
+
+    queue = deque((var, peer) for var in domains for peer in peers[var[0]][var[1]] if peer in domains)
+    while True:
+        if not arc_consistency(geo, domains, queue):
+            return None
+        # Hidden singles feed new singleton domains back into AC-3
+        changed = apply_hidden_singles(geo, grid, domains, queue)
+        if changed is None:
+            return None
+        if not changed:
+            break
+
+    # Naked singles: every singleton domain is now a decided cell
+    fixed = 0
+    for var, domain in list(domains.items()):
+        if geo.bit_count[domain] == 1:
+            bits.place(var[0], var[1], geo.digits_of[domain][0])
+            del domains[var]
+            fixed += 1
+    return fixed
+
+
+# AC-3 over arcs (var, peer). For all-different, revising var against peer only
+# removes a value when peer's domain is that single value.
+def arc_consistency(geo, domains, queue):
+    bit_count = geo.bit_count
+    peers = geo.peers
+    while queue:
+        var, peer = queue.popleft()
+        peer_domain = domains[peer]
+        if bit_count[peer_domain] == 1 and domains[var] & peer_domain:
+            domain = domains[var] & ~peer_domain
+            if not domain:
+                return False
+            domains[var] = domain
+            for other in peers[var[0]][var[1]]:
+                if other != peer and other in domains:
+                    queue.append((other, var))
+    return True
+
+
+# Fix digits that fit in only one open cell of a unit.
+# Returns how many domains were narrowed, or None when a digit has no place left.
+def apply_hidden_singles(geo, grid, domains, queue):
+    changed = 0
+    for unit in geo.units:
+        placed = 0
+        for r, c in unit:
+            if grid[r][c]:
+                placed |= 1 << (grid[r][c] - 1)
+        seen_once = 0
+        seen_twice = 0
+        for var in unit:
+            domain = domains.get(var, 0)
+            seen_twice |= seen_once & domain
+            seen_once |= domain
+        if (seen_once | placed) != geo.all_digits:
+            return None
+        for var in unit:
+            domain = domains.get(var, 0)
+            single = domain & seen_once & ~seen_twice
+            if single and domain != single:
+                if geo.bit_count[single] > 1:
+                    return None
+                domains[var] = single
+                changed += 1
+                for peer in geo.peers[var[0]][var[1]]:
+                    if peer in domains:
+                        queue.append((peer, var))
+    return changed
@@ -0,0 +1,268 @@
+# model/puzzle_bank.py
+# Pregenerated puzzle bank. Puzzles and their solutions are stored in
+# fixed-width records (n⁴ puzzle bytes, n⁴ solution bytes, one difficulty byte)
+# after a short header, so record i sits at a known offset and is read straight
+# out of an mmap. A small side index (<bank>.idx) lists record numbers by
+# (clue count, difficulty): drawing a random puzzle that matches is a lookup and
+# one slice, however many millions of records the bank holds. BankRefill keeps
+# the bank stocked from generate_graded_many on a background thread.
+# One process writes a bank at a time; any number can read it.
+import os
+import mmap
+import pickle
+import random
+import struct
+import threading
+from array import array
+from collections import namedtuple
+from model.board import Board, clone
+from model.dlx_solver import dlx_solve
+from model.sudoku_generator import DIFFICULTIES, generate_graded_many
+
+MAGIC = b"SDKBANK1"
+# Magic and box size, padded to 16 bytes; the records follow
+HEADER = struct.Struct("<8sB7x")
+# Difficulty byte of puzzles added without a rating
+UNRATED = 255
+DEFAULT_BANK_DIR = os.path.join(os.path.dirname(__file__), '..', 'output', 'banks')
+
+# puzzle and solution are Boards; difficulty is one of DIFFICULTIES or None
+BankEntry = namedtuple("BankEntry", ["puzzle", "solution", "difficulty"])
+
+
+# Default bank file for a box size
+def bank_path(box=3):
+    return os.path.join(DEFAULT_BANK_DIR, f"bank_{box}.sdk")
+
+
+def difficulty_code(difficulty):
+    return UNRATED if difficulty is None else DIFFICULTIES.index(difficulty)
+
+
+def difficulty_name(code):
+    return None if code == UNRATED else DIFFICULTIES[code]
+
+
+class PuzzleBank:
+    # Open the bank at path. A missing bank reads as empty; its file (for
+    # `box`) is only created by the first append.
+    def __init__(self, path=None, box=3):
+        self.path = path or bank_path(box)
+        self.index_path = self.path + ".idx"
+        self.lock = threading.Lock()
+        self.box = box
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                magic, self.box = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{self.path} is not a puzzle bank")
+        self.cells = self.box ** 4
+        self.record_size = 2 * self.cells + 1
+        self.mm = None
+        self.records = 0
+        # (clues, difficulty code) -> array of record numbers
+        self.buckets = {}
+        self.index_stamp = None
+        self.load_index()
+        # Records written after the index was last saved (an interrupted fill)
+        if os.path.exists(self.path):
+            complete = (os.path.getsize(self.path) - HEADER.size) // self.record_size
+            if complete > self.records:
+                self.index_records(self.records, complete)
+
+    def __len__(self):
+        return self.records
+
+    def offset(self, number):
+        return HEADER.size + number * self.record_size
+
+    # Read the saved index, if any, and remember which version of it we hold
+    def load_index(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                stamp = os.fstat(f.fileno()).st_mtime_ns
+                saved = pickle.load(f)
+        except FileNotFoundError:
+            return
+        self.records, self.buckets = saved["records"], saved["buckets"]
+        self.index_stamp = stamp
+
+    # Written to a temporary file and renamed, so readers never see half an index
+    def save_index(self):
+        temp = self.index_path + ".tmp"
+        with open(temp, "wb") as f:
+            pickle.dump({"records": self.records, "buckets": self.buckets}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, self.index_path)
+        self.index_stamp = os.stat(self.index_path).st_mtime_ns
+
+    # Add records first..last-1 of the file to the index
+    def index_records(self, first, last):
+        cells = self.cells
+        with open(self.path, "rb") as f:
+            f.seek(self.offset(first))
+            for number in range(first, last):
+                record = f.read(self.record_size)
+                clues = cells - record[:cells].count(0)
+                self.buckets.setdefault((clues, record[-1]), array("I")).append(number)
+        self.records = last
+        self.save_index()
+
+    # Pick up records another process added since the index was loaded
+    def refresh(self):
+        try:
+            stamp = os.stat(self.index_path).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if stamp != self.index_stamp:
+            self.load_index()
+
+    # Map the file again once it has grown past the current mapping
+    def view(self, end):
+        if self.mm is None or len(self.mm) < end:
+            if self.mm is not None:
+                self.mm.close()
+            with open(self.path, "rb") as f:
+                self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.mm
+
+    def read(self, number):
+        start = self.offset(number)
+        record = self.view(start + self.record_size)[start:start + self.record_size]
+        cells = self.cells
+        return BankEntry(Board(record[:cells]), Board(record[cells:2 * cells]), difficulty_name(record[-1]))
+
+    # Index buckets matching the criteria. clues is a count or an inclusive
+    # (low, high) range; difficulty is one of DIFFICULTIES; None matches anything.
+    def matching(self, clues=None, difficulty=None):
+        if isinstance(clues, int):
+            clues = (clues, clues)
+        code = None if difficulty is None else difficulty_code(difficulty)
+        return [numbers for (count, level), numbers in self.buckets.items()
+                if (clues is None or clues[0] <= count <= clues[1]) and (code is None or level == code)]
+
+    # Stored puzzles matching the criteria
+    def count(self, clues=None, difficulty=None):
+        with self.lock:
+            self.refresh()
+            return sum(len(numbers) for numbers in self.matching(clues, difficulty))
+
+    # Puzzles per (clues, difficulty), for reports
+    def counts(self):
+        with self.lock:
+            self.refresh()
+            return {(clues, difficulty_name(code)): len(numbers)
+                    for (clues, code), numbers in sorted(self.buckets.items())}
+
+    # A random stored puzzle matching the criteria (see matching), or None.
+    # Costs one pass over the index buckets (a few hundred at most) and one
+    # record read, whatever the size of the bank.
+    def draw(self, clues=None, difficulty=None, rng=random):
+        with self.lock:
+            self.refresh()
+            found = self.matching(clues, difficulty)
+            pick = rng.randrange(sum(len(numbers) for numbers in found) or 1)
+            for numbers in found:
+                if pick < len(numbers):
+                    return self.read(numbers[pick])
+                pick -= len(numbers)
+            return None
+
+    # Append (puzzle, solution, difficulty) triples and save the index.
+    # Records go right after the last indexed one, over any partial record an
+    # interrupted write left behind.
+    def append(self, entries):
+        cells = self.cells
+        with self.lock:
+            self.refresh()
+            number = self.records
+            if not os.path.exists(self.path):
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                with open(self.path, "wb") as f:
+                    f.write(HEADER.pack(MAGIC, self.box))
+            with open(self.path, "r+b") as f:
+                f.seek(self.offset(number))
+                for puzzle, solution, difficulty in entries:
+                    record = bytes(v for row in puzzle for v in row) + bytes(v for row in solution for v in row)
+                    if len(record) != 2 * cells:
+                        raise ValueError(f"bank holds {cells}-cell puzzles")
+                    code = difficulty_code(difficulty)
+                    f.write(record + bytes((code,)))
+                    clues = cells - record[:cells].count(0)
+                    self.buckets.setdefault((clues, code), array("I")).append(number)
+                    number += 1
+                f.truncate()
+            self.records = number
+            self.save_index()
+
+    def close(self):
+        with self.lock:
+            if self.mm is not None:
+                self.mm.close()
+                self.mm = None
+
+
+# Generate `count` puzzles of a difficulty (None: any) on a process pool and
+# append them to the bank in batches of `batch`; returns how many were added.
+# pool keeps generation out of this process even with one worker.
+def fill_bank(bank, count, difficulty=None, workers=None, seed=None, batch=100, pool=False):
+    added = 0
+    pending = []
+    for puzzle, rating in generate_graded_many(count, difficulty, box=bank.box, workers=workers, seed=seed,
+                                               pool=pool):
+        pending.append((puzzle, dlx_solve(clone(puzzle)), rating.difficulty))
+        if len(pending) == batch:
+            bank.append(pending)
+            added += len(pending)
+            pending = []
+    if pending:
+        bank.append(pending)
+        added += len(pending)
+    return added
+
+
+# Background job keeping at least `stock` puzzles of every listed difficulty in
+# the bank: it tops up the emptiest difficulty `batch` puzzles at a time, then
+# checks again every `interval` seconds (draws do not remove puzzles, so it only
+# works while the bank is short, or again after stock is raised). Puzzles are
+# always generated in worker processes, never on the refill thread, so a host
+# process such as a web server keeps its interpreter for requests.
+class BankRefill:
+    def __init__(self, bank, stock=100, difficulties=DIFFICULTIES, batch=20, workers=None, interval=30.0):
+        self.bank = bank
+        self.stock = stock
+        self.difficulties = list(difficulties)
+        self.batch = batch
+        self.workers = workers
+        self.interval = interval
+        self.added = 0
+        self.error = None
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="bank-refill", daemon=True)
+        self.thread.start()
+
+    # Difficulty with the fewest stored puzzles and how many it is short
+    def shortest(self):
+        shortfall = {difficulty: self.stock - self.bank.count(difficulty=difficulty)
+                     for difficulty in self.difficulties}
+        difficulty = max(shortfall, key=shortfall.get)
+        return difficulty, shortfall[difficulty]
+
+    def run(self):
+        try:
+            while not self.stopped.is_set():
+                difficulty, short = self.shortest()
+                if short <= 0:
+                    self.stopped.wait(self.interval)
+                    continue
+                self.added += fill_bank(self.bank, min(short, self.batch), difficulty, self.workers,
+                                        pool=True)
+        except Exception as e:
+            self.error = e
+
+    # Finish after the current batch
+    def stop(self):
+        self.stopped.set()
+
+    @property
+    def running(self):
+        return self.thread.is_alive()
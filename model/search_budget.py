@@ -0,0 +1,62 @@
+# model/search_budget.py
+# Opt-in limits on a single solve: a wall-clock deadline, a maximum number of
+# search nodes, and cancellation from another thread. Solvers call charge()
+# once per node, which is a counter and one comparison; the limits are only
+# looked at every `check_every` nodes (and exactly at max_nodes).
+# With budget=None the search pays a single `is not None` test per node.
+import time
+import threading
+
+
+# Raised inside the search when the budget runs out; solve entry points catch it
+class BudgetExceeded(Exception):
+    pass
+
+
+class SearchBudget:
+    __slots__ = ("deadline", "max_nodes", "check_every", "nodes", "next_check", "cancelled", "exceeded")
+
+    # timeout is in seconds from now; cancelled may be a shared threading.Event
+    def __init__(self, timeout=None, max_nodes=None, cancelled=None, check_every=128):
+        self.deadline = None if timeout is None else time.perf_counter() + timeout
+        self.max_nodes = max_nodes
+        self.check_every = check_every
+        self.nodes = 0
+        self.next_check = self.check_at()
+        self.cancelled = cancelled if cancelled is not None else threading.Event()
+        # Why the search stopped: "deadline", "nodes", "cancelled", or None
+        self.exceeded = None
+
+    # Ask the search to stop at its next check; safe to call from any thread
+    def cancel(self):
+        self.cancelled.set()
+
+    # Count one search node, raising BudgetExceeded once a limit is hit
+    def charge(self):
+        self.nodes += 1
+        if self.nodes >= self.next_check:
+            self.check()
+
+    # Test every limit now
+    def check(self):
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            self.stop("nodes")
+        if self.cancelled.is_set():
+            self.stop("cancelled")
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            self.stop("deadline")
+        self.next_check = self.check_at()
+
+    # Node count at which charge() next looks at the limits
+    def check_at(self):
+        at = self.nodes + self.check_every
+        if self.max_nodes is not None:
+            at = min(at, self.max_nodes + 1)
+        return at
+
+    def stop(self, reason):
+        self.exceeded = reason
+        raise BudgetExceeded(reason)
+
+    def __repr__(self):
+        return f"SearchBudget(nodes={self.nodes}, max_nodes={self.max_nodes}, exceeded={self.exceeded!r})"
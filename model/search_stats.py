@@ -0,0 +1,69 @@
+# model/search_stats.py
+# Opt-in counters describing how much work a solve did.
+# Solvers only touch a SearchStats when one is passed in; with stats=None
+# the search pays a single `is not None` test per node.
+
+
+class SearchStats:
+    __slots__ = ("nodes", "backtracks", "values_tried", "prunings", "cells_fixed",
+                 "max_depth", "depth_counts", "rule_hits", "preprocess_time", "search_time", "winner")
+
+    def __init__(self):
+        self.nodes = 0            # search nodes expanded
+        self.backtracks = 0       # assignments undone
+        self.values_tried = 0     # values taken from the ordered domain
+        self.prunings = 0         # domain values removed by inference
+        self.cells_fixed = 0      # cells decided by propagation before search
+        self.max_depth = 0
+        self.depth_counts = {}    # depth -> nodes expanded at that depth
+        self.rule_hits = {}       # technique name -> candidates it eliminated
+        self.preprocess_time = 0.0
+        self.search_time = 0.0
+        self.winner = None        # strategy whose answer a racing solver (Portfolio) kept
+
+    # Record a node expanded at `depth`
+    def enter(self, depth):
+        self.nodes += 1
+        self.depth_counts[depth] = self.depth_counts.get(depth, 0) + 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    # Add the work recorded by another SearchStats (e.g. from a parallel worker)
+    def merge(self, other):
+        self.nodes += other.nodes
+        self.backtracks += other.backtracks
+        self.values_tried += other.values_tried
+        self.prunings += other.prunings
+        self.cells_fixed += other.cells_fixed
+        self.max_depth = max(self.max_depth, other.max_depth)
+        for depth, count in other.depth_counts.items():
+            self.depth_counts[depth] = self.depth_counts.get(depth, 0) + count
+        for rule, count in other.rule_hits.items():
+            self.rule_hits[rule] = self.rule_hits.get(rule, 0) + count
+        self.preprocess_time += other.preprocess_time
+        self.search_time += other.search_time
+
+    # Depth histogram as a list indexed by depth
+    def depth_histogram(self):
+        return [self.depth_counts.get(d, 0) for d in range(self.max_depth + 1)]
+
+    def as_dict(self):
+        return {
+            "nodes": self.nodes,
+            "backtracks": self.backtracks,
+            "values_tried": self.values_tried,
+            "prunings": self.prunings,
+            "cells_fixed": self.cells_fixed,
+            "max_depth": self.max_depth,
+            "depth_histogram": self.depth_histogram(),
+            "rule_hits": dict(self.rule_hits),
+            "preprocess_time": self.preprocess_time,
+            "search_time": self.search_time,
+            "winner": self.winner,
+        }
+
+    def __repr__(self):
+        return (f"SearchStats(nodes={self.nodes}, backtracks={self.backtracks}, "
+                f"values_tried={self.values_tried}, prunings={self.prunings}, "
+                f"cells_fixed={self.cells_fixed}, max_depth={self.max_depth}, "
+                f"preprocess_time={self.preprocess_time:.6f}, search_time={self.search_time:.6f})")
@@ -0,0 +1,221 @@
+# model/solution_cache.py
+# Solution cache in front of solve_with_heuristics. Puzzles are keyed by their
+# exact 81-char string and by a canonical form under Sudoku symmetries
+# (digit relabeling, band/stack and row/column permutations, transposition),
+# so a relabeled or permuted repeat is answered from the stored solution and
+# mapped back into the caller's orientation.
+import time
+import threading
+from collections import OrderedDict
+from itertools import permutations, product
+from model.board import Board
+from model.backtracking_solver import solve_with_heuristics
+
+BOX = 3
+SIZE = BOX * BOX
+CELLS = SIZE * SIZE
+
+
+def to_cells(board):
+    return [v for row in board for v in row]
+
+
+def transpose(cells):
+    return [cells[c * SIZE + r] for r in range(SIZE) for c in range(SIZE)]
+
+
+# Every ordering of `items` that is sorted by key, permuting only tied items
+def tied_orders(items, key):
+    groups = []
+    for item in sorted(items, key=key):
+        if groups and key(groups[-1][0]) == key(item):
+            groups[-1].append(item)
+        else:
+            groups.append([item])
+    return [sum(choice, []) for choice in product(*[[list(p) for p in permutations(g)] for g in groups])]
+
+
+# Candidate row orders for a grid. Bands and rows are sorted by keys that do not
+# change under relabeling or column permutations; only ties are enumerated.
+def row_orders(cells):
+    def row_key(r):
+        segments = [sum(1 for c in range(s * BOX, s * BOX + BOX) if cells[r * SIZE + c]) for s in range(BOX)]
+        return (sum(segments), tuple(sorted(segments)))
+
+    def band_key(b):
+        rows = range(b * BOX, b * BOX + BOX)
+        boxes = [sum(1 for r in rows for c in range(s * BOX, s * BOX + BOX) if cells[r * SIZE + c])
+                 for s in range(BOX)]
+        return (tuple(sorted(row_key(r) for r in rows)), tuple(sorted(boxes)))
+
+    in_band = [tied_orders(range(b * BOX, b * BOX + BOX), row_key) for b in range(BOX)]
+    orders = []
+    for bands in tied_orders(range(BOX), band_key):
+        for rows in product(*[in_band[b] for b in bands]):
+            orders.append(sum(rows, []))
+    return orders
+
+
+# Apply row/column orders and relabel digits by first appearance.
+# Returns (canonical string, relabel list mapping original digit -> canonical digit).
+def relabeled(cells, rows, cols):
+    relabel = [0] * (SIZE + 1)
+    next_label = 1
+    out = []
+    for r in rows:
+        base = r * SIZE
+        for c in cols:
+            v = cells[base + c]
+            if v and not relabel[v]:
+                relabel[v] = next_label
+                next_label += 1
+            out.append(relabel[v])
+    # Digits missing from the puzzle take the remaining labels in order
+    for v in range(1, SIZE + 1):
+        if not relabel[v]:
+            relabel[v] = next_label
+            next_label += 1
+    return "".join(map(str, out)), relabel
+
+
+# Canonical key and the transform (transposed, rows, cols, relabel) producing it.
+# When ties allow more than `limit` orientations only the first of each is used;
+# the key is then still deterministic, just not shared with every equivalent puzzle.
+def canonical_form(cells, limit=64):
+    best = None
+    for transposed in (False, True):
+        grid = transpose(cells) if transposed else cells
+        rows = row_orders(grid)
+        cols = row_orders(transpose(grid))
+        if len(rows) * len(cols) > limit:
+            rows, cols = rows[:1], cols[:1]
+        for r in rows:
+            for c in cols:
+                key, relabel = relabeled(grid, r, c)
+                if best is None or key < best[0]:
+                    best = (key, (transposed, r, c, relabel))
+    return best
+
+
+# Map a canonical-orientation solution string back to the caller's cell list
+def restore(canonical_solution, transform):
+    transposed, rows, cols, relabel = transform
+    inverse = [0] * (SIZE + 1)
+    for digit, label in enumerate(relabel):
+        inverse[label] = digit
+    cells = [0] * CELLS
+    for i, r in enumerate(rows):
+        for j, c in enumerate(cols):
+            cells[r * SIZE + c] = inverse[int(canonical_solution[i * SIZE + j])]
+    return transpose(cells) if transposed else cells
+
+
+# Apply the forward transform to a solution so it can be stored canonically
+def canonicalize(cells, transform):
+    transposed, rows, cols, relabel = transform
+    grid = transpose(cells) if transposed else cells
+    return "".join(str(relabel[grid[r * SIZE + c]]) for r in rows for c in cols)
+
+
+# LRU cache of solutions with hit/miss counters and an optional SQLite tier.
+# Entries are keyed by the exact puzzle string and by its canonical form.
+# One cache may serve several threads (e.g. every session of a web app).
+class SolutionCache:
+    def __init__(self, maxsize=10000, path=None, canonical=True, limit=64):
+        self.maxsize = maxsize
+        self.canonical = canonical
+        self.limit = limit
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.canonical_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.db = None
+        self.lock = threading.Lock()
+        if path is not None:
+            # Imported here: only the disk tier needs it, and the CLI starts faster without it
+            import sqlite3
+            self.db = sqlite3.connect(path, check_same_thread=False)
+            self.db.execute("CREATE TABLE IF NOT EXISTS solutions (key TEXT PRIMARY KEY, solution TEXT)")
+
+    def lookup(self, key):
+        with self.lock:
+            return self.locked_lookup(key)
+
+    def locked_lookup(self, key):
+        solution = self.entries.get(key)
+        if solution is not None:
+            self.entries.move_to_end(key)
+            return solution
+        if self.db is not None:
+            row = self.db.execute("SELECT solution FROM solutions WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self.disk_hits += 1
+                self.locked_store(key, row[0], persist=False)
+                return row[0]
+        return None
+
+    def store(self, key, solution, persist=True):
+        with self.lock:
+            self.locked_store(key, solution, persist)
+
+    def locked_store(self, key, solution, persist=True):
+        self.entries[key] = solution
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        if persist and self.db is not None:
+            self.db.execute("INSERT OR REPLACE INTO solutions VALUES (?, ?)", (key, solution))
+            self.db.commit()
+
+    # Drop-in for solve_with_heuristics: returns (elapsed, solution) in the
+    # caller's board type. stats and budget only see the work of a miss; a hit
+    # leaves them untouched. Unsolvable puzzles and solves that ran out of
+    # budget are not cached; boards other than 9x9 are solved directly since
+    # keys are one digit per cell.
+    def solve(self, puzzle, method="Dancing Links (Algorithm X)", stats=None, budget=None):
+        if len(puzzle) != SIZE:
+            return solve_with_heuristics(puzzle, method=method, stats=stats, budget=budget)
+        start = time.perf_counter()
+        cells = to_cells(puzzle)
+        exact = "".join(map(str, cells))
+        solution = self.lookup(exact)
+        if solution is not None:
+            self.hits += 1
+            return time.perf_counter() - start, self.as_board(solution, puzzle)
+
+        form = None
+        if self.canonical:
+            key, transform = canonical_form(cells, self.limit)
+            form = ("c" + key, transform)
+            stored = self.lookup(form[0])
+            if stored is not None:
+                self.hits += 1
+                self.canonical_hits += 1
+                solution = "".join(map(str, restore(stored, transform)))
+                self.store(exact, solution)
+                return time.perf_counter() - start, self.as_board(solution, puzzle)
+
+        self.misses += 1
+        _, solved = solve_with_heuristics(puzzle, method=method, stats=stats, budget=budget)
+        if solved:
+            solved_cells = to_cells(solved)
+            self.store(exact, "".join(map(str, solved_cells)))
+            if form is not None:
+                self.store(form[0], canonicalize(solved_cells, form[1]))
+        return time.perf_counter() - start, solved
+
+    # Rebuild a solution string in the same board type the caller passed in
+    def as_board(self, solution, like):
+        if isinstance(like, Board):
+            return Board.from_string(solution)
+        return [[int(solution[r * SIZE + c]) for c in range(SIZE)] for r in range(SIZE)]
+
+    def info(self):
+        return {"hits": self.hits, "canonical_hits": self.canonical_hits, "disk_hits": self.disk_hits,
+                "misses": self.misses, "size": len(self.entries), "maxsize": self.maxsize}
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
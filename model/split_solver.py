@@ -0,0 +1,258 @@
+# model/split_solver.py
+# Parallel search on a single puzzle. The top of the search tree is expanded
+# breadth-first (fewest-candidates cell first, one child board per candidate)
+# until there are several subproblems per worker. The subproblems go into the
+# process pool's shared queue, so a worker that finishes early simply takes
+# the next one. The first solution cancels the rest; solution counts are summed.
+import os
+import time
+import atexit
+import threading
+import multiprocessing
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from model.backtracking_solver import solve_with_heuristics
+from model.dlx_solver import count_solutions
+from model.bitboard import BitBoard
+from model.board import clone
+from model.search_stats import SearchStats
+from model.search_budget import SearchBudget, BudgetExceeded
+
+# Subproblems created per worker; more gives better balance, fewer less overhead
+OVERSPLIT = 8
+# Nodes a worker takes from the shared node allowance at a time
+NODE_CHUNK = 256
+
+# solution is None when none was found; exceeded names the limit that stopped
+# the search, if any; subproblems is how many pieces the tree was split into
+SplitResult = namedtuple("SplitResult", ["elapsed", "solution", "subproblems", "stats", "exceeded"])
+
+# Cancel flag and node allowance inherited by every worker process
+CANCEL = None
+NODES_LEFT = None
+
+
+def init_worker(cancel, nodes_left):
+    global CANCEL, NODES_LEFT
+    CANCEL = cancel
+    NODES_LEFT = nodes_left
+
+
+# A budget whose node limit is shared by every subproblem of a solve. Nodes are
+# taken from the shared allowance NODE_CHUNK at a time and what a subproblem
+# leaves unused goes back, so all parts together search at most the allowance.
+# As in a single search, the part that runs out stops with "nodes" on the first
+# node past it; parts that start after that stop before their first node.
+class SharedNodeBudget(SearchBudget):
+    __slots__ = ("allowance", "claimed")
+
+    def __init__(self, allowance, timeout=None, cancelled=None):
+        self.allowance = allowance
+        self.claimed = 0
+        super().__init__(timeout=timeout, cancelled=cancelled)
+
+    def check(self):
+        if self.nodes > self.claimed or not self.claimed:
+            with self.allowance.get_lock():
+                take = min(NODE_CHUNK, self.allowance.value)
+                self.allowance.value -= take
+            self.claimed += take
+            if self.nodes > self.claimed or not self.claimed:
+                self.stop("nodes")
+        super().check()
+
+    def check_at(self):
+        return min(super().check_at(), self.claimed + 1)
+
+    # Hand back the claimed nodes this search did not use
+    def release(self):
+        unused = self.claimed - min(self.nodes, self.claimed)
+        if unused:
+            with self.allowance.get_lock():
+                self.allowance.value += unused
+        self.claimed -= unused
+
+
+# Worker entry point: search one subproblem with `method`. With limit_nodes the
+# search draws on the solve's shared node allowance.
+def solve_part(board, method, timeout=None, limit_nodes=False):
+    stats = SearchStats()
+    if limit_nodes:
+        budget = SharedNodeBudget(NODES_LEFT, timeout=timeout, cancelled=CANCEL)
+    else:
+        budget = SearchBudget(timeout=timeout, cancelled=CANCEL)
+    try:
+        _, solution = solve_with_heuristics(board, method=method, stats=stats, budget=budget)
+    finally:
+        if limit_nodes:
+            budget.release()
+    return solution, stats, budget.exceeded
+
+
+# Worker entry point: count the solutions of one subproblem (None when stopped early)
+def count_part(board, limit=None, timeout=None):
+    try:
+        return count_solutions(board, limit, SearchBudget(timeout=timeout, cancelled=CANCEL))
+    except BudgetExceeded:
+        return None
+
+
+# Expand the tree breadth-first until at least `target` open boards remain.
+# Returns (open boards, boards completed while splitting); dead ends are dropped.
+def split(puzzle, target):
+    frontier = deque([clone(puzzle)])
+    completed = []
+    while frontier and len(frontier) < target:
+        board = frontier.popleft()
+        bits = BitBoard(board)
+        if not bits.consistent:
+            continue
+        cells = bits.empty_cells()
+        if not cells:
+            completed.append(board)
+            continue
+        bit_count = bits.geo.bit_count
+        row, col = min(cells, key=lambda cell: bit_count[bits.candidates(cell[0], cell[1])])
+        for num in bits.geo.digits_of[bits.candidates(row, col)]:
+            child = clone(board)
+            child[row][col] = num
+            frontier.append(child)
+    return list(frontier), completed
+
+
+# A process pool kept alive between solves, with a cancel flag shared by every
+# worker's SearchBudget. Solves from several threads take turns.
+class SplitSolver:
+    def __init__(self, workers=None, oversplit=OVERSPLIT):
+        self.workers = workers or os.cpu_count() or 1
+        self.oversplit = oversplit
+        self.cancel = multiprocessing.Event()
+        self.nodes_left = multiprocessing.Value("q", 0)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                        initargs=(self.cancel, self.nodes_left))
+        self.stragglers = set()
+        self.lock = threading.Lock()
+
+    # Subproblems to aim for; with one worker splitting would only add work
+    def target(self):
+        return self.workers * self.oversplit if self.workers > 1 else 1
+
+    # Wait for the previous solve's cancelled work, then clear the flag
+    def reset(self):
+        if self.stragglers:
+            wait(self.stragglers)
+            self.stragglers = set()
+        self.cancel.clear()
+
+    # Stop everything still queued or running
+    def stop(self, pending):
+        self.cancel.set()
+        for future in pending:
+            future.cancel()
+        self.stragglers = {future for future in pending if not future.cancelled()}
+
+    # Find one solution, searching the subproblems with `method` in parallel.
+    # timeout bounds each subproblem; max_nodes bounds the nodes of all of them
+    # together. A budget passed in bounds the whole solve (its deadline also
+    # covers subproblems still queued) and can stop it from another thread.
+    def solve(self, puzzle, method="Backtracking + MRV", timeout=None, max_nodes=None, budget=None):
+        with self.lock:
+            start = time.perf_counter()
+            self.reset()
+            if budget is not None and budget.deadline is not None:
+                remaining = max(0.0, budget.deadline - start)
+                timeout = remaining if timeout is None else min(timeout, remaining)
+
+            parts, completed = split(puzzle, self.target())
+            stats = SearchStats()
+            if completed:
+                return SplitResult(time.perf_counter() - start, completed[0], len(parts), stats, None)
+
+            limit_nodes = max_nodes is not None
+            if limit_nodes:
+                self.nodes_left.value = max_nodes
+            pending = {self.pool.submit(solve_part, part, method, timeout, limit_nodes) for part in parts}
+            solution = exceeded = None
+            while pending and solution is None:
+                done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+                for future in done:
+                    part_solution, part_stats, part_exceeded = future.result()
+                    stats.merge(part_stats)
+                    if part_solution and solution is None:
+                        solution = part_solution
+                    elif part_exceeded:
+                        exceeded = part_exceeded
+                if solution is None and budget is not None:
+                    if budget.cancelled.is_set():
+                        exceeded = "cancelled"
+                        break
+                    if budget.deadline is not None and time.perf_counter() >= budget.deadline:
+                        exceeded = "deadline"
+                        break
+
+            self.stop(pending)
+            if solution is not None:
+                exceeded = None
+            return SplitResult(time.perf_counter() - start, solution, len(parts), stats, exceeded)
+
+    # Count solutions across all subproblems, stopping once `limit` is reached.
+    # Returns None if the timeout stopped any subproblem before the count was known.
+    def count(self, puzzle, limit=None, timeout=None):
+        with self.lock:
+            self.reset()
+            parts, completed = split(puzzle, self.target())
+            total = len(completed)
+            if limit is not None and total >= limit:
+                return limit
+            pending = {self.pool.submit(count_part, part, limit, timeout) for part in parts}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found = future.result()
+                    if found is None:
+                        self.stop(pending)
+                        return None
+                    total += found
+                if limit is not None and total >= limit:
+                    self.stop(pending)
+                    return limit
+            return total
+
+    def close(self):
+        self.cancel.set()
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+SHARED = None
+
+
+# Process-wide split solver used by solve_with_heuristics(method="Parallel ...")
+def shared_split_solver():
+    global SHARED
+    if SHARED is None:
+        SHARED = SplitSolver()
+        atexit.register(SHARED.close)
+    return SHARED
+
+
+# solve_with_heuristics backend for "Parallel <strategy>": the work of every
+# subproblem is merged into stats and charged to the budget, whose node limit
+# covers all subproblems together; a budget that runs out raises BudgetExceeded
+def split_solve(puzzle, method, stats=None, budget=None):
+    max_nodes = None
+    if budget is not None and budget.max_nodes is not None:
+        max_nodes = max(0, budget.max_nodes - budget.nodes)
+    result = shared_split_solver().solve(puzzle, method, max_nodes=max_nodes, budget=budget)
+    if stats is not None:
+        stats.merge(result.stats)
+    if budget is not None:
+        budget.nodes += result.stats.nodes
+        if result.solution is None and result.exceeded:
+            budget.stop(result.exceeded)
+    return result.solution
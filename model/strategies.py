@@ -0,0 +1,127 @@
+# model/strategies.py
+# Registry of solving strategies. A backtracking strategy declares its
+# components: variable ordering (select), value ordering (order) and the
+# inference run before the search. Its search function is compiled once from
+# them when it is registered, so nothing is decided by name while solving.
+# Other solvers (Dancing Links, Portfolio, Parallel ...) register a solver
+# function instead. Front ends list strategy_names() rather than keeping their
+# own lists, so a new combination only has to be registered here.
+import time
+from model.backtracking_solver import (prepare_search, compile_search, select_mrv, select_mrv_degree,
+                                       order_lcv, apply_forward_checking, apply_arc_consistency)
+from model.dlx_solver import dlx_solve
+from model.techniques import human_techniques
+
+# Inference pipelines; every strategy that keeps domains starts with forward checking
+FORWARD_CHECKING = (apply_forward_checking,)
+ARC_CONSISTENCY = (apply_forward_checking, apply_arc_consistency)
+# AC-3 and singles interleaved with every rule in model/techniques.py
+HUMAN_TECHNIQUES = (apply_forward_checking, human_techniques())
+
+PARALLEL_PREFIX = "Parallel "
+
+
+class Strategy:
+    # select / order default to row-major cells and ascending digits. Heuristics
+    # read the domains, so they need inference that keeps them live.
+    # solver(puzzle, stats, budget) replaces the backtracking search entirely;
+    # pooled marks solvers that run their own process pool.
+    def __init__(self, name, select=None, order=None, inference=(), solver=None, pooled=False):
+        if (select or order) and not inference:
+            raise ValueError(f"{name}: MRV, Degree and LCV need domains; add forward checking")
+        self.name = name
+        self.select = select
+        self.order = order
+        self.inference = tuple(inference)
+        self.solver = solver
+        self.pooled = pooled
+        # Domains are propagated at every assignment when inference set them up
+        self.maintain = bool(self.inference)
+        self.search = None if solver else compile_search(select, order, self.maintain)
+
+    # True for strategies that search with backtracking (and so can be paused
+    # by the iterative engine)
+    @property
+    def backtracking(self):
+        return self.solver is None
+
+    # Solve puzzle in place; returns the solved grid or None.
+    # A SearchBudget raises BudgetExceeded out of the search when it runs out.
+    def solve(self, puzzle, stats=None, budget=None):
+        if self.solver is not None:
+            return self.solver(puzzle, stats, budget)
+        prepared = prepare_search(puzzle, self, stats)
+        if prepared is None:
+            return None
+        bits, variables, domains, trail = prepared
+        if stats is None:
+            return self.search(bits, variables, domains, trail, None, 0, budget)
+        search_start = time.perf_counter()
+        try:
+            return self.search(bits, variables, domains, trail, stats, 0, budget)
+        finally:
+            stats.search_time += time.perf_counter() - search_start
+
+    def __repr__(self):
+        return f"Strategy({self.name!r})"
+
+
+STRATEGIES = {}
+
+
+# Add a strategy under its name, replacing any earlier one of that name
+def register(strategy):
+    STRATEGIES[strategy.name] = strategy
+    return strategy
+
+
+# Look up a strategy by name. "Parallel <name>" works for any registered
+# strategy without its own pool, even when that pairing is not registered itself.
+def get_strategy(name):
+    strategy = STRATEGIES.get(name)
+    if strategy is None and name.startswith(PARALLEL_PREFIX):
+        inner = get_strategy(name[len(PARALLEL_PREFIX):])
+        if not inner.pooled:
+            return parallel(inner)
+    if strategy is None:
+        raise ValueError(f"unknown strategy {name!r}")
+    return strategy
+
+
+# Registered names in registration order; pooled=False leaves out the strategies
+# that run their own process pool (True keeps only those)
+def strategy_names(pooled=None):
+    return [name for name, strategy in STRATEGIES.items() if pooled is None or strategy.pooled == pooled]
+
+
+def solve_dlx(puzzle, stats=None, budget=None):
+    return dlx_solve(puzzle, stats=stats, budget=budget)
+
+
+# Imported when used: the portfolio races solve_with_heuristics itself
+def solve_portfolio(puzzle, stats=None, budget=None):
+    from model.portfolio_solver import portfolio_solve
+    return portfolio_solve(puzzle, stats=stats, budget=budget)
+
+
+# The same search split over a process pool (see model/split_solver.py)
+def parallel(strategy):
+    def solve_split(puzzle, stats=None, budget=None):
+        from model.split_solver import split_solve
+        return split_solve(puzzle, strategy.name, stats=stats, budget=budget)
+    return Strategy(PARALLEL_PREFIX + strategy.name, solver=solve_split, pooled=True)
+
+
+register(Strategy("Backtracking"))
+register(Strategy("Backtracking + Forward Checking", inference=FORWARD_CHECKING))
+register(Strategy("Backtracking + Arc Consistency", inference=ARC_CONSISTENCY))
+register(Strategy("Backtracking + MRV", select=select_mrv, inference=FORWARD_CHECKING))
+register(Strategy("Backtracking + MRV + LCV + Degree", select=select_mrv_degree, order=order_lcv,
+                  inference=FORWARD_CHECKING))
+register(Strategy("Backtracking + MRV + Arc Consistency", select=select_mrv, inference=ARC_CONSISTENCY))
+register(Strategy("Backtracking + LCV + Forward Checking", order=order_lcv, inference=FORWARD_CHECKING))
+register(Strategy("Backtracking + Human Techniques", inference=HUMAN_TECHNIQUES))
+register(Strategy("Backtracking + MRV + Human Techniques", select=select_mrv, inference=HUMAN_TECHNIQUES))
+register(Strategy("Dancing Links (Algorithm X)", solver=solve_dlx))
+register(Strategy("Portfolio", solver=solve_portfolio, pooled=True))
+register(parallel(STRATEGIES["Backtracking + MRV"]))
@@ -1,51 +1,289 @@
+import os
 import random
-import copy
+from collections import namedtuple
+from model.bitboard import BitBoard, box_size
+from model.board import clone
+from model.dlx_solver import count_solutions
+from model.techniques import grade
+from model.backtracking_solver import solve_with_heuristics
+from model.search_stats import SearchStats
 
-# 1. Create empty board
-def create_empty_board():
-    return [[0 for _ in range(9)] for _ in range(9)]
+# Difficulty bands, easiest first:
+#   easy   - singles alone solve it
+#   medium - needs pairs/triples, pointing, box-line or X-Wing, but no guessing
+#   hard   - logic runs out; the reference solver backtracks fewer than
+#            EXPERT_BACKTRACKS times
+#   expert - logic runs out and the reference solver backtracks more
+DIFFICULTIES = ["easy", "medium", "hard", "expert"]
+# Median backtracks of the reference solver over the unique puzzles that need
+# guessing (hard17 plus 150 seeded minimal puzzles): splits hard and expert evenly
+EXPERT_BACKTRACKS = 20
+# Search effort is this strategy's backtracks. It runs the same rules as the
+# grading, so puzzles that logic solves cost none and the bands rise with effort.
+REFERENCE_STRATEGY = "Backtracking + MRV + Human Techniques"
+
+# difficulty is one of DIFFICULTIES, effort the reference solver's backtracks,
+# nodes its search nodes, hits the eliminations per technique
+# (see model/techniques.py), clues the givens
+Rating = namedtuple("Rating", ["difficulty", "effort", "nodes", "hits", "clues"])
+
+# 1. Create empty board (box=3 is the classic 9x9, box=4 gives 16x16, ...)
+def create_empty_board(box=3):
+    size = box * box
+    return [[0 for _ in range(size)] for _ in range(size)]
 
 # 2. Check if a number can be placed
 def is_valid(board, row, col, num):
-    for i in range(9):
+    size = len(board)
+    box = box_size(board)
+    for i in range(size):
         if board[row][i] == num or board[i][col] == num:
             return False
-    start_row, start_col = 3 * (row // 3), 3 * (col // 3)
-    for i in range(3):
-        for j in range(3):
+    start_row, start_col = box * (row // box), box * (col // box)
+    for i in range(box):
+        for j in range(box):
             if board[start_row+i][start_col+j] == num:
                 return False
     return True
 
-# 3. Solver to fill board (backtracking)
-def solve_board(board):
-    for row in range(9):
-        for col in range(9):
-            if board[row][col] == 0:
-                nums = list(range(1, 10))
-                random.shuffle(nums)
-                for num in nums:
-                    if is_valid(board, row, col, num):
-                        board[row][col] = num
-                        if solve_board(board):
-                            return True
-                        board[row][col] = 0 #backtrack
-                return False
-    return True # All cells are filled successfully
+# 3. Solver to fill board (randomized backtracking on occupancy bitmasks)
+# Pass a seeded random.Random as rng for reproducible grids.
+def solve_board(board, rng=random):
+    bits = BitBoard(board)
+    if not bits.consistent:
+        return False
+    return fill_cells(bits, bits.empty_cells(), 0, rng)
+
+# Try shuffled candidates for cells[index], then recurse on the next empty cell
+def fill_cells(bits, cells, index, rng=random):
+    if index == len(cells):
+        return True # All cells are filled successfully
+    row, col = cells[index]
+    nums = bits.geo.digits_of[bits.candidates(row, col)][:]
+    rng.shuffle(nums)
+    for num in nums:
+        bits.place(row, col, num)
+        if fill_cells(bits, cells, index + 1, rng):
+            return True
+        bits.remove(row, col) #backtrack
+    return False
+
+# Holes for a typical puzzle: 40 on 9x9, about 40% of the cells on other sizes
+# (half-empty 25x25 boards send row-order search into very long runs)
+def default_holes(box=3):
+    return 40 if box == 3 else box ** 4 * 2 // 5
 
 # 4. Generate puzzle by removing K cells
 # Generate a Sudoku puzzle by first creating a full board,
-# then removing a specified number of cells (default: 40)
-def generate_puzzle(removed_cells=40):
-    board = create_empty_board()
-    solve_board(board)  # Now board is fully filled
-    puzzle = copy.deepcopy(board)
+# then removing a specified number of cells (default: 40).
+# With unique=True a clue is only removed if the puzzle keeps exactly one
+# solution; removed_cells=None then digs until no clue can go (a minimal puzzle)
+# and is a ValueError without unique=True.
+# symmetric=True removes cells in pairs mirrored through the centre.
+# Pass a GridFactory as factory to skip building the full grid by search.
+# box sets the board size (3 -> 9x9, 4 -> 16x16, 5 -> 25x25).
+# Pass a seeded random.Random as rng for reproducible puzzles.
+# With a PuzzleBank (model/puzzle_bank.py) as bank, a stored puzzle with at
+# least removed_cells holes (and of the given difficulty, see DIFFICULTIES) is
+# drawn in O(1) instead; bank puzzles are unique and never symmetric-only.
+# Nothing is generated unless the bank has no match. A difficulty without a
+# bank match is generated by generate_graded, which digs as far as the band
+# allows: removed_cells and unique do not apply, and ValueError is raised when
+# no grid reaches the band.
+def generate_puzzle(removed_cells=40, unique=False, symmetric=False, factory=None, box=3, rng=random,
+                    bank=None, difficulty=None):
+    if removed_cells is None and not unique and difficulty is None:
+        raise ValueError("removed_cells=None digs as far as uniqueness allows; pass unique=True")
+    if bank is not None and bank.box == box and not symmetric:
+        clues = None if removed_cells is None else (0, box ** 4 - removed_cells)
+        entry = bank.draw(clues, difficulty, rng)
+        if entry is not None:
+            return entry.puzzle.to_rows()
+    if difficulty is not None:
+        found = generate_graded(difficulty, box=box, symmetric=symmetric, rng=rng)
+        if found is None:
+            raise ValueError(f"no {difficulty} puzzle found; try again or fill a puzzle bank")
+        return found[0]
+    if factory is None and box >= 5:
+        # Imported here: grid_factory builds on this module
+        from model.grid_factory import GridFactory
+        factory = GridFactory(seed=rng.random(), box=box)
+    if factory is not None:
+        board = factory.make_grid()
+    else:
+        board = create_empty_board(box)
+        solve_board(board, rng)  # Now board is fully filled
+    if unique:
+        return dig_unique(board, removed_cells, symmetric, rng)
+    puzzle = clone(board)
+    last = len(puzzle) - 1
+    removed_cells = min(removed_cells, len(puzzle) ** 2)
 
     count = 0
     while count < removed_cells:
-        row = random.randint(0, 8)
-        col = random.randint(0, 8)
+        row = rng.randint(0, last)
+        col = rng.randint(0, last)
         if puzzle[row][col] != 0:
             puzzle[row][col] = 0
             count += 1
+            if symmetric and count < removed_cells and puzzle[last - row][last - col] != 0:
+                puzzle[last - row][last - col] = 0
+                count += 1
+    return puzzle
+
+# 5. Check that a puzzle has exactly one solution.
+# The solution counter stops as soon as it sees a second one.
+def has_unique_solution(puzzle):
+    return count_solutions(puzzle, limit=2) == 1
+
+# 6. Remove clues from a full board in random order, keeping every removal
+# that leaves a unique solution, until `removed_cells` are gone or none can go
+def dig_unique(board, removed_cells=None, symmetric=False, rng=random):
+    puzzle = clone(board)
+    size = len(puzzle)
+    last = size - 1
+    limit = size * size if removed_cells is None else removed_cells
+    cells = [(r, c) for r in range(size) for c in range(size)]
+    rng.shuffle(cells)
+
+    count = 0
+    for row, col in cells:
+        if count >= limit:
+            break
+        group = {(row, col)}
+        if symmetric:
+            group.add((last - row, last - col))
+        group = [(r, c) for r, c in group if puzzle[r][c] != 0]
+        if not group or count + len(group) > limit:
+            continue
+        for r, c in group:
+            puzzle[r][c] = 0
+        if has_unique_solution(puzzle):
+            count += len(group)
+        else:
+            for r, c in group:
+                puzzle[r][c] = board[r][c]
     return puzzle
+
+# 7. Grade a puzzle (which should have a unique solution) by the deduction
+# techniques it needs and the search effort of the reference solver
+def rate_puzzle(puzzle):
+    stats = SearchStats()
+    solve_with_heuristics(puzzle, REFERENCE_STRATEGY, stats)
+    clues = sum(1 for row in puzzle for v in row if v)
+    if grade(puzzle, rules=()).open_cells == 0:
+        return Rating("easy", stats.backtracks, stats.nodes, {}, clues)
+    graded = grade(puzzle)
+    if graded.open_cells == 0:
+        difficulty = "medium"
+    else:
+        difficulty = "hard" if stats.backtracks < EXPERT_BACKTRACKS else "expert"
+    return Rating(difficulty, stats.backtracks, stats.nodes, dict(graded.hits), clues)
+
+# How a rating compares with the target: -1 too easy, 0 on target, 1 too hard
+def compare_rating(rating, difficulty=None, min_effort=None, max_effort=None):
+    if difficulty is not None:
+        gap = DIFFICULTIES.index(rating.difficulty) - DIFFICULTIES.index(difficulty)
+        if gap:
+            return 1 if gap > 0 else -1
+    if min_effort is not None and rating.effort < min_effort:
+        return -1
+    if max_effort is not None and rating.effort > max_effort:
+        return 1
+    return 0
+
+# 8. Generate a unique puzzle in a difficulty band and/or reference-solver
+# backtrack range. Clues are dug out one by one as in dig_unique; a removal
+# that makes the puzzle harder than the target is undone, so the puzzle ends as
+# sparse as the target allows. A full grid whose sparsest puzzle is still too easy is
+# rejected and another is tried, up to `attempts` grids.
+# Returns (puzzle, Rating), or None when no grid hit the target.
+def generate_graded(difficulty=None, min_effort=None, max_effort=None, box=3, symmetric=False,
+                    rng=random, attempts=50):
+    if difficulty is not None and difficulty not in DIFFICULTIES:
+        raise ValueError(f"unknown difficulty {difficulty!r}; expected one of {', '.join(DIFFICULTIES)}")
+    factory = None
+    if box >= 5:
+        from model.grid_factory import GridFactory
+        factory = GridFactory(seed=rng.random(), box=box)
+    for _ in range(attempts):
+        if factory is not None:
+            board = factory.make_grid()
+        else:
+            board = create_empty_board(box)
+            solve_board(board, rng)
+        found = dig_to_target(board, difficulty, min_effort, max_effort, symmetric, rng)
+        if found is not None:
+            return found
+    return None
+
+# Dig clues from a full board towards the target; (puzzle, Rating) or None
+def dig_to_target(board, difficulty, min_effort, max_effort, symmetric, rng):
+    puzzle = clone(board)
+    size = len(puzzle)
+    last = size - 1
+    cells = [(r, c) for r in range(size) for c in range(size)]
+    rng.shuffle(cells)
+
+    best = None
+    for row, col in cells:
+        group = {(row, col), (last - row, last - col)} if symmetric else {(row, col)}
+        group = [(r, c) for r, c in group if puzzle[r][c] != 0]
+        if not group:
+            continue
+        for r, c in group:
+            puzzle[r][c] = 0
+        if has_unique_solution(puzzle):
+            rating = rate_puzzle(puzzle)
+            verdict = compare_rating(rating, difficulty, min_effort, max_effort)
+            if verdict <= 0:
+                if verdict == 0:
+                    best = (clone(puzzle), rating)
+                continue
+        for r, c in group:
+            puzzle[r][c] = board[r][c]
+    return best
+
+# Worker entry point: one graded puzzle from its own seed
+def graded_task(seed, difficulty, min_effort, max_effort, box, symmetric, attempts):
+    return generate_graded(difficulty, min_effort, max_effort, box, symmetric, random.Random(seed), attempts)
+
+# 9. Generate `count` graded puzzles on a process pool (workers=None: one per
+# core), yielding (puzzle, Rating) as they finish. Task i draws from seed + i,
+# so every task of a seeded run is reproducible; a pool yields in completion order.
+# Tasks that find nothing within `attempts` grids are retried with new seeds.
+# A single worker runs in the calling process unless pool is set, which keeps
+# even one worker in its own process (for callers that must stay responsive).
+def generate_graded_many(count, difficulty=None, min_effort=None, max_effort=None, box=3, symmetric=False,
+                         workers=None, seed=None, attempts=50, pool=False):
+    # Imported here: the pool is only needed for batch generation
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+    workers = workers or os.cpu_count() or 1
+    base = random.randrange(2 ** 32) if seed is None else seed
+    args = (difficulty, min_effort, max_effort, box, symmetric, attempts)
+    if workers == 1 and not pool:
+        task = 0
+        while count > 0:
+            found = graded_task(base + task, *args)
+            task += 1
+            if found is not None:
+                count -= 1
+                yield found
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        task = 0
+        pending = set()
+        while count > 0:
+            while len(pending) < min(count, 2 * workers):
+                pending.add(executor.submit(graded_task, base + task, *args))
+                task += 1
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                found = future.result()
+                if found is not None and count > 0:
+                    count -= 1
+                    yield found
+        for future in pending:
+            future.cancel()
+
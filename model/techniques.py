@@ -0,0 +1,258 @@
+# model/techniques.py
+# Human solving techniques as candidate eliminations: naked and hidden pairs
+# and triples, pointing pairs, box-line reduction and X-Wing. Each rule takes
+# the board geometry and the open cells' domains, removes candidates in place
+# and returns how many it removed. apply_techniques alternates them with AC-3
+# and singles (model/propagation.py) until nothing changes, counting the
+# eliminations of every rule; those counts also grade a puzzle's difficulty.
+from collections import Counter, namedtuple
+from itertools import combinations
+from model.propagation import propagate
+from model.bitboard import BitBoard
+from model.board import clone
+
+
+# Open cells of a unit
+def open_cells(unit, domains):
+    return [var for var in unit if var in domains]
+
+
+# Remove the digits in mask from var's domain; returns how many went
+def eliminate(domains, var, mask, bit_count):
+    common = domains[var] & mask
+    if not common:
+        return 0
+    domains[var] &= ~mask
+    return bit_count[common]
+
+
+# k cells of a unit whose candidates together are only k digits: no other cell
+# of the unit can take those digits
+def naked_subsets(geo, domains, k):
+    bit_count = geo.bit_count
+    removed = 0
+    for unit in geo.units:
+        cells = open_cells(unit, domains)
+        if len(cells) <= k:
+            continue
+        small = [var for var in cells if bit_count[domains[var]] <= k]
+        for group in combinations(small, k):
+            mask = 0
+            for var in group:
+                mask |= domains[var]
+            if bit_count[mask] != k:
+                continue
+            found = sum(eliminate(domains, var, mask, bit_count) for var in cells if var not in group)
+            if found:
+                # Domains changed under `small`; the next pass rescans this unit
+                removed += found
+                break
+    return removed
+
+
+# k digits that fit only in the same k cells of a unit: those cells can hold
+# nothing else
+def hidden_subsets(geo, domains, k):
+    bit_count = geo.bit_count
+    digits_of = geo.digits_of
+    removed = 0
+    for unit in geo.units:
+        cells = open_cells(unit, domains)
+        if len(cells) <= k:
+            continue
+        # Positions of every digit among the unit's open cells, as a bitmask
+        where = {}
+        for i, var in enumerate(cells):
+            for digit in digits_of[domains[var]]:
+                where[digit] = where.get(digit, 0) | 1 << i
+        few = [digit for digit, positions in where.items() if bit_count[positions] <= k]
+        for group in combinations(few, k):
+            positions = 0
+            keep = 0
+            for digit in group:
+                positions |= where[digit]
+                keep |= 1 << (digit - 1)
+            if bit_count[positions] != k:
+                continue
+            found = sum(eliminate(domains, cells[i], ~keep, bit_count)
+                        for i in range(len(cells)) if positions >> i & 1)
+            if found:
+                removed += found
+                break
+    return removed
+
+
+def naked_pairs(geo, domains):
+    return naked_subsets(geo, domains, 2)
+
+
+def naked_triples(geo, domains):
+    return naked_subsets(geo, domains, 3)
+
+
+def hidden_pairs(geo, domains):
+    return hidden_subsets(geo, domains, 2)
+
+
+def hidden_triples(geo, domains):
+    return hidden_subsets(geo, domains, 3)
+
+
+# Pointing: a digit whose candidates in a box all lie on one row (or column)
+# must go there, so the rest of that row (column) loses it
+def pointing_pairs(geo, domains):
+    box, size, bit_count = geo.box, geo.size, geo.bit_count
+    removed = 0
+    for b in range(size):
+        top, left = box * (b // box), box * (b % box)
+        for across in (True, False):
+            # Candidates of each of the box's rows (across) or columns
+            lines = []
+            for i in range(box):
+                mask = 0
+                for j in range(box):
+                    var = (top + i, left + j) if across else (top + j, left + i)
+                    mask |= domains.get(var, 0)
+                lines.append(mask)
+            for i in range(box):
+                others = 0
+                for j in range(box):
+                    if j != i:
+                        others |= lines[j]
+                only = lines[i] & ~others
+                if not only:
+                    continue
+                for k in range(size):
+                    var = (top + i, k) if across else (k, left + i)
+                    inside = left <= k < left + box if across else top <= k < top + box
+                    if not inside and var in domains:
+                        removed += eliminate(domains, var, only, bit_count)
+    return removed
+
+
+# Box-line reduction: a digit whose candidates in a row (or column) all lie in
+# one box must go there, so the rest of that box loses it
+def box_line_reduction(geo, domains):
+    box, size, bit_count = geo.box, geo.size, geo.bit_count
+    removed = 0
+    for line in range(size):
+        for across in (True, False):
+            # Candidates of the line's cells in each box it crosses
+            segments = []
+            for s in range(box):
+                mask = 0
+                for k in range(s * box, (s + 1) * box):
+                    mask |= domains.get((line, k) if across else (k, line), 0)
+                segments.append(mask)
+            for s in range(box):
+                others = 0
+                for t in range(box):
+                    if t != s:
+                        others |= segments[t]
+                only = segments[s] & ~others
+                if not only:
+                    continue
+                first = box * (line // box)
+                for i in range(first, first + box):
+                    if i == line:
+                        continue
+                    for k in range(s * box, (s + 1) * box):
+                        var = (i, k) if across else (k, i)
+                        if var in domains:
+                            removed += eliminate(domains, var, only, bit_count)
+    return removed
+
+
+# X-Wing: when a digit fits in exactly the same two columns of two rows, one of
+# each pair of crossings holds it, so those columns lose it in every other row
+# (and the same with rows and columns swapped)
+def x_wing(geo, domains):
+    size, bit_count = geo.size, geo.bit_count
+    removed = 0
+    for digit in range(size):
+        bit = 1 << digit
+        for across in (True, False):
+            # Lines in which the digit has exactly two places, keyed by those places
+            pairs = {}
+            for line in range(size):
+                places = 0
+                for k in range(size):
+                    if domains.get((line, k) if across else (k, line), 0) & bit:
+                        places |= 1 << k
+                if bit_count[places] == 2:
+                    pairs.setdefault(places, []).append(line)
+            for places, lines in pairs.items():
+                if len(lines) != 2:
+                    continue
+                for k in range(size):
+                    if not places >> k & 1:
+                        continue
+                    for line in range(size):
+                        var = (line, k) if across else (k, line)
+                        if line not in lines and var in domains:
+                            removed += eliminate(domains, var, bit, bit_count)
+    return removed
+
+
+# Every rule by name, simplest first; apply_techniques goes back to the start
+# of this order after any rule makes progress
+RULES = {
+    "Naked Pairs": naked_pairs,
+    "Hidden Pairs": hidden_pairs,
+    "Pointing Pairs": pointing_pairs,
+    "Box-Line Reduction": box_line_reduction,
+    "Naked Triples": naked_triples,
+    "Hidden Triples": hidden_triples,
+    "X-Wing": x_wing,
+}
+
+DEFAULT_RULES = tuple(RULES)
+
+
+# Propagate to a fixed point with AC-3, singles and the named rules. Decided
+# cells are placed on the board and removed from `domains`, as in propagate().
+# hits (a Counter or dict) receives the eliminations of every rule that fired.
+# Returns the number of cells fixed, or None if the puzzle is contradictory.
+def apply_techniques(bits, domains, rules=DEFAULT_RULES, hits=None):
+    rules = [(name, RULES[name]) for name in rules]
+    fixed = 0
+    while True:
+        found = propagate(bits, domains)
+        if found is None:
+            return None
+        fixed += found
+        for name, rule in rules:
+            removed = rule(bits.geo, domains)
+            if removed:
+                if hits is not None:
+                    hits[name] = hits.get(name, 0) + removed
+                break
+        else:
+            return fixed
+
+
+# Inference step for a strategy's pipeline (see model/strategies.py) running the
+# named rules; the eliminations are added to stats.rule_hits
+def human_techniques(rules=DEFAULT_RULES):
+    def apply_human_techniques(bits, domains, stats=None):
+        return apply_techniques(bits, domains, rules, None if stats is None else stats.rule_hits)
+    return apply_human_techniques
+
+
+# hits: eliminations per rule; open_cells: cells still undecided when logic ran
+# out (0 means the rules solve the puzzle without guessing, None a contradiction);
+# singles: cells decided by singles and AC-3 along the way
+Grading = namedtuple("Grading", ["hits", "open_cells", "singles"])
+
+
+# Solve as far as pure logic goes, for difficulty grading
+def grade(puzzle, rules=DEFAULT_RULES):
+    bits = BitBoard(clone(puzzle))
+    hits = Counter()
+    if not bits.consistent:
+        return Grading(hits, None, 0)
+    domains = {var: bits.all_digits for var in bits.empty_cells()}
+    fixed = apply_techniques(bits, domains, rules, hits)
+    if fixed is None:
+        return Grading(hits, None, 0)
+    return Grading(hits, len(domains), fixed)
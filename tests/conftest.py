@@ -0,0 +1,31 @@
+# tests/conftest.py
+# Lets the tests import model/, utils/, controller/ and view/ from the repo root,
+# and provides the check every solver test shares
+import sys
+import os
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from model.bitboard import box_size
+
+
+# True when solution is a complete, valid grid that keeps every given of puzzle
+def solves(puzzle, solution):
+    if solution is None:
+        return False
+    size = len(puzzle)
+    box = box_size(puzzle)
+    digits = set(range(1, size + 1))
+    rows = [[solution[r][c] for c in range(size)] for r in range(size)]
+    if any(puzzle[r][c] and puzzle[r][c] != rows[r][c] for r in range(size) for c in range(size)):
+        return False
+    units = rows + [list(col) for col in zip(*rows)]
+    units += [[rows[r][c] for r in range(top, top + box) for c in range(left, left + box)]
+              for top in range(0, size, box) for left in range(0, size, box)]
+    return all(set(unit) == digits for unit in units)
+
+
+@pytest.fixture
+def is_solution():
+    return solves
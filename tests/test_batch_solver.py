@@ -0,0 +1,42 @@
+# tests/test_batch_solver.py
+import numpy as np
+from model.board import clone
+from model.dlx_solver import dlx_solve
+from model.batch_solver import solve_batch, propagate_singles
+from controller.benchmark_suite import load_corpus
+
+
+def test_batch_matches_one_at_a_time(is_solution):
+    puzzles = load_corpus("easy")[:20] + load_corpus("generated40")[:10] + load_corpus("hard17")[:5]
+    boards, solved = solve_batch(puzzles)
+    assert solved.all()
+    for puzzle, board in zip(puzzles, boards.tolist()):
+        assert is_solution(puzzle, board)
+        assert board == dlx_solve(clone(puzzle))
+
+
+def test_broken_boards_come_back_unsolved():
+    repeated = [[0] * 9 for _ in range(9)]
+    repeated[0][0] = repeated[0][8] = 5
+    stuck = [[0] * 9 for _ in range(9)]
+    stuck[0][1:] = range(1, 9)
+    stuck[1][1] = 9
+    good = load_corpus("easy")[0]
+    boards, solved = solve_batch([repeated, stuck, good])
+    assert solved.tolist() == [False, False, True]
+    assert boards[0].tolist() == repeated and boards[1].tolist() == stuck
+
+
+def test_singles_only_place_true_digits():
+    puzzles = load_corpus("generated40")[:10]
+    boards, broken = propagate_singles(np.asarray(puzzles, dtype=np.int8))
+    assert not broken.any()
+    for puzzle, board in zip(puzzles, boards.tolist()):
+        solution = dlx_solve(clone(puzzle))
+        assert all(board[r][c] in (0, solution[r][c]) for r in range(9) for c in range(9))
+
+
+def test_four_by_four_stack(is_solution):
+    puzzle = [[1, 0, 0, 0], [0, 0, 3, 0], [0, 4, 0, 0], [0, 0, 0, 2]]
+    boards, solved = solve_batch([puzzle, puzzle])
+    assert solved.all() and is_solution(puzzle, boards[0].tolist())
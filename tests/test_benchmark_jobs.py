@@ -0,0 +1,32 @@
+# tests/test_benchmark_jobs.py
+from model.backtracking_solver import solve_with_heuristics
+from model.search_stats import SearchStats
+from controller.benchmark_jobs import BenchmarkRunner, summarize
+from controller.benchmark_suite import load_corpus
+
+METHOD = "Backtracking + MRV"
+
+
+def test_job_results_match_direct_solves(is_solution):
+    puzzles = load_corpus("generated40")[:6]
+    runner = BenchmarkRunner(workers=1)
+    job = runner.submit(("generated40", METHOD), METHOD, puzzles)
+    assert runner.submit(("generated40", METHOD), METHOD, []) is job
+    assert runner.get(("generated40", METHOD)) is job and runner.get("other") is None
+    assert job.done.wait(60) and job.error is None
+    assert job.progress() == 1.0 and len(job.results) == 6
+
+    expected_nodes = 0
+    for puzzle in puzzles:
+        stats = SearchStats()
+        solve_with_heuristics(puzzle, METHOD, stats=stats)
+        expected_nodes += stats.nodes
+    assert all(is_solution(puzzles[r.index], r.solution) for r in job.results)
+    summary = job.summary()
+    assert summary["Runs"] == summary["Solved"] == 6 and summary["Timeouts"] == 0
+    assert summary["Average Nodes"] == round(expected_nodes / 6)
+    assert summary["Min Time"] <= summary["Average Time"] <= summary["Max Time"]
+
+
+def test_empty_summary():
+    assert summarize([]) is None
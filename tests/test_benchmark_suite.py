@@ -0,0 +1,44 @@
+# tests/test_benchmark_suite.py
+from controller import benchmark_suite
+from controller.benchmark_suite import find_regressions, run_corpus, load_corpus
+
+
+def row(p50=0.010, p90=0.020, mean_nodes=100.0, timeouts=0):
+    return {"puzzles": 10, "timeouts": timeouts, "p50": p50, "p90": p90, "p99": p90, "max": p90,
+            "mean_nodes": mean_nodes, "max_nodes": mean_nodes}
+
+
+def compare(new, old):
+    return [r[2] for r in find_regressions({"easy": {"m": new}}, {"easy": {"m": old}}, threshold=0.10)]
+
+
+def test_times_use_the_threshold():
+    assert compare(row(p50=0.0105), row()) == []
+    assert compare(row(p50=0.012, p90=0.025), row()) == ["p50", "p90"]
+
+
+def test_node_counts_compare_exactly():
+    assert compare(row(mean_nodes=101.0), row()) == ["mean_nodes"]
+    assert compare(row(mean_nodes=90.0), row()) == []
+    assert compare(row(timeouts=1), row()) == ["timeouts"]
+
+
+def test_a_timeout_in_any_repetition_is_a_timeout(monkeypatch):
+    calls = []
+    real = benchmark_suite.timed_solve
+
+    # The second repetition of every puzzle times out
+    def flaky(puzzle, method, timeout=None):
+        calls.append(puzzle)
+        if len(calls) % 3 == 2:
+            return None, None
+        return real(puzzle, method, timeout)
+
+    monkeypatch.setattr(benchmark_suite, "timed_solve", flaky)
+    result = run_corpus("Dancing Links (Algorithm X)", load_corpus("easy")[:2], warmup=0, repeat=3)
+    assert result["timeouts"] == 2 and result["p50"] is None
+
+
+def test_easy_corpus_runs_without_timeouts():
+    result = run_corpus("Backtracking + MRV", load_corpus("easy")[:5], warmup=0, repeat=1)
+    assert result["timeouts"] == 0 and result["mean_nodes"] > 0
@@ -0,0 +1,46 @@
+# tests/test_bitboard.py
+from model.board import clone
+from model.bitboard import BitBoard, geometry
+from model.sudoku_generator import is_valid
+from controller.benchmark_suite import load_corpus
+
+
+def test_candidates_match_a_unit_scan():
+    for puzzle in load_corpus("easy")[:5]:
+        board = clone(puzzle)
+        bits = BitBoard(board)
+        assert bits.consistent
+        digits_of = bits.geo.digits_of
+        for row, col in bits.empty_cells():
+            expected = [num for num in range(1, 10) if is_valid(board, row, col, num)]
+            assert digits_of[bits.candidates(row, col)] == expected
+
+
+def test_place_and_remove_keep_the_masks_in_sync():
+    puzzle = load_corpus("easy")[0]
+    bits = BitBoard(clone(puzzle))
+    row, col = bits.empty_cells()[0]
+    num = bits.geo.digits_of[bits.candidates(row, col)][0]
+    before = (bits.rows[:], bits.cols[:], bits.boxes[:])
+    bits.place(row, col, num)
+    assert bits.grid[row][col] == num and not bits.can_place(row, col, num)
+    fresh = BitBoard(clone(bits.grid))
+    assert (bits.rows, bits.cols, bits.boxes) == (fresh.rows, fresh.cols, fresh.boxes)
+    bits.remove(row, col)
+    assert (bits.rows, bits.cols, bits.boxes) == before
+
+
+def test_repeated_or_out_of_range_givens_are_inconsistent():
+    board = [[0] * 9 for _ in range(9)]
+    board[0][0] = board[0][8] = 5
+    assert not BitBoard(board).consistent
+    board = [[0] * 4 for _ in range(4)]
+    board[1][1] = 7
+    assert not BitBoard(board).consistent
+
+
+def test_geometry_of_larger_boards():
+    geo = geometry(4)
+    assert geo.size == 16 and len(geo.units) == 48
+    assert all(len(geo.peers[r][c]) == 39 for r in range(16) for c in range(16))
+    assert geo.digits_of[geo.all_digits] == list(range(1, 17))
@@ -0,0 +1,47 @@
+# tests/test_board.py
+import copy
+import pickle
+import pytest
+from model.board import Board, clone
+from model.backtracking_solver import solve_with_heuristics
+from model.search_stats import SearchStats
+from controller.benchmark_suite import load_corpus
+
+
+def test_string_and_rows_round_trip():
+    rows = load_corpus("hard17")[0]
+    board = Board.from_rows(rows)
+    assert board.to_rows() == rows
+    assert Board.from_string(str(board)) == board
+    assert Board.from_string(str(board).replace("0", ".")) == board
+    assert len(str(board)) == 81 and repr(board) == f"Board('{board}')"
+    big = Board(bytes(range(17)) * 15 + bytes(1))
+    assert len(big) == 16 and Board.from_string(str(big)) == big
+
+
+def test_rows_are_views_and_copies_are_independent():
+    board = Board.from_rows(load_corpus("easy")[0])
+    board[0][0] = 7
+    assert board.cells[0] == 7
+    for other in (board.copy(), clone(board), copy.deepcopy(board), pickle.loads(pickle.dumps(board))):
+        assert other == board and hash(other) == hash(board)
+        other[8][8] = 9 if other[8][8] != 9 else 1
+        assert other != board
+
+
+def test_bad_input_is_rejected():
+    with pytest.raises(ValueError):
+        Board(bytes(80))
+    with pytest.raises(ValueError):
+        Board.from_string("x" * 81)
+
+
+def test_solvers_give_the_same_answer_on_boards_and_lists(is_solution):
+    for puzzle in load_corpus("generated40")[:3]:
+        for method in ("Backtracking + MRV", "Dancing Links (Algorithm X)"):
+            on_list, on_board = SearchStats(), SearchStats()
+            _, expected = solve_with_heuristics(puzzle, method, stats=on_list)
+            _, solution = solve_with_heuristics(Board.from_rows(puzzle), method, stats=on_board)
+            assert is_solution(puzzle, solution)
+            assert [list(row) for row in solution] == [list(row) for row in expected]
+            assert on_board.nodes == on_list.nodes
@@ -0,0 +1,43 @@
+# tests/test_dlx_solver.py
+from model.board import clone
+from model.dlx_solver import dlx_solve, dlx_solutions, count_solutions
+from model.backtracking_solver import solve_with_heuristics
+from model.search_stats import SearchStats
+from controller.benchmark_suite import load_corpus
+
+
+def test_dlx_solves_hard_puzzles_like_the_backtracker(is_solution):
+    for puzzle in load_corpus("hard17")[:5]:
+        stats = SearchStats()
+        solution = dlx_solve(clone(puzzle), stats=stats)
+        assert is_solution(puzzle, solution)
+        assert solution == solve_with_heuristics(puzzle, "Backtracking + MRV")[1]
+        assert stats.nodes > 0
+
+
+def test_count_solutions():
+    puzzle = load_corpus("hard17")[0]
+    assert count_solutions(puzzle) == 1
+    # 17 clues is the minimum for a unique puzzle, so dropping one opens it up
+    loose = clone(puzzle)
+    row = next(r for r in range(9) if any(loose[r]))
+    loose[row][next(c for c in range(9) if loose[row][c])] = 0
+    assert count_solutions(loose, limit=2) == 2
+    # Every 4x4 grid: the 288 solutions of the empty board
+    assert count_solutions([[0] * 4 for _ in range(4)]) == 288
+
+
+def test_solutions_are_distinct_and_valid(is_solution):
+    empty = [[0] * 4 for _ in range(4)]
+    boards = list(dlx_solutions(empty, limit=10))
+    assert len(boards) == 10
+    assert len({str(board) for board in boards}) == 10
+    assert all(is_solution(empty, board) for board in boards)
+
+
+def test_contradictory_puzzle_has_no_solution():
+    puzzle = [[0] * 9 for _ in range(9)]
+    puzzle[0][1:] = range(1, 9)
+    puzzle[1][1] = 9
+    assert dlx_solve(clone(puzzle)) is None
+    assert count_solutions(puzzle) == 0
@@ -0,0 +1,49 @@
+# tests/test_forward_checking.py
+from model.board import clone
+from model.bitboard import BitBoard
+from model.backtracking_solver import (solve_with_heuristics, propagate_assignment, undo_trail,
+                                       apply_forward_checking)
+from model.search_stats import SearchStats
+from controller.benchmark_suite import load_corpus
+
+
+def fresh_domains(puzzle):
+    bits = BitBoard(clone(puzzle))
+    domains = {(r, c): bits.all_digits for r, c in bits.empty_cells()}
+    apply_forward_checking(bits, domains)
+    return bits, domains
+
+
+def test_assignment_prunes_peers_and_the_trail_undoes_it():
+    bits, domains = fresh_domains(load_corpus("easy")[0])
+    before = dict(domains)
+    var = next(iter(domains))
+    value = bits.geo.digits_of[domains[var]][0]
+    bits.place(var[0], var[1], value)
+    trail = []
+    propagate_assignment(bits, var, value, domains, trail)
+    bit = 1 << (value - 1)
+    assert trail
+    assert not any(domains[peer] & bit for peer in bits.geo.peers[var[0]][var[1]] if peer in domains)
+    undo_trail(domains, trail, 0)
+    assert domains == before and trail == []
+
+
+def test_wiped_out_domain_is_reported():
+    bits, domains = fresh_domains(load_corpus("easy")[0])
+    var = next(iter(domains))
+    peer = next(p for p in bits.geo.peers[var[0]][var[1]] if p in domains)
+    domains[peer] = domains[var] = 1
+    bits.place(var[0], var[1], 1)
+    assert not propagate_assignment(bits, var, 1, domains, [])
+
+
+def test_forward_checking_solves_and_visits_no_more_nodes(is_solution):
+    for puzzle in load_corpus("easy") + load_corpus("generated40")[:3]:
+        plain, checked = SearchStats(), SearchStats()
+        _, expected = solve_with_heuristics(puzzle, "Backtracking", stats=plain)
+        _, solution = solve_with_heuristics(puzzle, "Backtracking + Forward Checking", stats=checked)
+        assert is_solution(puzzle, solution)
+        assert solution == expected
+        assert checked.nodes <= plain.nodes
+        assert checked.prunings > 0
@@ -0,0 +1,21 @@
+# tests/test_grid_factory.py
+from model.grid_factory import GridFactory, pattern_grid
+
+
+def empty(box):
+    return [[0] * (box * box) for _ in range(box * box)]
+
+
+def test_grids_are_valid_for_every_box_size(is_solution):
+    for box in (2, 3, 4, 5):
+        assert is_solution(empty(box), pattern_grid(box))
+        grids = list(GridFactory(seed=box, pool_size=2, box=box).grids(20))
+        assert len(grids) == 20
+        assert all(is_solution(empty(box), grid) for grid in grids)
+
+
+def test_seed_makes_the_sequence_reproducible():
+    first = list(GridFactory(seed=7).grids(10))
+    assert first == list(GridFactory(seed=7).grids(10))
+    assert first != list(GridFactory(seed=8).grids(10))
+    assert len({str(grid) for grid in first}) == 10
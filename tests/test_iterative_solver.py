@@ -0,0 +1,60 @@
+# tests/test_iterative_solver.py
+import pytest
+from model.board import clone
+from model.dlx_solver import dlx_solve
+from model.search_stats import SearchStats
+from model.search_budget import SearchBudget, BudgetExceeded
+from model.strategies import get_strategy, strategy_names
+from model.iterative_solver import IterativeSearch
+from controller.benchmark_suite import load_corpus
+
+BACKTRACKING = [name for name in strategy_names() if get_strategy(name).backtracking]
+
+
+def counters(stats):
+    found = stats.as_dict()
+    for key in [key for key in found if key.endswith("_time")]:
+        del found[key]
+    return found
+
+
+@pytest.mark.parametrize("method", BACKTRACKING)
+def test_same_solution_and_stats_as_the_recursive_search(method):
+    for puzzle in load_corpus("easy")[:3]:
+        recursive, iterative = SearchStats(), SearchStats()
+        solution = get_strategy(method).solve(clone(puzzle), recursive)
+        assert solution == dlx_solve(clone(puzzle))
+        assert IterativeSearch(puzzle, method, iterative).solve() == solution
+        assert counters(iterative) == counters(recursive)
+
+
+@pytest.mark.parametrize("method", ["Backtracking", "Backtracking + MRV"])
+def test_node_limit_stops_both_engines_at_the_same_node(method):
+    puzzle = load_corpus("easy")[0]
+    recursive, iterative = SearchStats(), SearchStats()
+    with pytest.raises(BudgetExceeded):
+        get_strategy(method).solve(clone(puzzle), recursive, SearchBudget(max_nodes=20))
+    search = IterativeSearch(puzzle, method, iterative, SearchBudget(max_nodes=20))
+    with pytest.raises(BudgetExceeded):
+        search.solve()
+    assert iterative.nodes == recursive.nodes == 21
+
+    # Resumed without a limit, the stopped node is not counted twice
+    search.budget = None
+    assert search.solve() == dlx_solve(clone(puzzle))
+    complete = SearchStats()
+    get_strategy(method).solve(clone(puzzle), complete)
+    assert counters(iterative) == counters(complete)
+
+
+def test_checkpoints_resume_to_the_same_result(tmp_path):
+    puzzle = load_corpus("hard17")[1]
+    path = str(tmp_path / "search.ckpt")
+    search = IterativeSearch(puzzle, "Backtracking + MRV", SearchStats())
+    # Every 7 nodes the search is written out and carried on from the file
+    while not search.advance(7):
+        search.save(path)
+        search = IterativeSearch.load(path)
+    whole = SearchStats()
+    assert search.solution == IterativeSearch(puzzle, "Backtracking + MRV", whole).solve()
+    assert counters(search.stats) == counters(whole)
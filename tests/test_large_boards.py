@@ -0,0 +1,44 @@
+# tests/test_large_boards.py
+import random
+from model.board import Board, clone
+from model.bitboard import BitBoard
+from model.sudoku_generator import generate_puzzle, default_holes
+from model.backtracking_solver import solve_with_heuristics
+from model.dlx_solver import count_solutions
+from model.search_stats import SearchStats
+
+METHODS = ("Backtracking + MRV", "Backtracking + MRV + Arc Consistency", "Backtracking + MRV + Human Techniques",
+           "Dancing Links (Algorithm X)")
+
+
+def test_generated_boards_have_the_right_shape():
+    for box in (2, 4, 5):
+        puzzle = generate_puzzle(default_holes(box), box=box, rng=random.Random(box))
+        size = box * box
+        assert len(puzzle) == size and all(len(row) == size for row in puzzle)
+        assert BitBoard(clone(puzzle)).consistent
+        assert sum(row.count(0) for row in puzzle) == default_holes(box)
+
+
+def test_every_method_solves_16x16_alike(is_solution):
+    rng = random.Random(16)
+    for _ in range(2):
+        puzzle = generate_puzzle(default_holes(4), box=4, rng=rng)
+        expected = None
+        for method in METHODS:
+            stats = SearchStats()
+            _, solution = solve_with_heuristics(puzzle, method, stats=stats)
+            assert is_solution(puzzle, solution), method
+            if count_solutions(puzzle, limit=2) == 1:
+                expected = expected or solution
+                assert solution == expected, method
+
+
+def test_16x16_and_25x25_from_board_strings(is_solution):
+    puzzle = generate_puzzle(default_holes(4), box=4, rng=random.Random(4))
+    board = Board.from_string(str(Board.from_rows(puzzle)))
+    _, solution = solve_with_heuristics(board, "Dancing Links (Algorithm X)")
+    assert is_solution(puzzle, solution)
+    big = generate_puzzle(default_holes(5), box=5, rng=random.Random(5))
+    _, solution = solve_with_heuristics(big, "Backtracking + MRV + Arc Consistency")
+    assert is_solution(big, solution)
@@ -0,0 +1,27 @@
+# tests/test_parallel_solver.py
+from model.board import clone
+from model.dlx_solver import dlx_solve
+from model.parallel_solver import solve_many
+from controller.benchmark_suite import load_corpus
+
+
+def test_results_match_serial_solves_in_input_order():
+    puzzles = load_corpus("easy")[:6]
+    expected = [dlx_solve(clone(p)) for p in puzzles]
+    results = list(solve_many(iter(puzzles), "Backtracking + MRV", workers=2, chunksize=2, with_stats=True))
+    assert [r.index for r in results] == list(range(6))
+    assert [r.solution for r in results] == expected
+    assert all(r.stats.nodes > 0 for r in results)
+
+
+def test_unordered_results_cover_every_puzzle():
+    puzzles = load_corpus("easy")[:5]
+    results = list(solve_many(puzzles, "Dancing Links (Algorithm X)", workers=2, ordered=False))
+    assert sorted(r.index for r in results) == list(range(5))
+    assert all(r.solution == dlx_solve(clone(puzzles[r.index])) for r in results)
+
+
+def test_node_limit_applies_per_solve():
+    puzzles = load_corpus("hard17")[:2]
+    results = list(solve_many(puzzles, "Backtracking", workers=1, max_nodes=10))
+    assert all(r.solution is None and r.exceeded == "nodes" for r in results)
@@ -0,0 +1,52 @@
+# tests/test_portfolio_solver.py
+import pytest
+from model.board import clone
+from model.dlx_solver import dlx_solve
+from model.backtracking_solver import solve_with_heuristics
+from model.search_stats import SearchStats
+from model.portfolio_solver import PortfolioSolver, PORTFOLIO, DEFAULT_PORTFOLIO
+from controller.benchmark_suite import load_corpus
+
+METHODS = ["Dancing Links (Algorithm X)", "Backtracking + MRV"]
+
+
+def test_race_returns_a_valid_solution_and_tallies_the_winner(is_solution):
+    puzzles = load_corpus("hard17")[:3]
+    with PortfolioSolver(METHODS) as portfolio:
+        for puzzle in puzzles:
+            result = portfolio.solve(puzzle)
+            assert is_solution(puzzle, result.solution)
+            assert result.solution == dlx_solve(clone(puzzle))
+            assert result.winner in METHODS
+            assert any(r.method == result.winner and r.solution == result.solution for r in result.results)
+        assert sum(portfolio.wins.values()) == 3
+
+
+def test_proof_of_no_solution_decides_the_race():
+    broken = [[0] * 9 for _ in range(9)]
+    broken[0][1:] = range(1, 9)
+    broken[1][1] = 9
+    with PortfolioSolver(METHODS) as portfolio:
+        result = portfolio.solve(broken)
+    assert result.solution is None and result.winner in METHODS
+
+
+def test_every_racer_out_of_budget_means_no_winner():
+    with PortfolioSolver(["Backtracking", "Backtracking + Forward Checking"]) as portfolio:
+        result = portfolio.solve(load_corpus("hard17")[0], max_nodes=10)
+    assert result.solution is None and result.winner is None
+    assert {r.exceeded for r in result.results} == {"nodes"}
+
+
+def test_portfolio_cannot_race_itself():
+    with pytest.raises(ValueError):
+        PortfolioSolver([PORTFOLIO])
+
+
+def test_winner_comes_back_with_each_solve(is_solution):
+    puzzle = load_corpus("hard17")[0]
+    stats = SearchStats()
+    _, solution = solve_with_heuristics(puzzle, PORTFOLIO, stats=stats)
+    assert is_solution(puzzle, solution)
+    assert stats.winner in DEFAULT_PORTFOLIO and stats.as_dict()["winner"] == stats.winner
+    assert SearchStats().winner is None
@@ -0,0 +1,50 @@
+# tests/test_propagation.py
+from model.board import clone
+from model.bitboard import BitBoard
+from model.propagation import propagate
+from model.dlx_solver import dlx_solve
+from model.backtracking_solver import solve_with_heuristics
+from model.search_stats import SearchStats
+from controller.benchmark_suite import load_corpus
+
+
+def run_propagate(puzzle):
+    bits = BitBoard(clone(puzzle))
+    domains = {var: bits.all_digits for var in bits.empty_cells()}
+    return bits, domains, propagate(bits, domains)
+
+
+def test_propagation_never_loses_the_solution():
+    for puzzle in load_corpus("generated40")[:10]:
+        solution = dlx_solve(clone(puzzle))
+        bits, domains, fixed = run_propagate(puzzle)
+        assert fixed == len(BitBoard(clone(puzzle)).empty_cells()) - len(domains)
+        assert all(bits.grid[r][c] in (0, solution[r][c]) for r in range(9) for c in range(9))
+        assert all(domain & (1 << (solution[r][c] - 1)) for (r, c), domain in domains.items())
+
+
+def test_singles_solve_most_easy_puzzles_without_search(is_solution):
+    solved = 0
+    for puzzle in load_corpus("easy"):
+        bits, domains, fixed = run_propagate(puzzle)
+        if not domains:
+            assert is_solution(puzzle, bits.grid)
+            solved += 1
+    assert solved >= 90
+
+
+def test_cell_without_candidates_is_a_contradiction():
+    puzzle = [[0] * 9 for _ in range(9)]
+    puzzle[0][1:] = range(1, 9)
+    puzzle[1][1] = 9
+    assert BitBoard(clone(puzzle)).consistent
+    assert run_propagate(puzzle)[2] is None
+    assert solve_with_heuristics(puzzle, "Backtracking + Arc Consistency")[1] is None
+
+
+def test_arc_consistency_strategies_solve_hard_puzzles(is_solution):
+    for puzzle in load_corpus("hard17")[:5]:
+        stats = SearchStats()
+        _, solution = solve_with_heuristics(puzzle, "Backtracking + MRV + Arc Consistency", stats=stats)
+        assert is_solution(puzzle, solution)
+        assert stats.cells_fixed > 0
@@ -0,0 +1,91 @@
+# tests/test_puzzle_bank.py
+import os
+import random
+from model.board import clone
+from model.dlx_solver import dlx_solve, count_solutions
+from model.sudoku_generator import generate_puzzle, generate_graded_many
+from model.puzzle_bank import PuzzleBank, BankRefill, HEADER
+
+
+# (puzzle, solution, difficulty) triples from seeded unique puzzles
+def entries(count, difficulty, seed=0):
+    rng = random.Random(seed)
+    found = []
+    for _ in range(count):
+        puzzle = generate_puzzle(None, unique=True, rng=rng)
+        found.append((puzzle, dlx_solve(clone(puzzle)), difficulty))
+    return found
+
+
+def test_missing_bank_reads_empty_without_creating_files(tmp_path):
+    bank = PuzzleBank(str(tmp_path / "bank.sdk"))
+    assert len(bank) == 0
+    assert bank.draw() is None
+    assert bank.count(difficulty="easy") == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_draw_matches_criteria_and_solutions(tmp_path):
+    bank = PuzzleBank(str(tmp_path / "bank.sdk"))
+    bank.append(entries(3, "easy", seed=1) + entries(2, "hard", seed=2))
+    assert len(bank) == 5
+    assert bank.count(difficulty="hard") == 2
+    rng = random.Random(0)
+    for _ in range(20):
+        entry = bank.draw(difficulty="hard", rng=rng)
+        assert entry.difficulty == "hard"
+        assert count_solutions(entry.puzzle, limit=2) == 1
+        assert all(p in (0, s) for p, s in zip(entry.puzzle.cells, entry.solution.cells))
+    clues = min(c for c, _ in bank.counts())
+    assert bank.draw(clues=clues, rng=rng) is not None
+    assert bank.draw(clues=(0, clues - 1)) is None
+    assert bank.draw(difficulty="expert") is None
+
+
+def test_reopen_picks_up_appends_and_rebuilds_the_index(tmp_path):
+    path = str(tmp_path / "bank.sdk")
+    writer = PuzzleBank(path)
+    writer.append(entries(2, "medium"))
+    reader = PuzzleBank(path)
+    writer.append(entries(1, None, seed=3))
+    assert reader.count() == 3
+    assert reader.counts() == writer.counts()
+
+    # A lost index and a half-written record: the index is rebuilt from the
+    # complete records and the next append overwrites the partial one
+    os.remove(path + ".idx")
+    with open(path, "ab") as f:
+        f.write(b"\1" * 50)
+    rebuilt = PuzzleBank(path)
+    assert len(rebuilt) == 3 and rebuilt.count(difficulty="medium") == 2
+    rebuilt.append(entries(1, "easy", seed=4))
+    assert os.path.getsize(path) == HEADER.size + 4 * rebuilt.record_size
+
+
+def test_generate_puzzle_draws_from_the_bank(tmp_path):
+    bank = PuzzleBank(str(tmp_path / "bank.sdk"))
+    stored = entries(1, "hard")
+    bank.append(stored)
+    drawn = generate_puzzle(40, bank=bank, difficulty="hard")
+    assert drawn == [list(row) for row in stored[0][0]]
+
+
+def test_one_worker_pool_matches_inline_generation():
+    inline = list(generate_graded_many(2, "easy", workers=1, seed=5))
+    pooled = list(generate_graded_many(2, "easy", workers=1, seed=5, pool=True))
+    assert sorted(map(str, inline)) == sorted(map(str, pooled))
+
+
+def test_refill_tops_up_every_difficulty(tmp_path):
+    bank = PuzzleBank(str(tmp_path / "bank.sdk"))
+    refill = BankRefill(bank, stock=2, difficulties=["easy", "medium"], batch=2, workers=1, interval=0.05)
+    try:
+        for _ in range(600):
+            if bank.count(difficulty="easy") >= 2 and bank.count(difficulty="medium") >= 2:
+                break
+            refill.thread.join(0.1)
+    finally:
+        refill.stop()
+        refill.thread.join()
+    assert refill.error is None
+    assert bank.count(difficulty="easy") == bank.count(difficulty="medium") == 2
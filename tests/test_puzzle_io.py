@@ -0,0 +1,47 @@
+# tests/test_puzzle_io.py
+import pytest
+from model.board import Board
+from utils.puzzle_io import read_puzzles, write_puzzles
+from controller.solve_stream import main as solve_stream
+from controller.benchmark_suite import load_corpus
+
+
+@pytest.mark.parametrize("name", ["puzzles.txt", "puzzles.txt.gz"])
+def test_write_then_read_round_trip(tmp_path, name):
+    path = str(tmp_path / name)
+    puzzles = load_corpus("hard17")[:10]
+    assert write_puzzles(iter(puzzles), path) == 10
+    for use_mmap in (True, False):
+        assert [board.to_rows() for board in read_puzzles(path, use_mmap)] == puzzles
+
+
+def test_comments_blanks_and_dots(tmp_path):
+    path = tmp_path / "mixed.txt"
+    line = "".join(str(v) for row in load_corpus("easy")[0] for v in row)
+    path.write_text(f"# header\n\n{line}\n  {line.replace('0', '.')}  \n")
+    boards = list(read_puzzles(str(path)))
+    assert len(boards) == 2 and boards[0] == boards[1] == Board.from_string(line)
+    empty = tmp_path / "empty.txt"
+    empty.write_text("")
+    assert list(read_puzzles(str(empty))) == []
+
+
+def test_malformed_line_names_file_and_line(tmp_path):
+    path = tmp_path / "bad.txt"
+    path.write_text("# header\n" + "1" * 80 + "\n")
+    with pytest.raises(ValueError, match=r"bad\.txt:2"):
+        list(read_puzzles(str(path)))
+
+
+def test_solve_stream_writes_aligned_solutions(tmp_path, is_solution):
+    source, target = str(tmp_path / "in.txt.gz"), str(tmp_path / "out.txt")
+    broken = [[0] * 9 for _ in range(9)]
+    broken[0][1:] = range(1, 9)
+    broken[1][1] = 9
+    puzzles = load_corpus("hard17")[:3] + [broken]
+    write_puzzles(puzzles, source)
+    # Exit status 2: not every puzzle was solved
+    assert solve_stream([source, "-o", target, "--workers", "1"]) == 2
+    solved = [board.to_rows() for board in read_puzzles(target)]
+    assert all(is_solution(p, s) for p, s in zip(puzzles[:3], solved))
+    assert solved[3] == broken
@@ -0,0 +1,55 @@
+# tests/test_search_budget.py
+import threading
+import pytest
+from model.backtracking_solver import solve_with_heuristics
+from model.search_budget import SearchBudget, BudgetExceeded
+from model.search_stats import SearchStats
+from model.strategies import strategy_names
+from controller.benchmark_suite import load_corpus
+
+HARD = load_corpus("hard17")[0]
+
+
+@pytest.mark.parametrize("method", strategy_names(pooled=False))
+def test_node_limit_stops_exactly_and_counts_like_stats(method):
+    budget, stats = SearchBudget(max_nodes=5), SearchStats()
+    _, solution = solve_with_heuristics(HARD, method, stats=stats, budget=budget)
+    if solution is None:
+        assert budget.exceeded == "nodes"
+        assert budget.nodes == stats.nodes == 6
+    else:
+        # Solved by inference in no more nodes than the limit
+        assert budget.exceeded is None and stats.nodes <= 5
+
+
+def test_generous_budget_changes_nothing(is_solution):
+    puzzle = load_corpus("generated40")[0]
+    budget, stats = SearchBudget(timeout=60, max_nodes=10 ** 6), SearchStats()
+    _, solution = solve_with_heuristics(puzzle, "Backtracking", stats=stats, budget=budget)
+    assert is_solution(puzzle, solution)
+    assert solution == solve_with_heuristics(puzzle, "Backtracking")[1]
+    assert budget.exceeded is None and budget.nodes == stats.nodes
+
+
+def test_expired_deadline_stops_before_searching():
+    budget = SearchBudget(timeout=0)
+    assert solve_with_heuristics(HARD, "Backtracking", budget=budget)[1] is None
+    assert budget.exceeded == "deadline" and budget.nodes == 0
+
+
+def test_cancel_from_another_thread():
+    budget = SearchBudget()
+    timer = threading.Timer(0.2, budget.cancel)
+    timer.start()
+    _, solution = solve_with_heuristics(HARD, "Backtracking", budget=budget)
+    timer.join()
+    assert solution is None and budget.exceeded == "cancelled"
+
+
+def test_charge_raises_once_over_the_limit():
+    budget = SearchBudget(max_nodes=3, check_every=100)
+    for _ in range(3):
+        budget.charge()
+    with pytest.raises(BudgetExceeded):
+        budget.charge()
+    assert budget.nodes == 4 and budget.exceeded == "nodes"
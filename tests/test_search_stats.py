@@ -0,0 +1,51 @@
+# tests/test_search_stats.py
+from model.backtracking_solver import solve_with_heuristics
+from model.search_stats import SearchStats
+from controller.benchmark_suite import load_corpus
+
+
+def solve_counted(puzzle, method="Backtracking"):
+    stats = SearchStats()
+    _, solution = solve_with_heuristics(puzzle, method, stats=stats)
+    return stats, solution
+
+
+# Everything but the timings
+def counts(stats):
+    data = stats.as_dict()
+    del data["preprocess_time"], data["search_time"]
+    return data
+
+
+def test_counters_agree_with_each_other():
+    puzzle = load_corpus("generated40")[0]
+    open_cells = sum(row.count(0) for row in puzzle)
+    stats, solution = solve_counted(puzzle)
+    # Every placement opens a node, the one completing the grid aside, and only
+    # the open_cells placements on the final path are never undone
+    assert stats.nodes == stats.backtracks + open_cells
+    assert sum(stats.depth_histogram()) == stats.nodes
+    assert len(stats.depth_histogram()) == stats.max_depth + 1 == open_cells
+    assert stats.values_tried >= stats.nodes
+
+
+def test_stats_do_not_change_the_search():
+    for method in ("Backtracking", "Backtracking + MRV", "Backtracking + MRV + Human Techniques"):
+        for puzzle in load_corpus("generated40")[:3]:
+            stats, solution = solve_counted(puzzle, method)
+            assert solution == solve_with_heuristics(puzzle, method)[1]
+            assert counts(stats) == counts(solve_counted(puzzle, method)[0])
+
+
+def test_merge_adds_counters_and_histograms():
+    first, _ = solve_counted(load_corpus("generated40")[0])
+    second, _ = solve_counted(load_corpus("generated40")[1])
+    total = SearchStats()
+    total.merge(first)
+    total.merge(second)
+    assert total.nodes == first.nodes + second.nodes
+    assert total.backtracks == first.backtracks + second.backtracks
+    assert total.max_depth == max(first.max_depth, second.max_depth)
+    assert sum(total.depth_histogram()) == total.nodes
+    data = total.as_dict()
+    assert data["nodes"] == total.nodes and data["depth_histogram"] == total.depth_histogram()
@@ -0,0 +1,81 @@
+# tests/test_solution_cache.py
+import random
+from model.board import Board, clone
+from model.dlx_solver import dlx_solve
+from model.grid_factory import line_order
+from model.search_budget import SearchBudget
+from model.search_stats import SearchStats
+from model.solution_cache import SolutionCache
+from controller.benchmark_suite import load_corpus
+
+
+# The same puzzle after a random relabeling, row/column permutation and transposition
+def disguise(puzzle, seed):
+    rng = random.Random(seed)
+    labels = list(range(1, 10))
+    rng.shuffle(labels)
+    relabel = [0] + labels
+    rows, cols = line_order(rng), line_order(rng)
+    moved = [[relabel[puzzle[r][c]] for c in cols] for r in rows]
+    return [list(col) for col in zip(*moved)] if seed % 2 else moved
+
+
+def test_repeats_and_disguised_repeats_are_hits(is_solution):
+    cache = SolutionCache()
+    puzzles = load_corpus("easy")[:5]
+    for puzzle in puzzles:
+        _, solution = cache.solve(puzzle)
+        assert is_solution(puzzle, solution)
+    assert cache.misses == 5
+    for seed, puzzle in enumerate(puzzles):
+        _, again = cache.solve(puzzle)
+        assert again == dlx_solve(clone(puzzle))
+        twin = disguise(puzzle, seed)
+        _, solution = cache.solve(twin)
+        assert is_solution(twin, solution)
+        assert solution == dlx_solve(clone(twin))
+    info = cache.info()
+    assert cache.misses == 5 and cache.hits == 10
+    assert info["canonical_hits"] == 5
+
+
+def test_answers_come_back_in_the_callers_board_type(is_solution):
+    cache = SolutionCache()
+    puzzle = load_corpus("easy")[0]
+    cache.solve(puzzle)
+    _, solution = cache.solve(Board.from_rows(puzzle))
+    assert isinstance(solution, Board) and is_solution(puzzle, solution)
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    path = str(tmp_path / "solutions.db")
+    puzzle = load_corpus("hard17")[0]
+    SolutionCache(path=path).solve(puzzle)
+    fresh = SolutionCache(path=path)
+    _, solution = fresh.solve(puzzle)
+    assert fresh.disk_hits == 1 and fresh.misses == 0
+    assert solution == dlx_solve(clone(puzzle))
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = SolutionCache(maxsize=2, canonical=False)
+    first, second, third = load_corpus("easy")[:3]
+    for puzzle in (first, second, first, third):
+        cache.solve(puzzle)
+    cache.solve(first)
+    cache.solve(second)
+    assert cache.hits == 2 and cache.misses == 4
+
+
+def test_misses_fill_stats_and_respect_the_budget():
+    cache = SolutionCache()
+    puzzle = load_corpus("hard17")[0]
+    budget = SearchBudget(max_nodes=3)
+    assert cache.solve(puzzle, "Backtracking", budget=budget)[1] is None
+    assert budget.exceeded == "nodes" and cache.info()["size"] == 0
+    stats = SearchStats()
+    cache.solve(puzzle, stats=stats)
+    assert stats.nodes > 0
+    hit = SearchStats()
+    cache.solve(puzzle, stats=hit)
+    assert hit.nodes == 0 and cache.hits == 1
@@ -0,0 +1,32 @@
+# tests/test_solve_log.py
+from model.board import Board
+from utils.solve_log import SolveLog, query_log
+
+PUZZLE = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+
+
+def test_entries_round_trip_in_order(tmp_path):
+    path = str(tmp_path / "log.jsonl")
+    log = SolveLog(path, seed=None)
+    for i in range(5):
+        log.log(Board.from_string(PUZZLE), None, f"m{i % 2}", 0.01 * i)
+    log.close()
+    entries = list(query_log(path))
+    assert [e["method"] for e in entries] == ["m0", "m1", "m0", "m1", "m0"]
+    assert entries[0]["puzzle"] == PUZZLE
+    assert len(list(query_log(path, method="m1"))) == 2
+    assert list(query_log(path, solved=True)) == []
+
+
+def test_new_log_starts_from_history(tmp_path):
+    seed = tmp_path / "history.jsonl"
+    seed.write_text('{"time": "2025-01-01T00:00:00.000", "method": "old", "elapsed": 1.0, '
+                    '"puzzle": "", "solution": null, "stats": null}\n')
+    path = str(tmp_path / "log.jsonl")
+    log = SolveLog(path, seed=str(seed))
+    log.log(Board.from_string(PUZZLE), None, "new", 0.5)
+    log.close()
+    assert [e["method"] for e in query_log(path)] == ["old", "new"]
+    # An existing log is never overwritten by the history
+    SolveLog(path, seed=str(seed)).close()
+    assert len(list(query_log(path))) == 2
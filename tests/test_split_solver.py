@@ -0,0 +1,33 @@
+# tests/test_split_solver.py
+import pytest
+from model.board import clone
+from model.dlx_solver import dlx_solve
+from model.split_solver import SplitSolver
+from controller.benchmark_suite import load_corpus
+
+
+@pytest.fixture(scope="module")
+def solver():
+    with SplitSolver(workers=2) as solver:
+        yield solver
+
+
+@pytest.fixture(scope="module")
+def hard():
+    return load_corpus("hard17")[:3]
+
+
+def test_split_finds_the_solution(solver, hard):
+    for puzzle in hard:
+        result = solver.solve(puzzle, "Backtracking + MRV")
+        assert result.subproblems > 1
+        assert result.solution == dlx_solve(clone(puzzle))
+        assert result.exceeded is None
+
+
+@pytest.mark.parametrize("max_nodes", [20, 60])
+def test_node_limit_covers_all_subproblems(solver, hard, max_nodes):
+    result = solver.solve(hard[0], "Backtracking + MRV", max_nodes=max_nodes)
+    assert result.solution is None and result.exceeded == "nodes"
+    # One node past the limit per worker that was mid-search when it ran out
+    assert max_nodes < result.stats.nodes <= max_nodes + solver.workers
@@ -0,0 +1,49 @@
+# tests/test_strategies.py
+import pytest
+from model.board import clone
+from model.dlx_solver import dlx_solve
+from model.backtracking_solver import solve_with_heuristics, select_mrv
+from model.search_stats import SearchStats
+from model.strategies import Strategy, get_strategy, strategy_names, PARALLEL_PREFIX
+from controller.benchmark_suite import load_corpus
+
+# Unique puzzles, so every strategy must find the same grid
+PUZZLES = load_corpus("easy")[:3]
+
+
+@pytest.mark.parametrize("name", strategy_names())
+def test_every_strategy_solves_validly(name, is_solution):
+    for puzzle in PUZZLES:
+        _, solution = solve_with_heuristics(puzzle, name)
+        assert is_solution(puzzle, solution)
+        assert [list(row) for row in solution] == dlx_solve(clone(puzzle))
+
+
+@pytest.mark.parametrize("name", strategy_names(pooled=False))
+def test_registry_solve_matches_the_entry_point(name):
+    for puzzle in PUZZLES:
+        direct, wrapped = SearchStats(), SearchStats()
+        solution = get_strategy(name).solve(clone(puzzle), stats=direct)
+        assert solution == solve_with_heuristics(puzzle, name, stats=wrapped)[1]
+        assert direct.nodes == wrapped.nodes and direct.backtracks == wrapped.backtracks
+
+
+def test_parallel_names_resolve_for_unpooled_strategies(is_solution):
+    strategy = get_strategy(PARALLEL_PREFIX + "Backtracking + LCV + Forward Checking")
+    assert strategy.pooled and not strategy.backtracking
+    assert is_solution(PUZZLES[0], strategy.solve(clone(PUZZLES[0])))
+    with pytest.raises(ValueError):
+        get_strategy(PARALLEL_PREFIX + "Portfolio")
+
+
+def test_bad_strategies_are_rejected():
+    with pytest.raises(ValueError):
+        get_strategy("Simulated Annealing")
+    with pytest.raises(ValueError):
+        Strategy("MRV without domains", select=select_mrv)
+
+
+def test_pooled_filter():
+    pooled = strategy_names(pooled=True)
+    assert "Portfolio" in pooled and "Backtracking" not in pooled
+    assert set(pooled) | set(strategy_names(pooled=False)) == set(strategy_names())
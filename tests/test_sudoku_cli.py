@@ -0,0 +1,70 @@
+# tests/test_sudoku_cli.py
+from model.board import Board
+from model.sudoku_generator import default_holes
+from controller.sudoku_cli import main
+from controller.benchmark_suite import load_corpus, measure_startup
+
+
+def line_of(puzzle):
+    return "".join(str(v) for row in puzzle for v in row)
+
+
+def output_boards(capsys):
+    return [Board.from_string(line).to_rows() for line in capsys.readouterr().out.split()]
+
+
+def test_solve_one_line_puzzle(capsys, is_solution):
+    puzzle = load_corpus("hard17")[0]
+    assert main(["solve", line_of(puzzle)]) == 0
+    assert is_solution(puzzle, output_boards(capsys)[0])
+
+
+def test_solve_file_echoes_what_runs_out_of_budget(tmp_path, capsys, is_solution):
+    puzzles = load_corpus("easy")[:2] + load_corpus("hard17")[:1]
+    path = tmp_path / "puzzles.txt"
+    path.write_text("\n".join(line_of(p) for p in puzzles) + "\n")
+    assert main(["solve", str(path), "--method", "Backtracking", "--max-nodes", "1000"]) == 2
+    solved = output_boards(capsys)
+    assert all(is_solution(p, s) for p, s in zip(puzzles[:2], solved))
+    assert solved[2] == puzzles[2]
+
+
+def test_checkpointed_solve_resumes(tmp_path, capsys, is_solution):
+    puzzle = load_corpus("generated40")[7]
+    checkpoint = str(tmp_path / "search.ckpt")
+    args = ["solve", line_of(puzzle), "--method", "Backtracking", "--checkpoint", checkpoint]
+    assert main(args + ["--max-nodes", "5"]) == 2
+    assert (tmp_path / "search.ckpt").exists()
+    assert main(args) == 0
+    assert is_solution(puzzle, output_boards(capsys)[0])
+    assert not (tmp_path / "search.ckpt").exists()
+
+
+def test_generate_is_reproducible(capsys):
+    args = ["generate", "--count", "3", "--seed", "1"]
+    assert main(args) == 0
+    first = output_boards(capsys)
+    assert main(args) == 0
+    assert output_boards(capsys) == first and len(first) == 3
+    assert all(sum(row.count(0) for row in board) == default_holes(3) for board in first)
+
+
+def test_startup_skips_heavy_modules():
+    _, heavy = measure_startup(load_corpus("easy")[0], runs=1)
+    assert heavy == []
+
+
+def test_repeats_are_answered_from_the_cache(tmp_path, capsys, is_solution):
+    puzzle = load_corpus("hard17")[0]
+    path = tmp_path / "repeats.txt"
+    path.write_text((line_of(puzzle) + "\n") * 3)
+    database = str(tmp_path / "solutions.db")
+    assert main(["solve", str(path), "--cache-db", database, "-v"]) == 0
+    captured = capsys.readouterr()
+    assert "2 hits" in captured.err and "1 misses" in captured.err
+    assert main(["solve", line_of(puzzle), "--cache-db", database, "-v"]) == 0
+    assert "1 from disk" in capsys.readouterr().err
+    assert main(["solve", str(path), "--no-cache", "-v"]) == 0
+    captured = capsys.readouterr()
+    assert "Cache" not in captured.err
+    assert all(is_solution(puzzle, Board.from_string(line).to_rows()) for line in captured.out.split())
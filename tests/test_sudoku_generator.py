@@ -0,0 +1,50 @@
+# tests/test_sudoku_generator.py
+import random
+import pytest
+from model.dlx_solver import count_solutions
+from model.techniques import grade
+from model.sudoku_generator import (generate_puzzle, generate_graded, rate_puzzle, DIFFICULTIES,
+                                    EXPERT_BACKTRACKS)
+
+
+def test_ratings_rise_with_search_effort():
+    ratings = [rate_puzzle(generate_puzzle(None, unique=True, rng=random.Random(seed))) for seed in range(40)]
+    effort = {difficulty: [r.effort for r in ratings if r.difficulty == difficulty] for difficulty in DIFFICULTIES}
+    assert all(effort.values()), "the sample should cover every band"
+    # Logic alone solves easy and medium puzzles, so the reference search never backtracks
+    assert max(effort["easy"] + effort["medium"]) == 0
+    assert max(effort["hard"]) < EXPERT_BACKTRACKS <= min(effort["expert"])
+
+
+@pytest.mark.parametrize("difficulty", DIFFICULTIES)
+def test_generate_graded_hits_the_band(difficulty):
+    puzzle, rating = generate_graded(difficulty, rng=random.Random(7))
+    assert count_solutions(puzzle, limit=2) == 1
+    assert rating == rate_puzzle(puzzle)
+    assert rating.difficulty == difficulty
+    assert (grade(puzzle).open_cells == 0) == (difficulty in ("easy", "medium"))
+
+
+def test_generate_graded_effort_range():
+    _, rating = generate_graded(min_effort=5, max_effort=50, rng=random.Random(3))
+    assert 5 <= rating.effort <= 50
+
+
+def test_unreachable_difficulty_raises():
+    # 4x4 boards never need guessing
+    with pytest.raises(ValueError):
+        generate_puzzle(box=2, difficulty="expert", rng=random.Random(0))
+
+
+def test_unique_puzzles_have_one_solution():
+    rng = random.Random(11)
+    for box, holes in ((2, None), (3, 45), (3, None)):
+        puzzle = generate_puzzle(holes, unique=True, box=box, rng=rng)
+        assert count_solutions(puzzle, limit=2) == 1
+        if holes is not None:
+            assert sum(row.count(0) for row in puzzle) <= holes
+
+
+def test_full_dig_needs_unique():
+    with pytest.raises(ValueError):
+        generate_puzzle(None)
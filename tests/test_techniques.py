@@ -0,0 +1,80 @@
+# tests/test_techniques.py
+import pytest
+from model.board import clone
+from model.bitboard import BitBoard
+from model.propagation import propagate
+from model.dlx_solver import dlx_solutions
+from model.techniques import RULES, apply_techniques, grade
+from model.backtracking_solver import solve_with_heuristics
+from model.search_stats import SearchStats
+from controller.benchmark_suite import load_corpus
+
+# One of each hard17 family plus the other corpora: between them every rule fires
+POOL = load_corpus("hard17")[::5] + load_corpus("generated40") + load_corpus("easy")
+
+
+# A sound elimination keeps every solution; some generated40 puzzles have
+# several, so up to ten are checked
+def keeps_solutions(bits, domains, solutions):
+    return all(all(domain >> (solution[r][c] - 1) & 1 for (r, c), domain in domains.items())
+               and all(bits.grid[r][c] in (0, solution[r][c]) for r in range(9) for c in range(9))
+               for solution in solutions)
+
+
+def stalled(puzzle):
+    bits = BitBoard(clone(puzzle))
+    domains = {var: bits.all_digits for var in bits.empty_cells()}
+    propagate(bits, domains)
+    return bits, domains
+
+
+@pytest.mark.parametrize("name", list(RULES))
+def test_rule_never_removes_a_solution(name):
+    fired = 0
+    for puzzle in POOL:
+        bits, domains = stalled(puzzle)
+        if not domains:
+            continue
+        solutions = list(dlx_solutions(puzzle, limit=10))
+        for _ in range(20):
+            removed = RULES[name](bits.geo, domains)
+            if not removed:
+                break
+            fired += removed
+            assert keeps_solutions(bits, domains, solutions)
+            assert propagate(bits, domains) is not None
+            assert keeps_solutions(bits, domains, solutions)
+    assert fired > 0
+
+
+def test_all_rules_together_stay_sound_and_fire():
+    fired = set()
+    for puzzle in POOL:
+        bits = BitBoard(clone(puzzle))
+        domains = {var: bits.all_digits for var in bits.empty_cells()}
+        hits = {}
+        assert apply_techniques(bits, domains, hits=hits) is not None
+        if hits:
+            assert keeps_solutions(bits, domains, list(dlx_solutions(puzzle, limit=10)))
+        fired |= set(hits)
+    assert len(fired) >= 3
+
+
+def test_grade():
+    easy = grade(load_corpus("easy")[0])
+    assert easy.open_cells == 0 and not easy.hits and easy.singles == 45
+    # A hard17 family that the rules cannot finish
+    hard = grade(load_corpus("hard17")[30])
+    assert hard.open_cells > 0 and hard.hits
+    broken = [[0] * 9 for _ in range(9)]
+    broken[0][1:] = range(1, 9)
+    broken[1][1] = 9
+    assert grade(broken).open_cells is None
+
+
+def test_technique_strategies_record_rule_hits(is_solution):
+    for puzzle in load_corpus("hard17")[::5]:
+        stats = SearchStats()
+        _, solution = solve_with_heuristics(puzzle, "Backtracking + MRV + Human Techniques", stats=stats)
+        assert is_solution(puzzle, solution)
+        assert set(stats.rule_hits) <= set(RULES)
@@ -0,0 +1,68 @@
+# utils/puzzle_io.py
+# Streaming I/O for the common one-puzzle-per-line format: 81 chars on 9x9
+# (n⁴ on larger boards), '0' or '.' for blanks, '#' lines are comments.
+# Paths ending in .gz are read and written through gzip, '-' means stdin/stdout,
+# and plain files are memory-mapped, so huge corpora stream in constant memory.
+import os
+import sys
+import gzip
+import mmap
+from contextlib import nullcontext
+from model.board import Board, SYMBOLS
+
+
+# Yield the text lines of a file, gzip file or stdin ('-') one at a time
+def iter_lines(path, use_mmap=True):
+    if path == "-":
+        yield from sys.stdin
+        return
+    if path.endswith(".gz"):
+        with gzip.open(path, "rt") as f:
+            yield from f
+        return
+    with open(path, "rb") as f:
+        # mmap refuses empty files
+        if use_mmap and os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b""):
+                    yield line.decode("ascii")
+        else:
+            for line in f:
+                yield line.decode("ascii")
+
+
+# Yield a Board for every puzzle line; blank and '#' lines are skipped.
+# A malformed line raises ValueError naming the file and line number.
+def read_puzzles(path, use_mmap=True):
+    for lineno, line in enumerate(iter_lines(path, use_mmap), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            yield Board.from_string(line)
+        except ValueError as e:
+            raise ValueError(f"{path}:{lineno}: {e}") from None
+
+
+# One-line form of a Board or list-of-lists board
+def format_line(board):
+    return "".join(SYMBOLS[v] for row in board for v in row)
+
+
+# Open a text file for writing; '-' is stdout, .gz paths are compressed
+def open_output(path):
+    if path == "-":
+        return nullcontext(sys.stdout)
+    if path.endswith(".gz"):
+        return gzip.open(path, "wt")
+    return open(path, "w")
+
+
+# Write boards one per line as they arrive; returns how many were written
+def write_puzzles(boards, path):
+    count = 0
+    with open_output(path) as f:
+        for board in boards:
+            f.write(format_line(board) + "\n")
+            count += 1
+    return count
@@ -0,0 +1,143 @@
+# utils/solve_log.py
+# Append-only log of solves, one JSON object per line (JSONL).
+# Callers only put entries on a queue; a background thread batches them and
+# appends each batch with a single write, so logging never blocks a solve on
+# file creation and the log grows to millions of entries in one file.
+# The log itself is not versioned; a new one starts from the solve history
+# shipped in data/ (the per-solve files imported by import_legacy).
+import os
+import shutil
+import json
+import time
+import queue
+import atexit
+import threading
+from datetime import datetime
+from utils.puzzle_io import format_line
+
+DEFAULT_LOG = os.path.join(os.path.dirname(__file__), '..', 'output', 'solve_log.jsonl')
+HISTORY_LOG = os.path.join(os.path.dirname(__file__), '..', 'data', 'solve_history.jsonl')
+
+# Ends the writer thread once everything queued before it is written
+STOP = object()
+
+
+class SolveLog:
+    # A log that does not exist yet is started as a copy of `seed` (None: empty)
+    def __init__(self, path=DEFAULT_LOG, batch_size=256, flush_interval=0.5, seed=HISTORY_LOG):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.written = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if seed is not None and not os.path.exists(path) and os.path.exists(seed):
+            shutil.copyfile(seed, path)
+        self.thread = threading.Thread(target=self.run, name="solve-log-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    # Queue one solve. Boards are turned into one-line strings right away, so
+    # the caller may reuse them; stats is a SearchStats or None.
+    def log(self, puzzle, solution, method, elapsed, stats=None):
+        self.queue.put({
+            "time": datetime.now().isoformat(timespec="milliseconds"),
+            "method": method,
+            "elapsed": elapsed,
+            "puzzle": format_line(puzzle),
+            "solution": format_line(solution) if solution else None,
+            "stats": stats.as_dict() if stats is not None else None,
+        })
+
+    # Writer thread: wait for an entry, gather more for up to flush_interval,
+    # then append the batch and flush
+    def run(self):
+        with open(self.path, "a") as f:
+            while True:
+                batch = [self.queue.get()]
+                deadline = time.monotonic() + self.flush_interval
+                while batch[-1] is not STOP and len(batch) < self.batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(self.queue.get(timeout=timeout))
+                    except queue.Empty:
+                        break
+                stop = batch[-1] is STOP
+                if stop:
+                    batch.pop()
+                if batch:
+                    f.write("".join(json.dumps(entry) + "\n" for entry in batch))
+                    f.flush()
+                    self.written += len(batch)
+                if stop:
+                    return
+
+    # Write out everything queued so far and stop the writer
+    def close(self):
+        if self.thread.is_alive():
+            self.queue.put(STOP)
+            self.thread.join()
+
+
+# Stream entries back from a log, optionally filtered by method, time
+# (ISO string or datetime, inclusive) and outcome; newest last, as written
+def query_log(path=DEFAULT_LOG, method=None, since=None, solved=None, limit=None):
+    if isinstance(since, datetime):
+        since = since.isoformat()
+    if not os.path.exists(path):
+        return
+    count = 0
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if method is not None and entry["method"] != method:
+                continue
+            if since is not None and entry["time"] < since:
+                continue
+            if solved is not None and (entry["solution"] is not None) != solved:
+                continue
+            yield entry
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+
+# Cells of an old 'Sudoku Puzzle:' / 'Solution using ...' text file, plus its header lines
+def read_legacy_board(path):
+    with open(path) as f:
+        lines = [line.strip() for line in f if line.strip()]
+    header = [line for line in lines if line[0].isalpha()]
+    rows = [[0 if ch == "." else int(ch) for ch in line.split()] for line in lines if not line[0].isalpha()]
+    return header, rows
+
+
+# Move the per-solve puzzle_<ts>.txt / solution_<ts>.txt pairs into the log.
+# Returns the paths that were imported so the caller can delete them.
+def import_legacy(output_dir, log):
+    imported = []
+    for name in sorted(os.listdir(output_dir)):
+        if not (name.startswith("puzzle_") and name.endswith(".txt")):
+            continue
+        stamp = name[len("puzzle_"):-len(".txt")]
+        puzzle_path = os.path.join(output_dir, name)
+        solution_path = os.path.join(output_dir, f"solution_{stamp}.txt")
+        if not os.path.exists(solution_path):
+            continue
+        _, puzzle = read_legacy_board(puzzle_path)
+        header, solution = read_legacy_board(solution_path)
+        method = header[0][len("Solution using "):].rstrip(":")
+        elapsed = float(header[1].split()[2])
+        log.queue.put({
+            "time": datetime.strptime(stamp, "%Y-%m-%d_%H-%M-%S").isoformat(timespec="milliseconds"),
+            "method": method,
+            "elapsed": elapsed,
+            "puzzle": format_line(puzzle),
+            "solution": format_line(solution),
+            "stats": None,
+        })
+        imported.extend([puzzle_path, solution_path])
+    return imported
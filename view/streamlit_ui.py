@@ -1,66 +1,159 @@
 import streamlit as st
 import os
+import io
+import time
+import random
 import pandas as pd
 import matplotlib.pyplot as plt
-from datetime import datetime
-from model.sudoku_generator import generate_puzzle
+from math import isqrt
+from model.board import symbol
+from model.sudoku_generator import generate_puzzle, default_holes, DIFFICULTIES
+from model.puzzle_bank import PuzzleBank, BankRefill
 from model.backtracking_solver import solve_with_heuristics
-
-
-# Path to the output directory
-output_dir = "output"
-if not os.path.exists(output_dir):
-    os.makedirs(output_dir)
-
-# Function to log output to file
-def log_output(puzzle, solution, method, elapsed_time):
-    # Get current timestamp for file naming
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    
-    # Prepare file paths
-    puzzle_file = os.path.join(output_dir, f"puzzle_{timestamp}.txt")
-    solution_file = os.path.join(output_dir, f"solution_{timestamp}.txt")
-    
-    # Write puzzle to file
-    with open(puzzle_file, "w") as f:
-        f.write("Sudoku Puzzle:\n")
-        for row in puzzle:
-            f.write(" ".join(str(val) if val != 0 else "." for val in row) + "\n")
-    
-    # Write solution to file
-    with open(solution_file, "w") as f:
-        f.write(f"Solution using {method}:\n")
-        f.write(f"Solved in {elapsed_time:.4f} seconds\n")
-        for row in solution:
-            f.write(" ".join(str(val) for val in row) + "\n")
-
-    st.success(f"Output saved! Puzzle and solution stored in {output_dir}/")
+from model.search_stats import SearchStats
+from model.search_budget import SearchBudget
+from model.solution_cache import SolutionCache
+from model.iterative_solver import IterativeSearch
+from model.strategies import get_strategy, strategy_names
+from utils.solve_log import SolveLog
+from controller.benchmark_jobs import BenchmarkRunner
+from controller.benchmark_suite import CORPORA, load_corpus
+
+# Puzzles in a "random" benchmark corpus
+BENCHMARK_RUNS = 10
+# Per-puzzle time limit (seconds) in benchmarks, so one adversarial puzzle cannot stall a run
+BENCHMARK_TIMEOUT = 10
+# Search nodes between frames of the search animation, and the pause per frame
+ANIMATION_STEPS = 25
+ANIMATION_DELAY = 0.05
+# Puzzles of each difficulty the opt-in background refill keeps in the 9x9
+# bank, and the worker processes generating them (never the server process)
+BANK_STOCK = 25
+BANK_REFILL_WORKERS = 1
+
+
+# One append-only solve log per Streamlit server, written by a background thread
+@st.cache_resource
+def get_solve_log():
+    return SolveLog()
+
+# Function to log output: queues the solve, the writer thread appends it to the log
+def log_output(puzzle, solution, method, elapsed_time, stats=None):
+    log = get_solve_log()
+    log.log(puzzle, solution, method, elapsed_time, stats)
+    st.success(f"Output saved! Solve logged to {os.path.relpath(log.path)}")
+
+# Solutions shared by every session, so a repeated (or relabeled) puzzle is
+# answered without searching again
+@st.cache_resource
+def get_solution_cache():
+    return SolutionCache()
+
+# Background benchmark runner shared by every session on this server
+@st.cache_resource
+def get_benchmark_runner():
+    return BenchmarkRunner(timeout=BENCHMARK_TIMEOUT)
+
+# Puzzles of a benchmark corpus: a versioned file from data/corpora, or
+# BENCHMARK_RUNS seeded random puzzles of the chosen box size
+@st.cache_data(show_spinner=False)
+def benchmark_corpus(corpus, box, seed):
+    if corpus in CORPORA:
+        return load_corpus(corpus)
+    rng = random.Random(seed)
+    return [generate_puzzle(default_holes(box), box=box, rng=rng) for _ in range(BENCHMARK_RUNS)]
+
+# Pregenerated puzzles of one box size, shared by every session; the button
+# draws from here so no puzzle is generated on the request path
+@st.cache_resource
+def get_puzzle_bank(box):
+    return PuzzleBank(box=box)
+
+# Running bank refill jobs by box size, shared by every session on this server
+@st.cache_resource
+def get_refill_jobs():
+    return {}
+
+# True while the 9x9 bank refill job runs
+def bank_refill_running():
+    job = get_refill_jobs().get(3)
+    return job is not None and job.running
+
+# Start or stop the job keeping the 9x9 bank stocked in every difficulty.
+# Off by default: bulk filling belongs to controller/sudoku_cli.py fill.
+def set_bank_refill(on):
+    jobs = get_refill_jobs()
+    job = jobs.get(3)
+    if on and (job is None or not job.running):
+        jobs[3] = BankRefill(get_puzzle_bank(3), stock=BANK_STOCK, workers=BANK_REFILL_WORKERS)
+    elif not on and job is not None:
+        job.stop()
+        del jobs[3]
+
+# Checkbox callback: runs only when this session flips the box, so other
+# sessions rerunning with their own (stale) checkbox leave the shared job alone
+def toggle_bank_refill():
+    set_bank_refill(st.session_state["bank_refill"])
+
+# Start (or find) the background job for one corpus and strategy
+def benchmark_job(corpus, box, seed, method):
+    puzzles = benchmark_corpus(corpus, box, seed)
+    return get_benchmark_runner().submit((corpus, box, seed, method), method, puzzles)
+
+# Final numbers for one corpus and strategy, kept once its job has finished
+@st.cache_data(show_spinner=False)
+def benchmark_summary(corpus, box, seed, method):
+    job = benchmark_job(corpus, box, seed, method)
+    job.done.wait()
+    if job.error is not None:
+        raise job.error
+    return job.summary()
+
+# Board as nested tuples, so it can key the figure cache
+def board_key(board):
+    return tuple(tuple(row) for row in board)
+
+# PNG of a board, cached so a rerun does not redraw the same figure
+@st.cache_data(show_spinner=False)
+def board_image(cells, title, size, lw_box):
+    return render_board(cells, title, size, lw_box)
+
+# Draw a board to PNG bytes (uncached: search animation frames are never reused)
+def render_board(cells, title, size, lw_box):
+    fig, ax = plt.subplots(figsize=(size, size))
+    draw_grid(ax, cells, lw_box)
+    ax.set_title(title, fontsize=5)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight", dpi=150)
+    plt.close(fig)
+    return buffer.getvalue()
 
 # Function to display the Sudoku puzzle in a grid format
-
-        
 def display_puzzle(puzzle, title="Sudoku"):
     st.write("### 🧩 Generated Sudoku Puzzle")
-    fig, ax = plt.subplots(figsize=(5, 5))
-    ax.set_xlim(0, 9)
-    ax.set_ylim(0, 9)
+    st.image(board_image(board_key(puzzle), title, 5, 2), width=500)
+
+# Draw an n² x n² board: thick lines around boxes, symbols for values above 9
+def draw_grid(ax, board, lw_box):
+    n = len(board)
+    box = isqrt(n)
+    ax.set_xlim(0, n)
+    ax.set_ylim(0, n)
     ax.axis('off')
 
     # Draw grid lines
-    for i in range(10):
-        lw = 2 if i % 3 == 0 else 0.5
-        ax.plot([i, i], [0, 9], color="grey", linewidth=lw)
-        ax.plot([0, 9], [i, i], color="grey", linewidth=lw)
-
-    # Fill numbers
-    for i in range(9):
-        for j in range(9):
-            if puzzle[i][j] != 0:
-                ax.text(j + 0.5, 8.5 - i, str(puzzle[i][j]),
-                        va='center', ha='center', fontsize=8, color="#2c3e50")
-
-    ax.set_title(title, fontsize=5)
-    st.pyplot(fig)
+    for i in range(n + 1):
+        lw = lw_box if i % box == 0 else 0.5
+        ax.plot([i, i], [0, n], color="grey", linewidth=lw)
+        ax.plot([0, n], [i, i], color="grey", linewidth=lw)
+
+    # Fill numbers, shrinking the font on larger boards
+    fontsize = 8 if n <= 9 else 72 / n
+    for i in range(n):
+        for j in range(n):
+            if board[i][j] != 0:
+                ax.text(j + 0.5, n - 0.5 - i, symbol(board[i][j]),
+                        va='center', ha='center', fontsize=fontsize, color="#2c3e50")
 
 # Function to display the solved Sudoku in grid format
 """
@@ -77,27 +170,7 @@ def display_solution(solution):
 """
 def display_solution(puzzle,title="Solved Puzzle"):
     st.write("### ✅ Solved Puzzle")
-    fig, ax = plt.subplots(figsize=(3.5, 3.5))  # Smaller figure size
-    ax.set_xlim(0, 9)
-    ax.set_ylim(0, 9)
-    ax.axis('off')
-
-    # Draw the grid lines
-    for i in range(10):
-        lw = 1.5 if i % 3 == 0 else 0.5
-        ax.plot([i, i], [0, 9], color="grey", linewidth=lw)
-        ax.plot([0, 9], [i, i], color="grey", linewidth=lw)
-
-    # Fill in the numbers
-    for i in range(9):
-        for j in range(9):
-            if puzzle[i][j] != 0:
-                ax.text(j + 0.5, 8.5 - i, str(puzzle[i][j]),
-                        va='center', ha='center',
-                        fontsize=8, color="#2c3e50")
-
-    ax.set_title(title, fontsize=5)
-    st.pyplot(fig)
+    st.image(board_image(board_key(puzzle), title, 3.5, 1.5), width=350)  # Smaller figure size
 
 
 # Function to plot comparison graph of solving times
@@ -121,76 +194,159 @@ def main():
     st.write("✔️ Streamlit is working.")  # ✅ Debug line
 
     st.sidebar.header("Select Heuristic / Algorithm")
-    method = st.sidebar.selectbox("Choose technique", [
-        "Backtracking",
-        "Backtracking + Forward Checking",
-        "Backtracking + Arc Consistency",
-        "Backtracking + MRV",
-        "Backtracking + MRV + LCV + Degree"
-    ])
+    method = st.sidebar.selectbox("Choose technique", strategy_names())
+    board_size = st.sidebar.selectbox("Board size", ["9x9", "16x16", "25x25"])
+    box = {"9x9": 3, "16x16": 4, "25x25": 5}[board_size]
+    holes = default_holes(box)
+    time_limit = st.sidebar.number_input("Time limit (s)", min_value=1, value=10, step=1)
+    animate = st.sidebar.checkbox("Animate search", help="Watch the backtracking strategies fill the board")
+    use_cache = st.sidebar.checkbox("Use solution cache", value=True,
+                                    help="Answer repeated puzzles from the cache; turn off to time the solver")
+    difficulty = None
+    if box == 3:
+        # Shows the server-wide job state when this session first renders it
+        st.sidebar.checkbox("Refill puzzle bank", value=bank_refill_running(), key="bank_refill",
+                            on_change=toggle_bank_refill,
+                            help=f"Keep {BANK_STOCK} puzzles of every difficulty in the bank, "
+                                 "generated in the background (shared by every session)")
+        difficulty = st.sidebar.selectbox("Difficulty", ["any"] + DIFFICULTIES)
+        difficulty = None if difficulty == "any" else difficulty
+    st.sidebar.caption(f"🏦 {get_puzzle_bank(box).count()} puzzles in the bank")
+
+    st.sidebar.header("Benchmark")
+    corpus = st.sidebar.selectbox("Corpus", ["random"] + sorted(CORPORA))
+    seed = st.sidebar.number_input("Seed", min_value=0, value=0, step=1)
+    # Benchmarks use their own box and seed; the versioned corpora are fixed 9x9 files
+    bench_box, bench_seed = (box, int(seed)) if corpus == "random" else (3, 0)
 
     if st.button("🎲 Generate Puzzle and Solve"):
-        puzzle = generate_puzzle()
+        try:
+            puzzle = generate_puzzle(holes, box=box, bank=get_puzzle_bank(box), difficulty=difficulty)
+        except ValueError as e:
+            st.error(f"❌ {e}")
+            st.stop()
+        st.session_state.pop("solve", None)
+        st.session_state.pop("search", None)
+        if animate and get_strategy(method).backtracking:
+            # Solved a few nodes per frame by show_search; the search lives in the session
+            st.session_state["search"] = (board_key(puzzle), method, IterativeSearch(puzzle, method, SearchStats()))
+            st.session_state["paused"] = False
+        else:
+            stats = SearchStats()
+            budget = SearchBudget(timeout=time_limit)
+            solve = get_solution_cache().solve if use_cache else solve_with_heuristics
+            elapsed, solution = solve(puzzle, method=method, stats=stats, budget=budget)
+            # Log the puzzle, solution and search stats
+            log_output(puzzle, solution, method, elapsed, stats)
+            st.session_state["solve"] = (board_key(puzzle), board_key(solution) if solution else None,
+                                         budget.exceeded, stats.nodes, stats.winner)
+
+    if "search" in st.session_state:
+        show_search()
+
+    # Kept in the session so progress reruns do not throw the boards away
+    if "solve" in st.session_state:
+        puzzle, solution, exceeded, nodes, winner = st.session_state["solve"]
         display_puzzle(puzzle)
-        elapsed, solution = solve_with_heuristics(puzzle, method=method)
-        display_solution(solution)
-        # Log the puzzle and solution to a file
-        log_output(puzzle, solution, method, elapsed)
-
-    if st.button("📊 Run Benchmark (10 Runs)"):
-        st.write("Running average time test...")
-        times = []
-        for _ in range(10):
-            puzzle = generate_puzzle()
-            elapsed, _ = solve_with_heuristics(puzzle, method)
-            times.append(elapsed)
-        avg_time = sum(times) / len(times)
-        st.success(f"Average time over 10 runs: **{avg_time:.4f} sec**")
-        
+        if winner:
+            st.info(f"🏁 Portfolio race won by {winner}")
+        if solution:
+            display_solution(solution)
+        elif exceeded:
+            st.warning(f"⏱️ Budget exceeded ({exceeded}) after {nodes} nodes.")
+        else:
+            st.error("❌ No solution found.")
+
+    if st.button("📊 Run Benchmark"):
+        st.session_state["benchmark"] = (corpus, bench_box, bench_seed, [method])
+
     if st.button("📈 Show Performance Matrix"):
         show_performance_matrix()
 
         # Adding a button to plot the comparison graph of different heuristics
+    # (strategies with their own process pool are left out: solve_many already
+    # gives every puzzle a core, so nested pools would only fight over them)
     if st.button("📊 Plot Heuristic Comparison"):
-        heuristic_stats = {}
-        st.write("Running benchmarks for all heuristics...")
-        
-        for heuristic in [
-            "Backtracking",
-            "Backtracking + Forward Checking",
-            "Backtracking + Arc Consistency",
-            "Backtracking + MRV",
-            "Backtracking + MRV + LCV + Degree"
-        ]:
-            times = []
-            for _ in range(10):  # Benchmarking each heuristic 10 times
-                puzzle = generate_puzzle()
-                elapsed, _ = solve_with_heuristics(puzzle, method=heuristic)
-                times.append(elapsed)
-
-            avg_time = sum(times) / len(times)
-            min_time = min(times)
-            max_time = max(times)
-            heuristic_stats[heuristic] = {
-                "Average Time": round(avg_time, 4),
-                "Min Time": round(min_time, 4),
-                "Max Time": round(max_time, 4)
-            }
-
+        st.session_state["benchmark"] = (corpus, bench_box, bench_seed, strategy_names(pooled=False))
+
+    if "benchmark" in st.session_state:
+        show_benchmark(*st.session_state["benchmark"])
+
+
+# Search animation: the iterative engine advances ANIMATION_STEPS nodes per
+# frame. Pause reruns the page, which stops the loop between two advances; the
+# search is left in the session and Resume carries on from where it stopped.
+def show_search():
+    puzzle, method, search = st.session_state["search"]
+    display_puzzle(puzzle)
+    paused = st.session_state["paused"]
+    if st.button("▶️ Resume" if paused else "⏸️ Pause"):
+        st.session_state["paused"] = not paused
+        st.rerun()
+
+    frame = st.empty()
+    if paused:
+        title = f"Paused after {search.steps} nodes, depth {search.depth}"
+        frame.image(render_board(board_key(search.grid), title, 3.5, 1.5), width=350)
+        return
+    for step in search.run(ANIMATION_STEPS):
+        title = f"{method}: {step.steps} nodes, depth {step.depth}"
+        frame.image(render_board(board_key(step.grid), title, 3.5, 1.5), width=350)
+        time.sleep(ANIMATION_DELAY)
+
+    # Finished: log it and show it like any other solve
+    stats = search.stats
+    log_output(puzzle, search.solution, method, stats.preprocess_time + stats.search_time, stats)
+    st.session_state["solve"] = (puzzle, board_key(search.solution) if search.solution else None,
+                                 None, stats.nodes, None)
+    del st.session_state["search"]
+    st.rerun()
+
+
+# Progress and (partial) results of the requested benchmark. Jobs run on the
+# background runner; while any is unfinished the page reruns itself to refresh.
+def show_benchmark(corpus, box, seed, methods):
+    label = corpus if corpus != "random" else f"random {box * box}x{box * box}, seed {seed}"
+    st.write(f"### ⏱️ Benchmark on {label}")
+    heuristic_stats = {}
+    running = False
+    for heuristic in methods:
+        job = benchmark_job(corpus, box, seed, heuristic)
+        if job.done.is_set():
+            if job.error is not None:
+                st.error(f"❌ {heuristic}: {job.error}")
+                continue
+            heuristic_stats[heuristic] = benchmark_summary(corpus, box, seed, heuristic)
+        else:
+            running = True
+            st.progress(job.progress(), text=f"{heuristic}: {len(job.results)}/{job.total} puzzles")
+            partial = job.summary()
+            if partial:
+                heuristic_stats[heuristic] = partial
+
+    if len(methods) == 1 and heuristic_stats and not running:
+        row = heuristic_stats[methods[0]]
+        st.success(f"Average time over {row['Runs']} runs: **{row['Average Time']:.4f} sec**")
+    elif heuristic_stats:
         # Plot bar graph
         st.write("### 📊 Heuristic graph")
         plot_comparison_graph({k: v["Average Time"] for k, v in heuristic_stats.items()})
-        
+
         # Display performance matrix as a table
         st.write("### 📋 Performance Matrix (in seconds)")
         st.table({
             "Heuristic": list(heuristic_stats.keys()),
+            "Runs": [v["Runs"] for v in heuristic_stats.values()],
             "Avg Time": [v["Average Time"] for v in heuristic_stats.values()],
             "Min Time": [v["Min Time"] for v in heuristic_stats.values()],
             "Max Time": [v["Max Time"] for v in heuristic_stats.values()],
+            "Avg Nodes": [v["Average Nodes"] for v in heuristic_stats.values()],
+            "Timeouts": [v["Timeouts"] for v in heuristic_stats.values()],
         })
 
-    
+    if running:
+        time.sleep(0.5)
+        st.rerun()
 
 
 def show_performance_matrix():
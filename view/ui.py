@@ -1,16 +1,21 @@
+from math import isqrt
+from model.board import symbol
+
 def display_board(board):
     for row in board:
-        print(" ".join(str(num) if num != 0 else "." for num in row))
-        
+        print(" ".join(symbol(num) if num != 0 else "." for num in row))
+
 def print_board(board):
-    for i in range(9):
+    size = len(board)
+    box = isqrt(size)
+    for i in range(size):
         row = ""
-        for j in range(9):
+        for j in range(size):
             cell = board[i][j]
-            row += str(cell) if cell != 0 else "."
+            row += symbol(cell) if cell != 0 else "."
             row += " "
-            if j % 3 == 2 and j != 8:
+            if j % box == box - 1 and j != size - 1:
                 row += "| "
         print(row)
-        if i % 3 == 2 and i != 8:
-            print("-" * 21)
+        if i % box == box - 1 and i != size - 1:
+            print("-" * (2 * size + 2 * (box - 1) - 1))